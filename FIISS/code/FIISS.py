@@ -16,6 +16,10 @@ import itertools
 from itertools import product
 from tabulate import tabulate
 
+import sys
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'path_engine', 'code'))
+from path_engine import ReachabilityIndex, PathCounter, PathQueryCache, CSRGraphView, create_interaction_graph_from_nx, create_csr_graph_from_nx, all_simple_edge_paths, get_graph_fingerprint, get_ids_fingerprint, write_result_bundle, write_interaction_stream, EnumerationBudget, iter_parallel_results, get_fork_csr_graph
+
 ######################################Configurable inputs#####################################
 #Path to input files
 dirname = os.path.dirname(__file__)
@@ -43,27 +47,38 @@ output_nx_name = "nx_graph" + timestr + ".png"
 output_file_nxdraw = os.path.join(dirname, '..', 'build', output_nx_name)
 interaction_sequences = os.path.join(dirname, '..', 'build', interaction_sequences_txt)
 
-#Parsing input xml using etree parser of lxml
-tree_inputfile1 = etree.parse(file_path_inputfile1) #Parse input file 1
-root_inputfile1 = tree_inputfile1.getroot() #Get the root element of the xmi
+#Configure a multi-depth sweep: the paths are enumerated once without cutoff and the interacting features are reported for each interaction path length of the list
+sweep_depth_list = [] #Specify the interaction path lengths of the sweep e.g. [1, None] (None stands for no cutoff); if the list is empty, only the analysis without cutoff is performed
+sweep_bundle_file = os.path.join(dirname, '..', 'build', "FIISS_sweep_" + timestr + ".json") #result bundle of the sweep, can be loaded by the methods comparison
+
+#Configure the path search
+path_backend = "networkx" #backend of the path enumeration: "networkx" (reference backend) or "csr" (numpy CSR arrays of the global message graph with an edge mask per feature, same paths in the same order)
 
-tree_inputfile2 = etree.parse(file_path_inputfile2) #Parse input file 2
-root_inputfile2 = tree_inputfile2.getroot() #Get the root element of the xmi
+#Configure the path cache
+path_cache_size = 4096 #maximum number of path query results kept in the LRU path cache (shared by the security and safety features), None for no bound and 0 to disable the cache
+path_cache_max_paths = 100000 #maximum total number of message paths kept in the path cache (the results of queries without cutoff can hold many paths); a query with more paths is not cached, None for no bound
+path_cache_file = None #Specify a file to persist the path cache across runs e.g. os.path.join(dirname, '..', 'build', 'FIISS_path_cache.pkl'); None keeps the cache in memory only
 
-tree_inputfile3 = etree.parse(file_path_inputfile3)
-root_inputfile3 = tree_inputfile3.getroot()
+#Configure the count-only mode
+count_only_mode = False #if True, only the numbers of (primary) paths between the relevant lifelines of each feature are computed, without enumerating the paths or extracting interacting features
 
-tree_inputfile4 = etree.parse(file_path_inputfile4)
-root_inputfile4 = tree_inputfile4.getroot()
+#Configure the enumeration budgets
+enumeration_budget_dict = {"max_paths": None, "max_expanded_nodes": None, "max_seconds": None, "run_max_paths": None, "run_max_expanded_nodes": None, "run_max_seconds": None} #budgets of the path enumeration per query and per run (None means no limit): maximum number of paths, of expanded nodes and of wall-clock seconds; the run budgets are only allowed if parallel_workers is None or 1
 
-tree_inputfile5 = etree.parse(file_path_inputfile5)
-root_inputfile5 = tree_inputfile5.getroot()
+#Configure the parallel execution
+parallel_workers = None #number of worker processes of the per-feature analysis e.g. os.cpu_count(); None or 1 analyses the features one after the other
 
-tree_inputfile6 = etree.parse(file_path_inputfile6)
-root_inputfile6 = tree_inputfile6.getroot()
+#Configure the streaming mode
+interaction_stream_file = None #Specify a file e.g. os.path.join(dirname, '..', 'build', 'FIISS_stream.jsonl') to stream the classified interaction paths of each feature as JSON lines instead of the summary; None performs the summarized analysis
 
-tree_inputfile7 = etree.parse(file_path_inputfile7)
-root_inputfile7 = tree_inputfile7.getroot()
+#Parsed input xml files, see load_input_files
+root_inputfile1 = None
+root_inputfile2 = None
+root_inputfile3 = None
+root_inputfile4 = None
+root_inputfile5 = None
+root_inputfile6 = None
+root_inputfile7 = None
 
 #Define namespace
 ns = {
@@ -74,6 +89,11 @@ ns = {
     }
 ##############################################################################################
 
+def load_input_files(file_path_list):
+    "Parse the input xml files with lxml and keep their root elements for Parent.get_iterator"
+    global root_inputfile1, root_inputfile2, root_inputfile3, root_inputfile4, root_inputfile5, root_inputfile6, root_inputfile7
+    root_inputfile1, root_inputfile2, root_inputfile3, root_inputfile4, root_inputfile5, root_inputfile6, root_inputfile7 = [etree.parse(file_path).getroot() for file_path in file_path_list] #Get the root element of each xmi
+
 class Parent:
     def __init__(self):
         pass
@@ -553,6 +573,9 @@ class SaSeCommonSWCAnalysis(QueryDataStruct):
         return featurename_CSWCactivitynameslist_dict, featurename_CSWCactivitynameslist_str
 
 class FeatureSDMultiDiGraph():
+    text_output_list = None #set to a list in the worker processes of the parallel analysis: the text file output is buffered as (output_file_path, text) and written by the parent process in feature order
+    draw_graphs = True #set to False in the worker processes of the parallel analysis: they would race on the drawing file, the parent process draws the graphs in feature order
+    
     def __init__(self, graph, graph_title, node_set, edge_list, node_label_dict, edge_label_dict):
         self.graph = graph
         self.graph_title = graph_title
@@ -560,18 +583,30 @@ class FeatureSDMultiDiGraph():
         self.edge_list = edge_list
         self.node_label_dict = node_label_dict
         self.edge_label_dict = edge_label_dict
+        self.reachability = None #reachability index of the graph, computed once on first use
+        self.path_counter = None #path counter of the graph (count-only mode), created on first use
+        self.csr_graph = None #edge-masked view of the CSR form of the global message graph, only created for the csr path backend
+        self.path_cache = None #optional PathQueryCache shared by the graphs of all features
+        self.fingerprint = None #content fingerprint of the graph (key of the path cache), computed once on first use
+        self.budget = None #optional EnumerationBudget shared by the graphs of all features
     
     def store_text_output(self,output_file_path, text):
         "Dump print output in a text file in append mode"
+        if self.text_output_list is not None:
+            self.text_output_list.append((output_file_path, text))
+            return
         with open(output_file_path, "a") as external_file: #write/append to file
             received_text = text
             print(received_text, file=external_file)
             external_file.close()    
     
-    def create_nx_graph(self):
-        "Create networkx graph using nodes and edges and their labels"
-        self.graph.add_nodes_from(self.node_set)
-        self.graph.add_edges_from(self.edge_list)        
+    def create_feature_view(self, featureID):
+        "Replace the global message graph (self.graph) by a view of the nodes and messages of the feature"
+        global_graph = self.graph
+        self.graph = nx.subgraph_view(global_graph, filter_node = nx.filters.show_nodes(self.node_set), filter_edge = lambda src, dst, msgID: featureID in global_graph[src][dst][msgID]["features"])
+    
+    def draw_nx_graph(self):
+        "Draw the networkx graph using its node labels"
         pos = nx.circular_layout(self.graph)
         plt.figure(figsize=(50,50))
         nx.draw(self.graph, pos, labels = self.node_label_dict, with_labels = True)
@@ -579,6 +614,10 @@ class FeatureSDMultiDiGraph():
         plt.savefig(output_file_nxdraw)
         #plt.show()
     
+    def create_csr_view(self, global_csr_graph):
+        "Mask the CSR form of the global message graph with the edges of the feature"
+        self.csr_graph = CSRGraphView(global_csr_graph, global_csr_graph.get_edge_mask(self.edge_list))
+    
     def collect_Inodes_for_a_path(self, path):
         "for a given path that contains sub-paths, collect all intermediate nodes/lifelines/components"
         Inodes_set = set()
@@ -602,15 +641,55 @@ class FeatureSDMultiDiGraph():
     def check_Inodes_relevance(self, Inodes_list, firstandlastnode_list, relevant_lifelines_list):
         "check if any node in the list of intermediate nodes given as inputs (for a path) is either safety or security relevant; if relevant, set flag to 0 i.e. it can be a secondary interaction path"
         Inode_rel_flag = 1 #consider as a primary interaction path unless this flag is set to 0
-        relvComponentID_list = list(set(firstandlastnode_list).symmetric_difference(relevant_lifelines_list))
         for element in Inodes_list:
-            if element in relvComponentID_list:
+            if (element in relevant_lifelines_list) != (element in firstandlastnode_list): #element in the symmetric difference of the query nodes and the relevant lifelines
                 Inode_rel_flag = 0 #a potential secondary interaction path because there exists atleast one intermediate node that is safety or security relevant
                 break
         return Inode_rel_flag
     
+    def is_primary_path(self, path, current_queryID_list, relevant_lifelines_list):
+        "A path is a primary interaction path if none of its intermediate nodes is safety or security relevant"
+        Inodes_list = self.collect_Inodes_for_a_path(path)
+        if len(Inodes_list) != 0: #check safety and security relevance of Inodes of the current path whose path length > 1
+            return self.check_Inodes_relevance(Inodes_list, current_queryID_list, relevant_lifelines_list) == 1
+        return True
+    
+    def get_reachability(self):
+        "Get the reachability index of the graph, computed once per graph"
+        if self.reachability is None:
+            self.reachability = ReachabilityIndex(create_interaction_graph_from_nx(self.graph))
+        return self.reachability
+    
+    def get_fingerprint(self):
+        "Get the content fingerprint of the graph, the key of its cached query results"
+        if self.fingerprint is None:
+            self.fingerprint = get_graph_fingerprint(self.graph)
+        return self.fingerprint
+    
+    def get_path_counter(self):
+        "Get the path counter of the graph for the count-only mode; it shares the reachability index of the graph"
+        if self.path_counter is None:
+            self.path_counter = PathCounter(self.get_reachability().IG, self.get_reachability())
+        return self.path_counter
+    
+    def rI_pI_count_simple_paths(self, src, dst, depth, strng, out_txt_file, relevant_lifelines_list):
+        "Count-only variant of rI_pI_nx_simple_paths: the number of all paths and of primary paths from src to dst"
+        var_bool = self.get_reachability().can_reach(src, dst, depth)
+        var_str = strng + str(var_bool)
+        self.store_text_output(out_txt_file, var_str)
+        if var_bool is False:
+            return var_bool, 0, 0
+        relvInodes_set = set(relevant_lifelines_list) - {src, dst} #same intermediate nodes as in check_Inodes_relevance
+        if self.path_cache is not None:
+            counter = self.path_cache.get_or_compute(self.get_fingerprint(), src, dst, depth, "count", lambda: self.get_path_counter().count_paths(src, dst, depth))
+            pri_counter = self.path_cache.get_or_compute(self.get_fingerprint(), src, dst, depth, "primary_count/" + get_ids_fingerprint(relevant_lifelines_list), lambda: self.get_path_counter().count_paths(src, dst, depth, avoid_set = relvInodes_set))
+        else:
+            counter = self.get_path_counter().count_paths(src, dst, depth)
+            pri_counter = self.get_path_counter().count_paths(src, dst, depth, avoid_set = relvInodes_set)
+        return var_bool, counter, pri_counter
+    
     def rI_pI_nx_simple_paths(self, src, dst, depth, strng, out_txt_file, msgseqID_name_dict, relevant_lifelines_list):
-        var_bool = nx.has_path(self.graph, src, dst)
+        var_bool = self.get_reachability().can_reach(src, dst, depth)
         var_str = strng + str(var_bool)
         self.store_text_output(out_txt_file, var_str)
         pathAB_list_of_lists = []
@@ -620,20 +699,31 @@ class FeatureSDMultiDiGraph():
         pathAB_names_list = []
         current_queryID_list = [src, dst]
         counter = 0
+        if self.budget is not None:
+            self.budget.start_query([self.graph_title, self.node_label_dict[src], self.node_label_dict[dst]])
         
-        for path in nx.all_simple_edge_paths(self.graph, source = src, target = dst, cutoff=depth):
+        if var_bool is False: #no path within the cutoff, skip the enumeration
+            if self.budget is not None:
+                self.budget.end_query()
+            return var_bool, pathAB_IDs_list, all_path_with_names_list, counter, pri_pathAB_IDs_list
+        
+        if self.csr_graph is not None:
+            search_graph = self.csr_graph
+        else:
+            search_graph = self.graph
+        if self.path_cache is not None:
+            path_list = self.path_cache.get_or_compute(self.get_fingerprint(), src, dst, depth, "edge_paths", lambda: list(all_simple_edge_paths(search_graph, src, dst, depth, self.budget)))
+            if self.budget is not None and self.budget.truncated_reason is not None: #only complete results are cached
+                self.path_cache.discard(self.get_fingerprint(), src, dst, depth, "edge_paths")
+        else:
+            path_list = all_simple_edge_paths(search_graph, src, dst, depth, self.budget)
+        for path in path_list:
             counter = counter + 1
             path_with_names_list = []
             
-            Inodes_list = self.collect_Inodes_for_a_path(path)
-            if len(Inodes_list) != 0: #check safety and security relevance of Inodes of the current path whose path length > 1
-                Inode_rel_flag = self.check_Inodes_relevance(Inodes_list, current_queryID_list, relevant_lifelines_list) #flag set to 0 if at least 1 safety or security relevant Inode found; flag is set to 1 if it is a primary interaction path
-            else: #path with no intermediate nodes is automatically included as primary path
-                Inode_rel_flag = 1 #path considered as primary interaction path
-            
-            if Inode_rel_flag == 1:
+            if self.is_primary_path(path, current_queryID_list, relevant_lifelines_list):
                 pri_pathAB_IDs_list.append(path)
-            elif Inode_rel_flag == 0:
+            else:
                 pathAB_IDs_list.append(path)
             
             for subpath in path:
@@ -645,7 +735,26 @@ class FeatureSDMultiDiGraph():
                 subpath_with_names = (src_name,dst_name,key_name)
                 path_with_names_list.append(subpath_with_names)
             all_path_with_names_list.append(path_with_names_list)
+        if self.budget is not None and self.budget.end_query() is not None:
+            print("Warning! Path enumeration from: ", self.node_label_dict[src], " to: ", self.node_label_dict[dst], " truncated after ", counter, " paths (budget: ", self.budget.truncated_reason, ")")
         return var_bool, pathAB_IDs_list, all_path_with_names_list, counter, pri_pathAB_IDs_list
+    
+    def iter_classified_simple_paths(self, src, dst, depth, relevant_lifelines_list):
+        "Streaming variant of rI_pI_nx_simple_paths: yield each simple path from src to dst with a flag that is True for a primary path"
+        if self.budget is not None:
+            self.budget.start_query([self.graph_title, self.node_label_dict[src], self.node_label_dict[dst]])
+        if not self.get_reachability().can_reach(src, dst, depth):
+            if self.budget is not None:
+                self.budget.end_query()
+            return
+        if self.csr_graph is not None:
+            search_graph = self.csr_graph
+        else:
+            search_graph = self.graph
+        for path in all_simple_edge_paths(search_graph, src, dst, depth, self.budget):
+            yield path, self.is_primary_path(path, [src, dst], relevant_lifelines_list)
+        if self.budget is not None:
+            self.budget.end_query()
 
 class SDanalysisOfSeandSaFeatures(Parent):
     "sequence diagram (SD) analysis per feature"
@@ -839,7 +948,7 @@ class SDanalysisOfSeandSaFeatures(Parent):
         IDcombinations_dir_2_to_1_list = list(itertools.product(ele_list2, ele_list1))
         return  IDcombinations_dir_1_to_2_list, IDcombinations_dir_2_to_1_list
 
-    def nx_simple_paths_in_multidigraph(self, FeSDMDG_obj, node_product_list, str_to_print, updated_objectlifelineID_name_dict, msgseqID_name_dict):
+    def nx_simple_paths_in_multidigraph(self, FeSDMDG_obj, node_product_list, str_to_print, updated_objectlifelineID_name_dict, msgseqID_name_dict, count_only = False, depth = None):
         "get simple interaction paths from the multi directed graph using the node (lifeline's classifier) product list"
         all_pri_pathAB_IDs_list = []
         all_pathAB_IDs_list = []
@@ -849,15 +958,26 @@ class SDanalysisOfSeandSaFeatures(Parent):
         relevant_lifelines_list.extend(self.seSWCid_list)
         relevant_lifelines_list.extend(self.saSWCid_list)
         relevant_lifelines_list.extend(self.saseCSWC_list)
+        pruned_query_count = 0 #queries skipped by the reachability prefilter
         for index, value in enumerate(node_product_list):
             src = value[0]
             dst = value[1]
-            var_bool, pathAB_IDs_list, pathAB_names_list, counter_per_node, pri_pathAB_IDs_list = FeSDMDG_obj.rI_pI_nx_simple_paths(src, dst, None, str_to_print, interaction_sequences, msgseqID_name_dict, relevant_lifelines_list)
+            if count_only:
+                var_bool, counter_per_node, pri_counter_per_node = FeSDMDG_obj.rI_pI_count_simple_paths(src, dst, depth, str_to_print, interaction_sequences, relevant_lifelines_list)
+                if var_bool is False:
+                    pruned_query_count = pruned_query_count + 1
+                print("\nCounting simple paths from: ", updated_objectlifelineID_name_dict[src] , " to: ", updated_objectlifelineID_name_dict[dst], " paths: ", counter_per_node, " primary paths: ", pri_counter_per_node)
+                counter_all_nodes = counter_all_nodes + counter_per_node
+                continue
+            var_bool, pathAB_IDs_list, pathAB_names_list, counter_per_node, pri_pathAB_IDs_list = FeSDMDG_obj.rI_pI_nx_simple_paths(src, dst, depth, str_to_print, interaction_sequences, msgseqID_name_dict, relevant_lifelines_list)
+            if var_bool is False:
+                pruned_query_count = pruned_query_count + 1
             print("\nFinding simple paths from: ", updated_objectlifelineID_name_dict[src] , " to: ", updated_objectlifelineID_name_dict[dst], pathAB_names_list)
             counter_all_nodes = counter_all_nodes + counter_per_node
             all_pri_pathAB_IDs_list.extend(pri_pathAB_IDs_list)
             all_pathAB_IDs_list.extend(pathAB_IDs_list)
             all_pathAB_names_list.extend(pathAB_names_list)
+        print("Debug! Reachability prefilter pruned ", pruned_query_count, " out of ", len(node_product_list), " queries of graph: ", FeSDMDG_obj.graph_title)
         return all_pathAB_IDs_list, all_pathAB_names_list, counter_all_nodes, all_pri_pathAB_IDs_list
     
     def nx_edgepath_tabular_rep(self, feature_type_flag, featureID, feature_name, all_pathIDs_list, se_nodeID_list, sa_nodeID_list, sase_nodeID_list, nodeID_name_labeldict, msgseqID_name_dict):
@@ -1271,23 +1391,84 @@ class SDanalysisOfSeandSaFeatures(Parent):
             print(tabulate(pathtable, tablefmt = 'grid', maxcolwidths=[12,12,5,5,33,33]), "\n") #print path table
         return src_dst_interacFIs_list
     
-    def sd_analysis_per_feature(self, feature_type_flag, element, featureID_name_dict, all_objectlifelineID_componentID_dict, all_componentlifelineID_list, all_objectlifelineID_name_dict, feature_componentID_dict, iterator_type):
+    def get_interacting_features_per_depth(self, depth_list, pri_interacting_features_dict, interacting_features_dict, feature_type_flag, featureID, feature_name, pri_pathIDs_list, pathIDs_list, se_nodeID_list, sa_nodeID_list, sase_nodeID_list, nodeID_name_labeldict, msgseqID_name_dict):
+        "Restrict the primary and secondary paths to each interaction path length of depth_list and collect the interacting features"
+        for depth in depth_list:
+            depth_pri_pathIDs_list = [path for path in pri_pathIDs_list if depth is None or len(path) <= depth]
+            depth_pathIDs_list = [path for path in pathIDs_list if depth is None or len(path) <= depth]
+            ###only for primary paths
+            pri_src_dst_interacFIs_list = self.nx_edgepath_tabular_rep(feature_type_flag, featureID, feature_name, depth_pri_pathIDs_list, se_nodeID_list, sa_nodeID_list, sase_nodeID_list, nodeID_name_labeldict, msgseqID_name_dict)
+            pri_interacting_features_dict[depth].extend(pri_src_dst_interacFIs_list)
+            ###only for secondary paths
+            src_dst_interacFIs_list = self.nx_edgepath_tabular_rep(feature_type_flag, featureID, feature_name, depth_pathIDs_list, se_nodeID_list, sa_nodeID_list, sase_nodeID_list, nodeID_name_labeldict, msgseqID_name_dict)
+            interacting_features_dict[depth].extend(src_dst_interacFIs_list)
+    
+    def get_msgseq_per_featureset(self, featureID_list, featureID_name_dict, all_objectlifelineID_componentID_dict, all_componentlifelineID_set, all_objectlifelineID_name_dict, iterator_type):
+        "For each feature of the list, get its message sequences as the output of get_msgseq_per_feature"
+        featureID_msgseq_dict = {}
+        for element in featureID_list:
+            msgID_list, msgID_name_dict = self.get_msgIDs_per_feature(element, featureID_name_dict, iterator_type) #get message sequences for each feature
+            #print("\nDebug! Feature: ", featureID_name_dict[element], " len(msgID_list) ", len(msgID_list), " messages: ", msgID_name_dict)
+            featureID_msgseq_dict[element] = self.get_msgseq_per_feature(msgID_list, msgID_name_dict, all_objectlifelineID_componentID_dict, list(all_componentlifelineID_set), all_objectlifelineID_name_dict, iterator_type) #get edge_list from message_seq for each feature
+        return featureID_msgseq_dict
+    
+    def create_global_graph(self, featureID_msgseq_dict_list):
+        "Create a single MultiDiGraph of the messages of all features, with the features owning each message in 'features'"
+        global_graph = nx.MultiDiGraph()
+        for featureID_msgseq_dict in featureID_msgseq_dict_list:
+            for featureID, msgseq_tuple in featureID_msgseq_dict.items():
+                edge_list = msgseq_tuple[0]
+                node_set = msgseq_tuple[2]
+                global_graph.add_nodes_from(node_set)
+                for src, dst, msgID in edge_list:
+                    if global_graph.has_edge(src, dst, msgID):
+                        global_graph[src][dst][msgID]["features"].add(featureID)
+                    else:
+                        global_graph.add_edge(src, dst, msgID, features = {featureID})
+        return global_graph
+    
+    def create_feature_graph(self, element, featureID_name_dict, msgseq_tuple, global_graph, global_csr_graph = None):
+        "Create the graph of a feature as a view of the global message graph (and of its CSR form for the csr backend)"
+        edge_list, edgelabel_dict, node_set, nodeID_name_labeldict = msgseq_tuple[:4]
+        print("\nCreating MultiDiGraph view for the feature: ", featureID_name_dict[element])
+        FeSDMDG = FeatureSDMultiDiGraph(global_graph, featureID_name_dict[element], node_set, edge_list, nodeID_name_labeldict, edgelabel_dict)
+        FeSDMDG.create_feature_view(element)
+        if FeatureSDMultiDiGraph.draw_graphs:
+            FeSDMDG.draw_nx_graph()
+        if global_csr_graph is not None:
+            FeSDMDG.create_csr_view(global_csr_graph)
+        return FeSDMDG
+    
+    def draw_feature_graph(self, element, featureID_name_dict, msgseq_tuple, global_graph):
+        "Draw the graph of a feature (see create_feature_graph), e.g. in the parent process of the parallel analysis"
+        edge_list, edgelabel_dict, node_set, nodeID_name_labeldict = msgseq_tuple[:4]
+        FeSDMDG = FeatureSDMultiDiGraph(global_graph, featureID_name_dict[element], node_set, edge_list, nodeID_name_labeldict, edgelabel_dict)
+        FeSDMDG.create_feature_view(element)
+        FeSDMDG.draw_nx_graph()
+    
+    def get_node_query_list(self, se_nodeID_list, sa_nodeID_list, sase_nodeID_list):
+        "Node query list of a feature in the order of sd_analysis_per_feature"
+        se_sa_node_IDcombinations_list, sa_se_node_IDcombinations_list = self.product_of_elements(se_nodeID_list, sa_nodeID_list)
+        sa_sase_node_IDcombinations_list, sase_sa_node_IDcombinations_list = self.product_of_elements(sa_nodeID_list, sase_nodeID_list)
+        se_sase_node_IDcombinations_list, sase_se_node_IDcombinations_list = self.product_of_elements(se_nodeID_list, sase_nodeID_list)
+        return [*se_sa_node_IDcombinations_list, *sa_se_node_IDcombinations_list, *sa_sase_node_IDcombinations_list, *sase_sa_node_IDcombinations_list, *se_sase_node_IDcombinations_list, *sase_se_node_IDcombinations_list]
+    
+    def sd_analysis_per_feature(self, feature_type_flag, element, featureID_name_dict, msgseq_tuple, global_graph, feature_componentID_dict, depth_list = None, count_only = False, global_csr_graph = None, path_cache = None, budget = None):
         "extraction of direct and indirect message sequences exchanged between safety and security relevant lifelines in sequence diagrams of each feature"
-        pri_interacting_features_list = []
-        interacting_features_list = []
-        msgNames_list = []
+        if depth_list is None:
+            depth_list = [None]
+        search_depth = None if None in depth_list else max(depth_list) #the paths are enumerated once up to the largest interaction path length of the sweep
+        pri_interacting_features_dict = {depth: [] for depth in depth_list}
+        interacting_features_dict = {depth: [] for depth in depth_list}
         lifelineNames_list = []
-        msgID_list, msgID_name_dict = self.get_msgIDs_per_feature(element, featureID_name_dict, iterator_type) #get message sequences for each feature
-        msgNames_list = [value for value in msgID_name_dict.values()]
-        #print("\nDebug! Feature: ", featureID_name_dict[element], " len(msgID_list) ", len(msgID_list), " messages: ", msgID_name_dict)
-        edge_list, edgelabel_dict, node_set, nodeID_name_labeldict, updated_objectlifelineID_componentID_dict, updated_componentlifelineID_list, updated_objectlifelineID_name_dict, msgseqID_name_dict = self.get_msgseq_per_feature(msgID_list, msgID_name_dict, all_objectlifelineID_componentID_dict, all_componentlifelineID_list, all_objectlifelineID_name_dict, iterator_type) #get edge_list from message_seq for each feature
+        edge_list, edgelabel_dict, node_set, nodeID_name_labeldict, updated_objectlifelineID_componentID_dict, updated_componentlifelineID_list, updated_objectlifelineID_name_dict, msgseqID_name_dict = msgseq_tuple
         #print("\nDebug! Feature: ", featureID_name_dict[element], " len(edge_list): ", len(edge_list), " messages: ", edgelabel_dict)
         lifelineNames_list = [value for value in nodeID_name_labeldict.values()]
         #print("\nDebug! Feature: ", featureID_name_dict[element], " lifeline_no: ", len(node_set), " lifelines: ", nodeID_name_labeldict)
-        print("\nCreating MultiDiGraph for the feature: ", featureID_name_dict[element])
-        G1 = nx.MultiDiGraph()
-        FeSDMDG = FeatureSDMultiDiGraph(G1, featureID_name_dict[element], node_set, edge_list, nodeID_name_labeldict, edgelabel_dict)
-        FeSDMDG.create_nx_graph()
+        FeSDMDG = self.create_feature_graph(element, featureID_name_dict, msgseq_tuple, global_graph, global_csr_graph)
+        FeSDMDG.path_cache = path_cache
+        FeSDMDG.budget = budget
+        G1 = FeSDMDG.graph
         counter_plus_sase_paths = 0
         counter_minus_sase_paths = 0
         act_components_list = feature_componentID_dict[element]
@@ -1307,14 +1488,10 @@ class SDanalysisOfSeandSaFeatures(Parent):
                 se_sa_node_IDcombinations_list, sa_se_node_IDcombinations_list = self.product_of_elements(se_nodeID_list, sa_nodeID_list) #Preparing node query list to query the multidigraph.
                 joined_nodeID_combination_list = [*se_sa_node_IDcombinations_list, *sa_se_node_IDcombinations_list]
                 str_sa_se_uC = "Check! message sequence has path: "
-                pathIDs_list, path_names_list, counter_sa_se, pri_pathAB_IDs_list = self.nx_simple_paths_in_multidigraph(FeSDMDG, joined_nodeID_combination_list, str_sa_se_uC, updated_objectlifelineID_name_dict, msgseqID_name_dict)
+                pathIDs_list, path_names_list, counter_sa_se, pri_pathAB_IDs_list = self.nx_simple_paths_in_multidigraph(FeSDMDG, joined_nodeID_combination_list, str_sa_se_uC, updated_objectlifelineID_name_dict, msgseqID_name_dict, count_only, search_depth)
                 counter_minus_sase_paths = counter_minus_sase_paths + counter_sa_se
-                ###only for primary paths
-                pri_src_dst_interacFIs_list = self.nx_edgepath_tabular_rep(feature_type_flag, element, featureID_name_dict[element], pri_pathAB_IDs_list, se_nodeID_list, sa_nodeID_list, sase_nodeID_list, nodeID_name_labeldict, msgseqID_name_dict)
-                pri_interacting_features_list.extend(pri_src_dst_interacFIs_list)
-                ###only for secondary paths
-                src_dst_interacFIs_list = self.nx_edgepath_tabular_rep(feature_type_flag, element, featureID_name_dict[element], pathIDs_list, se_nodeID_list, sa_nodeID_list, sase_nodeID_list, nodeID_name_labeldict, msgseqID_name_dict)
-                interacting_features_list.extend(src_dst_interacFIs_list)
+                ###primary and secondary paths, per interaction path length of the sweep
+                self.get_interacting_features_per_depth(depth_list, pri_interacting_features_dict, interacting_features_dict, feature_type_flag, element, featureID_name_dict[element], pri_pathAB_IDs_list, pathIDs_list, se_nodeID_list, sa_nodeID_list, sase_nodeID_list, nodeID_name_labeldict, msgseqID_name_dict)
                 
                 if len(sase_nodeID_list) != 0: #paths between sa to sa/se and se to sa/se
                     sa_sase_node_IDcombinations_list, sase_sa_node_IDcombinations_list = self.product_of_elements(sa_nodeID_list, sase_nodeID_list)
@@ -1322,44 +1499,32 @@ class SDanalysisOfSeandSaFeatures(Parent):
                     joined_nodeID_combination_list = [*sa_sase_node_IDcombinations_list, *sase_sa_node_IDcombinations_list, *se_sase_node_IDcombinations_list, *sase_se_node_IDcombinations_list]
                     print("\nfeature: ",featureID_name_dict[element]," interaction(s): safety to safety/security components\n")
                     str_sa_seorsa_uC = "Check! safety to security/safety message sequence has path: "
-                    pathSaSeorSa_IDs_list, pathSaSeorSa_names_list, counter_sa_or_se_with_sase, pri_pathSaSeorSa_IDs_list = self.nx_simple_paths_in_multidigraph(FeSDMDG, joined_nodeID_combination_list, str_sa_seorsa_uC, updated_objectlifelineID_name_dict, msgseqID_name_dict)
+                    pathSaSeorSa_IDs_list, pathSaSeorSa_names_list, counter_sa_or_se_with_sase, pri_pathSaSeorSa_IDs_list = self.nx_simple_paths_in_multidigraph(FeSDMDG, joined_nodeID_combination_list, str_sa_seorsa_uC, updated_objectlifelineID_name_dict, msgseqID_name_dict, count_only, search_depth)
                     counter_plus_sase_paths = counter_plus_sase_paths + counter_sa_or_se_with_sase
-                    ###only for primary paths
-                    pri_src_dst_interacFIs_list = self.nx_edgepath_tabular_rep(feature_type_flag, element, featureID_name_dict[element], pri_pathSaSeorSa_IDs_list, se_nodeID_list, sa_nodeID_list, sase_nodeID_list, nodeID_name_labeldict, msgseqID_name_dict)
-                    pri_interacting_features_list.extend(pri_src_dst_interacFIs_list)
-                    ###only for secondary paths
-                    src_dst_interacFIs_list = self.nx_edgepath_tabular_rep(feature_type_flag, element, featureID_name_dict[element], pathSaSeorSa_IDs_list, se_nodeID_list, sa_nodeID_list, sase_nodeID_list, nodeID_name_labeldict, msgseqID_name_dict)
-                    interacting_features_list.extend(src_dst_interacFIs_list)
+                    ###primary and secondary paths, per interaction path length of the sweep
+                    self.get_interacting_features_per_depth(depth_list, pri_interacting_features_dict, interacting_features_dict, feature_type_flag, element, featureID_name_dict[element], pri_pathSaSeorSa_IDs_list, pathSaSeorSa_IDs_list, se_nodeID_list, sa_nodeID_list, sase_nodeID_list, nodeID_name_labeldict, msgseqID_name_dict)
             
             elif (len(se_nodeID_list) == 0) and (len(sa_nodeID_list) != 0) and (len(sase_nodeID_list) != 0):
                 sa_sase_node_IDcombinations_list, sase_sa_node_IDcombinations_list = self.product_of_elements(sa_nodeID_list, sase_nodeID_list)
                 joined_nodeID_combination_list = [*sa_sase_node_IDcombinations_list, *sase_sa_node_IDcombinations_list]
                 print("\nfeature: ",featureID_name_dict[element]," interaction: safety to safety/security components\n")
                 str_sa_seorsa_uC = "Check! safety to security/safety message sequence has path: "
-                pathSaSeorSa_IDs_list, pathSaSeorSa_names_list, counter_sa_to_sase, pri_pathSaSeorSa_IDs_list = self.nx_simple_paths_in_multidigraph(FeSDMDG, joined_nodeID_combination_list, str_sa_seorsa_uC, updated_objectlifelineID_name_dict, msgseqID_name_dict)
+                pathSaSeorSa_IDs_list, pathSaSeorSa_names_list, counter_sa_to_sase, pri_pathSaSeorSa_IDs_list = self.nx_simple_paths_in_multidigraph(FeSDMDG, joined_nodeID_combination_list, str_sa_seorsa_uC, updated_objectlifelineID_name_dict, msgseqID_name_dict, count_only, search_depth)
                 counter_plus_sase_paths = counter_plus_sase_paths + counter_sa_to_sase
-                ###only for primary paths
-                pri_src_dst_interacFIs_list = self.nx_edgepath_tabular_rep(feature_type_flag, element, featureID_name_dict[element], pri_pathSaSeorSa_IDs_list, se_nodeID_list, sa_nodeID_list, sase_nodeID_list, nodeID_name_labeldict, msgseqID_name_dict)
-                pri_interacting_features_list.extend(pri_src_dst_interacFIs_list)
-                ###only for secondary paths
-                src_dst_interacFIs_list = self.nx_edgepath_tabular_rep(feature_type_flag, element, featureID_name_dict[element], pathSaSeorSa_IDs_list, se_nodeID_list, sa_nodeID_list, sase_nodeID_list, nodeID_name_labeldict, msgseqID_name_dict)
-                interacting_features_list.extend(src_dst_interacFIs_list)
+                ###primary and secondary paths, per interaction path length of the sweep
+                self.get_interacting_features_per_depth(depth_list, pri_interacting_features_dict, interacting_features_dict, feature_type_flag, element, featureID_name_dict[element], pri_pathSaSeorSa_IDs_list, pathSaSeorSa_IDs_list, se_nodeID_list, sa_nodeID_list, sase_nodeID_list, nodeID_name_labeldict, msgseqID_name_dict)
                 
             elif (len(se_nodeID_list) != 0) and (len(sa_nodeID_list) == 0) and (len(sase_nodeID_list) != 0):
                 se_sase_node_IDcombinations_list, sase_se_node_IDcombinations_list = self.product_of_elements(se_nodeID_list, sase_nodeID_list)
                 joined_nodeID_combination_list = [*se_sase_node_IDcombinations_list, *sase_se_node_IDcombinations_list]
                 print("\nfeature: ",featureID_name_dict[element]," interaction: security to safety/security components\n")
                 str_se_seorsa_uC = "Check! security to security/safety message sequence has path: "
-                pathSeSaorSe_IDs_list, pathSeSaorSe_names_list, counter_se_to_sase, pri_pathSeSaorSe_IDs_list = self.nx_simple_paths_in_multidigraph(FeSDMDG, joined_nodeID_combination_list, str_se_seorsa_uC, updated_objectlifelineID_name_dict, msgseqID_name_dict)
+                pathSeSaorSe_IDs_list, pathSeSaorSe_names_list, counter_se_to_sase, pri_pathSeSaorSe_IDs_list = self.nx_simple_paths_in_multidigraph(FeSDMDG, joined_nodeID_combination_list, str_se_seorsa_uC, updated_objectlifelineID_name_dict, msgseqID_name_dict, count_only, search_depth)
                 counter_plus_sase_paths = counter_plus_sase_paths + counter_se_to_sase
-                ###only for primary paths
-                pri_src_dst_interacFIs_list = self.nx_edgepath_tabular_rep(feature_type_flag, element, featureID_name_dict[element], pri_pathSeSaorSe_IDs_list, se_nodeID_list, sa_nodeID_list, sase_nodeID_list, nodeID_name_labeldict, msgseqID_name_dict)
-                pri_interacting_features_list.extend(pri_src_dst_interacFIs_list)
-                ###only for secondary paths
-                src_dst_interacFIs_list = self.nx_edgepath_tabular_rep(feature_type_flag, element, featureID_name_dict[element], pathSeSaorSe_IDs_list, se_nodeID_list, sa_nodeID_list, sase_nodeID_list, nodeID_name_labeldict, msgseqID_name_dict)
-                interacting_features_list.extend(src_dst_interacFIs_list)             
+                ###primary and secondary paths, per interaction path length of the sweep
+                self.get_interacting_features_per_depth(depth_list, pri_interacting_features_dict, interacting_features_dict, feature_type_flag, element, featureID_name_dict[element], pri_pathSeSaorSe_IDs_list, pathSeSaorSe_IDs_list, se_nodeID_list, sa_nodeID_list, sase_nodeID_list, nodeID_name_labeldict, msgseqID_name_dict)             
         print("\nDebug! Path_count!!!Feature: ", featureID_name_dict[element], " has ", counter_minus_sase_paths, " paths bw se and sa SWC, and ", counter_plus_sase_paths, " paths between se or sa and sase")
-        return pri_interacting_features_list, interacting_features_list
+        return pri_interacting_features_dict, interacting_features_dict, (counter_minus_sase_paths, counter_plus_sase_paths)
         
     def objectlifelines_all_featureset(self, featureID_list, featureID_name_dict, iterator_type):
         all_propertyISids_set = set()
@@ -1376,41 +1541,180 @@ class SDanalysisOfSeandSaFeatures(Parent):
             all_objectlifelineID_componentID_dict.update(objectlifelineID_componentID_dict)
         return all_propertyISids_set, all_propertyISid_name_dict, componentlifelineID_set, all_objectlifelineID_name_dict, all_objectlifelineID_componentID_dict
     
-    def sd_analysis_sasefeatures(self, iterator_type):
+    def get_global_message_graph(self, iterator_type):
+        "Collect the message sequences of all security and safety features and create the global message graph"
+        print("\n\nCollecting the message sequences of all security and safety features...")
+        all_se_propertyISids_set, all_se_propertyISid_name_dict, all_se_componentlifelineID_set, all_se_objectlifelineID_name_dict, all_se_objectlifelineID_componentID_dict = self.objectlifelines_all_featureset(self.security_feature_list, self.sefeatureID_name_dict, iterator_type)
+        se_featureID_msgseq_dict = self.get_msgseq_per_featureset(self.security_feature_list, self.sefeatureID_name_dict, all_se_objectlifelineID_componentID_dict, all_se_componentlifelineID_set, all_se_objectlifelineID_name_dict, iterator_type)
+        all_sa_propertyISids_set, all_sa_propertyISid_name_dict, all_sa_componentlifelineID_set, all_sa_objectlifelineID_name_dict, all_sa_objectlifelineID_componentID_dict = self.objectlifelines_all_featureset(self.safety_feature_list, self.safeatureID_name_dict, iterator_type)
+        sa_featureID_msgseq_dict = self.get_msgseq_per_featureset(self.safety_feature_list, self.safeatureID_name_dict, all_sa_objectlifelineID_componentID_dict, all_sa_componentlifelineID_set, all_sa_objectlifelineID_name_dict, iterator_type)
+        global_graph = self.create_global_graph([se_featureID_msgseq_dict, sa_featureID_msgseq_dict]) #created once, each feature is analysed on a view of it
+        global_csr_graph = None
+        if path_backend == "csr":
+            global_csr_graph = create_csr_graph_from_nx(global_graph)
+        print("Debug! Global message graph of all features: nodes: ", global_graph.number_of_nodes(), " edges: ", global_graph.number_of_edges())
+        return se_featureID_msgseq_dict, sa_featureID_msgseq_dict, global_graph, global_csr_graph
+    
+    def get_feature_set_dicts(self, feature_type_flag, se_featureID_msgseq_dict, sa_featureID_msgseq_dict):
+        "featureID_name_dict, featureID_msgseq_dict and feature_componentID_dict of the security (0) or safety (1) features"
+        if feature_type_flag == 0:
+            return self.sefeatureID_name_dict, se_featureID_msgseq_dict, self.se_feature_componentID_dict
+        return self.safeatureID_name_dict, sa_featureID_msgseq_dict, self.sa_feature_componentID_dict
+    
+    def sd_analysis_feature_task(self, se_featureID_msgseq_dict, sa_featureID_msgseq_dict, global_graph, depth_list, count_only, global_csr_graph, path_cache, budget, feature_task_tuple):
+        "sd_analysis_per_feature of a (feature_type_flag, feature) in a worker process of the parallel analysis"
+        feature_type_flag, feature = feature_task_tuple
+        featureID_name_dict, featureID_msgseq_dict, feature_componentID_dict = self.get_feature_set_dicts(feature_type_flag, se_featureID_msgseq_dict, sa_featureID_msgseq_dict)
+        FeatureSDMultiDiGraph.text_output_list = []
+        FeatureSDMultiDiGraph.draw_graphs = False
+        path_cache_state = None if path_cache is None else path_cache.get_state()
+        budget_state = None if budget is None else budget.get_state()
+        result_tuple = self.sd_analysis_per_feature(feature_type_flag, feature, featureID_name_dict, featureID_msgseq_dict[feature], global_graph, feature_componentID_dict, depth_list, count_only, global_csr_graph, path_cache, budget)
+        path_cache_update = None if path_cache is None else path_cache.get_update(path_cache_state)
+        budget_update = None if budget is None else budget.get_update(budget_state)
+        return result_tuple, FeatureSDMultiDiGraph.text_output_list, path_cache_update, budget_update
+    
+    def iter_feature_analysis_results(self, feature_task_list, se_featureID_msgseq_dict, sa_featureID_msgseq_dict, global_graph, depth_list, count_only, global_csr_graph, path_cache, budget, workers = None):
+        "Yield the results of sd_analysis_per_feature for each feature of feature_task_list in order, in parallel with workers > 1"
+        if workers is None or workers <= 1 or len(feature_task_list) <= 1:
+            for feature_type_flag, feature in feature_task_list:
+                featureID_name_dict, featureID_msgseq_dict, feature_componentID_dict = self.get_feature_set_dicts(feature_type_flag, se_featureID_msgseq_dict, sa_featureID_msgseq_dict)
+                yield self.sd_analysis_per_feature(feature_type_flag, feature, featureID_name_dict, featureID_msgseq_dict[feature], global_graph, feature_componentID_dict, depth_list, count_only, global_csr_graph, path_cache, budget)
+            return
+        if budget is not None and budget.has_run_budget():
+            raise ValueError("Run budgets (run_max_paths, run_max_expanded_nodes, run_max_seconds) are counted per worker process and cannot be used with workers > 1; run the analysis serially or use the budgets per query")
+        if global_csr_graph is not None:
+            global_csr_graph = get_fork_csr_graph(global_csr_graph)
+        result_iterator = iter_parallel_results(self.sd_analysis_feature_task, feature_task_list, workers, (se_featureID_msgseq_dict, sa_featureID_msgseq_dict, global_graph, depth_list, count_only, global_csr_graph, path_cache, budget))
+        for feature_task_tuple, (result_tuple, text_output_list, path_cache_update, budget_update) in zip(feature_task_list, result_iterator):
+            feature_type_flag, feature = feature_task_tuple
+            featureID_name_dict, featureID_msgseq_dict, feature_componentID_dict = self.get_feature_set_dicts(feature_type_flag, se_featureID_msgseq_dict, sa_featureID_msgseq_dict)
+            self.draw_feature_graph(feature, featureID_name_dict, featureID_msgseq_dict[feature], global_graph)
+            for output_file_path, text in text_output_list:
+                with open(output_file_path, "a") as external_file: #write/append to file
+                    print(text, file=external_file)
+            if path_cache_update is not None:
+                path_cache.merge_update(path_cache_update)
+            if budget_update is not None:
+                budget.merge_update(budget_update)
+            yield result_tuple
+    
+    def sd_analysis_sasefeatures(self, iterator_type, depth_list = None, bundle_file = None, count_only = False, path_cache = None, budget = None, workers = None):
         "direct and indirect message sequence extraction for all safety and security sequence diagrams"
+        sweep_flag = depth_list is not None
+        if depth_list is None:
+            depth_list = [None]
+        depth_list = sorted(set(depth_list), key = lambda depth: float('inf') if depth is None else depth)
+        se_featureID_msgseq_dict, sa_featureID_msgseq_dict, global_graph, global_csr_graph = self.get_global_message_graph(iterator_type)
+        
         print("\n\nStarting sequence diagram analysis per security feature...")
-        all_se_propertyISids_set, all_se_propertyISid_name_dict, all_se_componentlifelineID_set, all_se_objectlifelineID_name_dict, all_se_objectlifelineID_componentID_dict = self.objectlifelines_all_featureset(self.security_feature_list, self.sefeatureID_name_dict, iterator_type)
         feature_type_flag = 0 #set this flag to 0 if the feature is a security feature
-        all_pri_interacting_features_list = []
-        all_sec_interacting_features_list = []
+        all_pri_interacting_features_dict = {depth: [] for depth in depth_list}
+        all_sec_interacting_features_dict = {depth: [] for depth in depth_list}
+        featurepathcount_list = [] #[[feature name, paths bw se and sa SWC, paths between se or sa and sase]]
+        feature_task_list = [(0, feature) for feature in self.security_feature_list] + [(1, feature) for feature in self.safety_feature_list]
+        feature_result_iterator = self.iter_feature_analysis_results(feature_task_list, se_featureID_msgseq_dict, sa_featureID_msgseq_dict, global_graph, depth_list, count_only, global_csr_graph, path_cache, budget, workers)
         
         for feature in self.security_feature_list:
-            pri_interacting_features_list1, interacting_features_list1 = self.sd_analysis_per_feature(feature_type_flag, feature, self.sefeatureID_name_dict, all_se_objectlifelineID_componentID_dict, list(all_se_componentlifelineID_set), all_se_objectlifelineID_name_dict, self.se_feature_componentID_dict, iterator_type)
-            all_pri_interacting_features_list.extend(pri_interacting_features_list1)
-            all_sec_interacting_features_list.extend(interacting_features_list1)
+            pri_interacting_features_dict1, interacting_features_dict1, pathcount_tuple = next(feature_result_iterator)
+            featurepathcount_list.append([self.sefeatureID_name_dict[feature], pathcount_tuple[0], pathcount_tuple[1]])
+            for depth in depth_list:
+                all_pri_interacting_features_dict[depth].extend(pri_interacting_features_dict1[depth])
+                all_sec_interacting_features_dict[depth].extend(interacting_features_dict1[depth])
         
         print("\n\nStarting sequence diagram analysis per safety feature...")
-        all_sa_propertyISids_set, all_sa_propertyISid_name_dict, all_sa_componentlifelineID_set, all_sa_objectlifelineID_name_dict, all_sa_objectlifelineID_componentID_dict = self.objectlifelines_all_featureset(self.safety_feature_list, self.safeatureID_name_dict, iterator_type)
         feature_type_flag = 1 #set this flag to 1 if the feature is a safety feature
         
         for feature in self.safety_feature_list:
-            pri_interacting_features_list2, interacting_features_list2 = self.sd_analysis_per_feature(feature_type_flag, feature, self.safeatureID_name_dict, all_sa_objectlifelineID_componentID_dict, list(all_sa_componentlifelineID_set), all_sa_objectlifelineID_name_dict, self.sa_feature_componentID_dict, iterator_type)
-            all_pri_interacting_features_list.extend(pri_interacting_features_list2)
-            all_sec_interacting_features_list.extend(interacting_features_list2)
-        all_pri_interacting_features_list.sort()
-        all_sec_interacting_features_list.sort()
+            pri_interacting_features_dict2, interacting_features_dict2, pathcount_tuple = next(feature_result_iterator)
+            featurepathcount_list.append([self.safeatureID_name_dict[feature], pathcount_tuple[0], pathcount_tuple[1]])
+            for depth in depth_list:
+                all_pri_interacting_features_dict[depth].extend(pri_interacting_features_dict2[depth])
+                all_sec_interacting_features_dict[depth].extend(interacting_features_dict2[depth])
+        feature_result_iterator.close() #shut down the process pool of the parallel analysis
+        
+        if path_cache is not None:
+            path_cache.print_stats()
+            path_cache.save()
+        if budget is not None:
+            budget.print_report()
         
-        all_pri_interacting_features_updatedlist = list(all_pri_interacting_features_list for all_pri_interacting_features_list, _ in itertools.groupby(all_pri_interacting_features_list))
-        all_sec_interacting_features_updatedlist = list(all_sec_interacting_features_list for all_sec_interacting_features_list, _ in itertools.groupby(all_sec_interacting_features_list))
-        print("Summary! len(all_pri_interact_FInames_updatedlist): ", len(all_pri_interacting_features_updatedlist), " len(all_sec_interact_FInames_updatedlist): ", len(all_sec_interacting_features_updatedlist))
-        print("\n\n")
-        print(tabulate(all_pri_interacting_features_updatedlist, headers = ["primary_src_feature", "primary_interacting_dst_feature"], tablefmt = 'grid'))
-        print("\n\n")
-        print(tabulate(all_sec_interacting_features_updatedlist, headers = ["secondary_src_feature", "secondary_interacting_dst_feature"], tablefmt = 'grid'))
+        if count_only:
+            print("\n\nSummary! Path counts per feature (without cutoff):")
+            print(tabulate(featurepathcount_list, headers = ["feature", "paths_bw_se_and_sa", "paths_bw_seorsa_and_sase"], tablefmt = 'grid'))
+            result_bundle = {"method": "FIISS", "mode": "count", "features": [{"feature": feature_name, "paths_bw_se_and_sa": counter_minus_sase_paths, "paths_bw_seorsa_and_sase": counter_plus_sase_paths} for feature_name, counter_minus_sase_paths, counter_plus_sase_paths in featurepathcount_list]}
+            if bundle_file is not None:
+                write_result_bundle(result_bundle, bundle_file)
+            return result_bundle
+        
+        result_bundle = {"method": "FIISS", "depths": []}
+        if budget is not None:
+            result_bundle["truncated_queries"] = budget.get_truncated_query_list()
+        for depth in depth_list:
+            if sweep_flag:
+                print("\n\n######## Results for interaction path length: ", depth, " ########")
+            all_pri_interacting_features_list = all_pri_interacting_features_dict[depth]
+            all_sec_interacting_features_list = all_sec_interacting_features_dict[depth]
+            all_pri_interacting_features_list.sort()
+            all_sec_interacting_features_list.sort()
+            
+            all_pri_interacting_features_updatedlist = list(all_pri_interacting_features_list for all_pri_interacting_features_list, _ in itertools.groupby(all_pri_interacting_features_list))
+            all_sec_interacting_features_updatedlist = list(all_sec_interacting_features_list for all_sec_interacting_features_list, _ in itertools.groupby(all_sec_interacting_features_list))
+            print("Summary! len(all_pri_interact_FInames_updatedlist): ", len(all_pri_interacting_features_updatedlist), " len(all_sec_interact_FInames_updatedlist): ", len(all_sec_interacting_features_updatedlist))
+            print("\n\n")
+            print(tabulate(all_pri_interacting_features_updatedlist, headers = ["primary_src_feature", "primary_interacting_dst_feature"], tablefmt = 'grid'))
+            print("\n\n")
+            print(tabulate(all_sec_interacting_features_updatedlist, headers = ["secondary_src_feature", "secondary_interacting_dst_feature"], tablefmt = 'grid'))
+            
+            total_FIs = list(all_pri_interacting_features_updatedlist)
+            for FI in all_sec_interacting_features_updatedlist:
+                if FI not in total_FIs:
+                    total_FIs.append(FI)
+            result_bundle["depths"].append({"depth": depth, "primary_FIs": all_pri_interacting_features_updatedlist, "secondary_FIs": all_sec_interacting_features_updatedlist, "total_FIs": total_FIs})
+        if bundle_file is not None:
+            write_result_bundle(result_bundle, bundle_file)
+        return result_bundle
     
-def main():
+    def iter_interaction_paths(self, iterator_type, depth = None, budget = None):
+        "Streaming variant of sd_analysis_sasefeatures: yield one event (dict) per primary or secondary interaction path"
+        se_featureID_msgseq_dict, sa_featureID_msgseq_dict, global_graph, global_csr_graph = self.get_global_message_graph(iterator_type)
+        relevant_lifelines_list = []
+        relevant_lifelines_list.extend(self.seSWCid_list)
+        relevant_lifelines_list.extend(self.saSWCid_list)
+        relevant_lifelines_list.extend(self.saseCSWC_list)
+        for feature_type_flag, featureID_list, featureID_name_dict, featureID_msgseq_dict in ((0, self.security_feature_list, self.sefeatureID_name_dict, se_featureID_msgseq_dict), (1, self.safety_feature_list, self.safeatureID_name_dict, sa_featureID_msgseq_dict)):
+            for element in featureID_list:
+                msgseq_tuple = featureID_msgseq_dict[element]
+                edge_list, edgelabel_dict, node_set, nodeID_name_labeldict, updated_objectlifelineID_componentID_dict, updated_componentlifelineID_list, updated_objectlifelineID_name_dict, msgseqID_name_dict = msgseq_tuple
+                if len(node_set) == 0:
+                    print("No lifelines in sequence diagrams of feature: ", featureID_name_dict[element], " were found!!!")
+                    continue
+                FeSDMDG = self.create_feature_graph(element, featureID_name_dict, msgseq_tuple, global_graph, global_csr_graph)
+                FeSDMDG.budget = budget
+                se_nodeID_list, sa_nodeID_list, sase_nodeID_list, non_saorse_nodeID_list = self.get_sase_relevant_nodes_per_feature(list(node_set), updated_objectlifelineID_name_dict)
+                for src, dst in self.get_node_query_list(se_nodeID_list, sa_nodeID_list, sase_nodeID_list):
+                    for path, primary_flag in FeSDMDG.iter_classified_simple_paths(src, dst, depth, relevant_lifelines_list):
+                        src_dst_interacFIs_list = self.nx_edgepath_tabular_rep(feature_type_flag, element, featureID_name_dict[element], [path], se_nodeID_list, sa_nodeID_list, sase_nodeID_list, nodeID_name_labeldict, msgseqID_name_dict)
+                        yield {"event": "path", "feature": featureID_name_dict[element], "query": [src, dst], "category": "primary" if primary_flag else "secondary", "path": path, "FI_names": src_dst_interacFIs_list}
+                    if budget is not None and budget.truncated_reason is not None:
+                        yield {"event": "truncated", "feature": featureID_name_dict[element], "query": [src, dst], "reason": budget.truncated_reason}
+        if budget is not None:
+            budget.print_report()
+    
+    def iter_feature_interactions(self, iterator_type, depth = None, budget = None):
+        "Yield each interacting feature pair once, with the first interaction path realizing it in iter_interaction_paths"
+        FI_set = set()
+        for event_dict in self.iter_interaction_paths(iterator_type, depth, budget):
+            if event_dict["event"] != "path":
+                continue
+            for FI in event_dict["FI_names"]:
+                if tuple(FI) not in FI_set:
+                    FI_set.add(tuple(FI))
+                    yield {"event": "FI", "FI_names": FI, "category": event_dict["category"], "feature": event_dict["feature"]}
+    
+def create_sd_analysis(iterator_type):
+    "Extract the safety and security features and components from the input files and set up their sequence diagram analysis"
     Pa = Parent()
-    iterator_type = 2 #configure the search to be performed in the appropriate input file (for our case study, it was input xmi file 2)
     print("\nGetting security features...")
     GSeF = GetSecurityFeatures(security_feature_pkg_list)
     se_feature_pkg_dict = GSeF.get_security_feature_name(iterator_type)
@@ -1440,8 +1744,27 @@ def main():
     print("\nse_activityID_componentsID_dict: ", se_activityID_componentsID_dict, "\nsa_activityID_componentsID_dict: ", sa_activityID_componentsID_dict)
     
     print("\n\nPerforming sequence diagram analysis per feature to identify interaction between safety and security components")
-    sdA = SDanalysisOfSeandSaFeatures(security_feature_pkg_list, se_feature_pkg_dict, safety_feature_pkg_list, sa_feature_pkg_dict, list(all_security_componentID_set), list(all_safety_componentID_set), list(common_elements_set), se_feature_componentID_dict, sa_feature_componentID_dict, se_activityID_componentsID_dict, sa_activityID_componentsID_dict, se_featureID_activityID_dict, sa_featureID_activityID_dict, se_activity_dict, sa_activity_dict)
-    sdA.sd_analysis_sasefeatures(iterator_type)
+    return SDanalysisOfSeandSaFeatures(security_feature_pkg_list, se_feature_pkg_dict, safety_feature_pkg_list, sa_feature_pkg_dict, list(all_security_componentID_set), list(all_safety_componentID_set), list(common_elements_set), se_feature_componentID_dict, sa_feature_componentID_dict, se_activityID_componentsID_dict, sa_activityID_componentsID_dict, se_featureID_activityID_dict, sa_featureID_activityID_dict, se_activity_dict, sa_activity_dict)
+
+def get_enumeration_budget():
+    "EnumerationBudget of enumeration_budget_dict, None if no budget is set"
+    if any(value is not None for value in enumeration_budget_dict.values()):
+        return EnumerationBudget(**enumeration_budget_dict)
+    return None
+
+def main():
+    load_input_files([file_path_inputfile1, file_path_inputfile2, file_path_inputfile3, file_path_inputfile4, file_path_inputfile5, file_path_inputfile6, file_path_inputfile7])
+    iterator_type = 2 #configure the search to be performed in the appropriate input file (for our case study, it was input xmi file 2)
+    sdA = create_sd_analysis(iterator_type)
+    enumeration_budget = get_enumeration_budget()
+    if count_only_mode:
+        sdA.sd_analysis_sasefeatures(iterator_type, count_only = True, path_cache = PathQueryCache(path_cache_size, path_cache_file, path_cache_max_paths), workers = parallel_workers)
+    elif len(sweep_depth_list) != 0:
+        sdA.sd_analysis_sasefeatures(iterator_type, sweep_depth_list, sweep_bundle_file, path_cache = PathQueryCache(path_cache_size, path_cache_file, path_cache_max_paths), budget = enumeration_budget, workers = parallel_workers)
+    elif interaction_stream_file is not None:
+        write_interaction_stream(sdA.iter_interaction_paths(iterator_type, budget = enumeration_budget), interaction_stream_file, {"method": "FIISS", "depth": None})
+    else:
+        sdA.sd_analysis_sasefeatures(iterator_type, path_cache = PathQueryCache(path_cache_size, path_cache_file, path_cache_max_paths), budget = enumeration_budget, workers = parallel_workers)
     
     stop = timeit.default_timer()
     print('Time: ', stop - start)
@@ -19,6 +19,8 @@ import sys
 dirname = os.path.dirname(__file__)
 sys.path.append(os.path.join(dirname, '..', 'lib'))
 from I_FASST_lib import *
+sys.path.append(os.path.join(dirname, '..', '..', 'path_engine', 'code'))
+from path_engine import ReachabilityIndex, PathCounter, PathQueryCache, create_interaction_graph_from_nx, create_csr_graph_from_nx, all_simple_edge_paths, get_graph_fingerprint, get_ids_fingerprint, split_task_list, iter_parallel_results, CSRGraph, iter_shared_graph_results
 
 ######################################Configurable inputs#####################################
 #Configurable inputs for security features
@@ -38,6 +40,14 @@ secComponentID_name_dict = {} #Specify a dict in which each key is the XMI ID of
 
 #For each safety relevant component ID, configure its name. Note that alternatively, the names can be automatically extracted from the architecture model
 safComponentID_name_dict = {} #Specify a dict in which each key is the XMI ID of a safety relevant component and the value corresponding to the key is the name of the safety relevant component
+
+#Configure the path search
+collapsed_path_search = True #if True, simple paths are searched between components (parallel messages form one edge) and message-level paths are only expanded where needed; if False, every message-level path is enumerated with networkx (reference implementation)
+path_backend = "networkx" #backend of the message-level path enumeration (used if collapsed_path_search is False): "networkx" (reference backend) or "csr" (numpy CSR arrays, same paths in the same order)
+path_cache_size = 4096 #maximum number of path query results kept in the LRU path cache (shared by the safety to security and security to safety queries), None for no bound and 0 to disable the cache
+path_cache_max_paths = 100000 #maximum total number of message paths kept in the path cache (the results of queries without cutoff can hold many paths); a query with more paths is not cached, None for no bound
+path_cache_file = None #Specify a file to persist the path cache across runs e.g. os.path.join(dirname, '..', 'build', 'I_FASST_path_cache.pkl'); None keeps the cache in memory only
+parallel_workers = None #number of worker processes e.g. os.cpu_count() for the feature extraction and the queries; None or 1 processes the features and queries one after the other
 ##############################################################################################
 nextiterationcheck = object()
 
@@ -516,7 +526,76 @@ class GetBehavioralElements():
             sequenceID_name_dict.update(seqID_name_dict1)
         return sequenceID_set, sequenceID_name_dict, node_set, nodeID_name_labeldict, edge_list, edge_label_dict
     
-    def extract_lifelines_and_messages(self):
+    def extract_feature_elements(self, feature):
+        "Extract the lifelines, the owned and used messages and the relevant messages of a feature"
+        feature_name = self.featurePkgID_name_dict[feature]
+        msguncoveredintupleID_list = []
+        msguncoveredintupleName_list = []
+        uncoveredMsgintupleID_list = []
+        uncoveredMsgintupleName_list = []
+        
+        lifeline_set = set()
+        classifierID_set = set()
+        classifierID_name_dict = {}
+        mappedLLID_classifierID_dict = {}
+        mappedOccurSpecID_lifelineID_dict = {}
+        nodeID_set = set()
+        nodeID_name_labeldict = {}
+        edge_list = []
+        edge_label_dict = {}
+        
+        #extracting lifelines of each feature
+        lifeline_set, classifierID_set, classifierID_name_dict, mappedLLID_classifierID_dict, SeqOccurSpecID_set, mappedOccurSpecID_lifelineID_dict, refSD_dependentFeID_dict, instSpecID_set, mappedISID_classifierID_dict = self.extract_lifelines(feature, 2) #search will be performed in the specified input xmi file; for our case study, it is input xmi file 2
+        classifierNames_list = [value for value in classifierID_name_dict.values()]
+        #print("\nDebug! Feature: ", feature_name, " lifelines_no: ", len(classifierID_set), " lifelines: ", classifierID_name_dict)
+        
+        #extracting owned messages of each feature
+        ownedMsgID_list, ownedMsgID_name_dict, ownednode_set, ownednodeID_name_labeldict, ownededge_list, ownededge_tuple, ownededge_label_dict, feID_dependentFeID_dict, msgID_msgSort_dict = self.extract_owned_messages(feature, SeqOccurSpecID_set, mappedOccurSpecID_lifelineID_dict, mappedLLID_classifierID_dict, classifierID_name_dict, refSD_dependentFeID_dict, 2) #search will be performed in the specified input xmi file; for our case study, it is input xmi file 2
+        
+        #ownedMsgname_list = [value for value in ownedMsgID_name_dict.values()]
+        
+        #validating tuples obtained from extracted owned messages
+        msguncoveredintupleID_list, msguncoveredintupleName_list = self.validate_msgtuples(ownededge_list, ownedMsgID_list, ownedMsgID_name_dict)
+        
+        #print("\nDebug! Feature: ", feature_name, " owned_message_no: ", len(ownedMsgID_list), " ownedMsg: ", ownedMsgID_name_dict)
+        #print("\nDebug! Feature: ", feature_name, " owned_tuple_no: ", len(ownededge_list), " ownedMsg: ", ownededge_label_dict)
+        print("\nDebug! Feature: ", feature_name, " uncoveredMsgInTuples_no : ", len(msguncoveredintupleID_list), ", uncoveredMsgInTupleIDs: ", msguncoveredintupleID_list, " uncoveredMsgInTuples: ", msguncoveredintupleName_list)
+        
+        #extracting used messages of each feature
+        usedMsgID_set, usedMsgID_name_dict, usednode_set, usednodeID_name_labeldict, usededge_list, usededge_label_dict = self.extract_used_messages(ownedMsgID_list, instSpecID_set, mappedISID_classifierID_dict, classifierID_name_dict, 3) #search will be performed in the specified input xmi file; for our case study, it is input xmi file 3
+        
+        #validating tuples obtained from extracted used messages
+        uncoveredMsgintupleID_list, uncoveredMsgintupleName_list = self.validate_msgtuples(usededge_list, list(usedMsgID_set), usedMsgID_name_dict)
+        
+        #print("\nDebug! Feature: ", feature_name, " used_message_no: ", len(usedMsgID_set), " usedMsg: ", usedMsgID_name_dict)
+        #print("\nDebug! Feature: ", feature_name, " used_tuple_no: ", len(usededge_list), " usedTuple_list: ", usededge_list, " usedTuple_dict: ", usededge_label_dict)
+        print("\nDebug! Feature: ", feature_name, " uncoveredMsgInTuples_no : ", len(uncoveredMsgintupleID_list), ", uncoveredMsgInTupleIDs: ", uncoveredMsgintupleID_list, " uncoveredMsgInTuples: ", uncoveredMsgintupleName_list)
+        
+        nodeID_set.update(ownednode_set)
+        nodeID_set.update(usednode_set)
+        nodeID_name_labeldict.update(ownednodeID_name_labeldict)
+        nodeID_name_labeldict.update(usednodeID_name_labeldict)
+        edge_list.extend(ownededge_list)
+        for ele in usededge_list:
+            if ele not in edge_list:
+                edge_list.append(ele)
+        edge_label_dict.update(ownededge_label_dict)
+        edge_label_dict.update(usededge_label_dict)
+        
+        #Distinguishing relevant messages for each feature i.e. mapping each feature to its relevant messages
+        relCompID_list = self.feID_relCompID_dict[feature]
+        relCompNames_list = get_listnames_from_listIDs_fromdictwithmissingkeys(relCompID_list, nodeID_name_labeldict)
+        relMsgIDs_list = []
+        for element in edge_list:
+            eachtuples_srcID = element[-3]
+            eachtuples_dstID = element[-2]
+            if eachtuples_dstID in relCompID_list or eachtuples_srcID in relCompID_list:
+                relMsgID = element[-1]
+                if relMsgID not in relMsgIDs_list:
+                    relMsgIDs_list.append(relMsgID)
+        return feID_dependentFeID_dict, msgID_msgSort_dict, ownedMsgID_name_dict, usedMsgID_name_dict, nodeID_set, nodeID_name_labeldict, edge_list, edge_label_dict, relCompNames_list, relMsgIDs_list
+    
+    def extract_lifelines_and_messages(self, workers = None):
         "For each feature being analyzed, extract messages. Extract the lifelines involved in the message exchange."
         feID_dependentFeID_dict = {}
         allSD_feID_dependentFeID_dict = {'feature':'interacting_feature'}
@@ -530,77 +609,18 @@ class GetBehavioralElements():
         feID_relMsgNameslist_dict = {}
         msgID_name_dict = {}
         feGroup_msgID_msgSort_dict = {}
-        for feature in self.featurePkgID_list:
+        if workers is None or workers <= 1 or len(self.featurePkgID_list) <= 1:
+            feature_element_iterator = map(self.extract_feature_elements, self.featurePkgID_list)
+        else:
+            feature_element_iterator = iter_parallel_results(self.extract_feature_elements, self.featurePkgID_list, workers)
+        for feature, feature_element_tuple in zip(self.featurePkgID_list, feature_element_iterator):
+            feID_dependentFeID_dict, msgID_msgSort_dict, ownedMsgID_name_dict, usedMsgID_name_dict, nodeID_set, nodeID_name_labeldict, edge_list, edge_label_dict, relCompNames_list, relMsgIDs_list = feature_element_tuple
             feature_name = self.featurePkgID_name_dict[feature]
-            msguncoveredintupleID_list = []
-            msguncoveredintupleName_list = []
-            uncoveredMsgintupleID_list = []
-            uncoveredMsgintupleName_list = []
-            
-            lifeline_set = set()
-            classifierID_set = set()
-            classifierID_name_dict = {}
-            mappedLLID_classifierID_dict = {}
-            mappedOccurSpecID_lifelineID_dict = {}
-            nodeID_set = set()
-            nodeID_name_labeldict = {}
-            edge_list = []
-            edge_label_dict = {}
-            
-            #extracting lifelines of each feature
-            lifeline_set, classifierID_set, classifierID_name_dict, mappedLLID_classifierID_dict, SeqOccurSpecID_set, mappedOccurSpecID_lifelineID_dict, refSD_dependentFeID_dict, instSpecID_set, mappedISID_classifierID_dict = self.extract_lifelines(feature, 2) #search will be performed in the specified input xmi file; for our case study, it is input xmi file 2
-            classifierNames_list = [value for value in classifierID_name_dict.values()]
-            #print("\nDebug! Feature: ", feature_name, " lifelines_no: ", len(classifierID_set), " lifelines: ", classifierID_name_dict)
-            
-            #extracting owned messages of each feature
-            ownedMsgID_list, ownedMsgID_name_dict, ownednode_set, ownednodeID_name_labeldict, ownededge_list, ownededge_tuple, ownededge_label_dict, feID_dependentFeID_dict, msgID_msgSort_dict = self.extract_owned_messages(feature, SeqOccurSpecID_set, mappedOccurSpecID_lifelineID_dict, mappedLLID_classifierID_dict, classifierID_name_dict, refSD_dependentFeID_dict, 2) #search will be performed in the specified input xmi file; for our case study, it is input xmi file 2
-            
-            #ownedMsgname_list = [value for value in ownedMsgID_name_dict.values()]
             allSD_feID_dependentFeID_dict.update(feID_dependentFeID_dict)
             feGroup_msgID_msgSort_dict.update(msgID_msgSort_dict)
-            
-            #validating tuples obtained from extracted owned messages
-            msguncoveredintupleID_list, msguncoveredintupleName_list = self.validate_msgtuples(ownededge_list, ownedMsgID_list, ownedMsgID_name_dict)
-            
-            #print("\nDebug! Feature: ", feature_name, " owned_message_no: ", len(ownedMsgID_list), " ownedMsg: ", ownedMsgID_name_dict)
-            #print("\nDebug! Feature: ", feature_name, " owned_tuple_no: ", len(ownededge_list), " ownedMsg: ", ownededge_label_dict)
-            print("\nDebug! Feature: ", feature_name, " uncoveredMsgInTuples_no : ", len(msguncoveredintupleID_list), ", uncoveredMsgInTupleIDs: ", msguncoveredintupleID_list, " uncoveredMsgInTuples: ", msguncoveredintupleName_list)
-            
-            #extracting used messages of each feature
-            usedMsgID_set, usedMsgID_name_dict, usednode_set, usednodeID_name_labeldict, usededge_list, usededge_label_dict = self.extract_used_messages(ownedMsgID_list, instSpecID_set, mappedISID_classifierID_dict, classifierID_name_dict, 3) #search will be performed in the specified input xmi file; for our case study, it is input xmi file 3
-            
-            #validating tuples obtained from extracted used messages
-            uncoveredMsgintupleID_list, uncoveredMsgintupleName_list = self.validate_msgtuples(usededge_list, list(usedMsgID_set), usedMsgID_name_dict)
-            
-            #print("\nDebug! Feature: ", feature_name, " used_message_no: ", len(usedMsgID_set), " usedMsg: ", usedMsgID_name_dict)
-            #print("\nDebug! Feature: ", feature_name, " used_tuple_no: ", len(usededge_list), " usedTuple_list: ", usededge_list, " usedTuple_dict: ", usededge_label_dict)
-            print("\nDebug! Feature: ", feature_name, " uncoveredMsgInTuples_no : ", len(uncoveredMsgintupleID_list), ", uncoveredMsgInTupleIDs: ", uncoveredMsgintupleID_list, " uncoveredMsgInTuples: ", uncoveredMsgintupleName_list)
-            
             msgID_name_dict.update(ownedMsgID_name_dict)
             msgID_name_dict.update(usedMsgID_name_dict)
-            nodeID_set.update(ownednode_set)
-            nodeID_set.update(usednode_set)
-            nodeID_name_labeldict.update(ownednodeID_name_labeldict)
-            nodeID_name_labeldict.update(usednodeID_name_labeldict)
-            edge_list.extend(ownededge_list)
-            for ele in usededge_list:
-                if ele not in edge_list:
-                    edge_list.append(ele)
-            edge_label_dict.update(ownededge_label_dict)
-            edge_label_dict.update(usededge_label_dict)
             
-            #Distinguishing relevant messages for each feature i.e. mapping each feature to its relevant messages
-            relCompID_list = self.feID_relCompID_dict[feature]
-            relCompNames_list = get_listnames_from_listIDs_fromdictwithmissingkeys(relCompID_list, nodeID_name_labeldict)
-            relMsgIDs_list = []
-            relMsgNames_list = []
-            for element in edge_list:
-                eachtuples_srcID = element[-3]
-                eachtuples_dstID = element[-2]
-                if eachtuples_dstID in relCompID_list or eachtuples_srcID in relCompID_list:
-                    relMsgID = element[-1]
-                    if relMsgID not in relMsgIDs_list:
-                        relMsgIDs_list.append(relMsgID)
             relMsgNames_list = get_listnames_from_listIDs(relMsgIDs_list, msgID_name_dict)
             print("\nFeature: ", feature_name, " relevant_lifelines: ", relCompNames_list, "relevant_msgs: ", relMsgNames_list)
             feID_relMsgIDslist_dict.update({feature: relMsgIDs_list}) #Map feature id to its relevant message ids
@@ -639,6 +659,7 @@ class InteractionAnalysis():
         self.secFeaturePkgID_list = secFeaturePkgID_list
         self.safFeature_pkg_list = safFeature_pkg_list
         self.relevantComponentID_set = relevantComponentID_set
+        self.shared_graph = None #multi directed graph of all features created once by the unified pipeline for all methods; if set, it is used instead of creating the graph again
     
     def get_relevant_lifelines(self, featurenodeIDs_set):
         "Identify which lifelines are safety relevant, security relevant and both safety and security relevant"
@@ -723,9 +744,8 @@ class InteractionAnalysis():
     def check_Inodes_relevance(self, Inodes_list, firstandlastnode_list):
         "check if any node in the given list of intermediate nodes (for a path) is either safety or security relevant; if at least one intermediate node is safety or security relevant, set the intermediate node (Inode) relevance flag to 0 i.e. ignore path"
         Inode_rel_flag = 1 #consider this path unless this flag is set to 0
-        relvComponentID_list = list(set(firstandlastnode_list).symmetric_difference(self.relevantComponentID_set))
         for element in Inodes_list:
-            if element in relvComponentID_list:
+            if (element in self.relevantComponentID_set) != (element in firstandlastnode_list): #element in the symmetric difference of the query nodes and the relevant components
                 Inode_rel_flag = 0 #ignore path because there exists atleast one intermediate node that is safety or security relevant
                 break
         return Inode_rel_flag
@@ -801,7 +821,7 @@ class InteractionAnalysis():
             perpath_FIs_list = get_itertoolsproductoflists(srcfeID_list, dstfeID_list)
         return perpath_FIs_list
     
-    def get_interaction_paths_by_query_graph(self, graph, graphquery_list, nodeID_name_dict, edgeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, depth):
+    def get_interaction_paths_by_query_graph(self, graph, graphquery_list, nodeID_name_dict, edgeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, depth, path_cache = None, graph_fingerprint = None):
         "Query the graph using each query in the query list; filter interaction paths that exhibit a chain of interactions"
         paths_counter = 0
         query_pripathfound_list = [] #collect queries for which atleast 1 primary path was found.
@@ -813,7 +833,11 @@ class InteractionAnalysis():
             src = value[0]
             dst = value[1]
             current_queryID_list = [src, dst]
-            for path in nx.all_simple_edge_paths(graph, source = src, target = dst, cutoff = depth): #query graph to find paths from source node to destination node
+            if path_cache is not None:
+                path_list = path_cache.get_or_compute(graph_fingerprint, src, dst, depth, "edge_paths", lambda: list(all_simple_edge_paths(graph, src, dst, depth)))
+            else:
+                path_list = all_simple_edge_paths(graph, src, dst, depth)
+            for path in path_list: #query graph to find paths from source node to destination node
                 pri_plus_sec_path_counter = pri_plus_sec_path_counter + 1
                 
                 path_name = self.get_path_name(path, nodeID_name_dict) #a function to get pathname for debugging/validating the path as primary (path without interaction chain) or secondary (path with interaction chain)
@@ -846,6 +870,78 @@ class InteractionAnalysis():
                 
         return primary_path_count, pri_plus_sec_path_counter, FIs_based_onRelvMsgandSWC_list, query_pripathfound_list
     
+    def get_collapsed_interaction_paths_by_query_graph(self, interaction_graph, path_counter, graphquery_list, nodeID_name_dict, edgeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, depth, path_cache = None, graph_fingerprint = None):
+        "Same outputs as get_interaction_paths_by_query_graph from the primary node paths of the collapsed graph and the path counter"
+        paths_counter = 0
+        query_pripathfound_list = [] #collect queries for which atleast 1 primary path was found.
+        FIs_based_onRelvMsgandSWC_list = [] #store FIs derived for paths that are considered; FIs are derived based on relevant messages; in case of missing relevant messages, FIs are derived based on relevant components
+        pri_plus_sec_path_counter = 0
+        primary_path_count = 0
+        
+        for index, value in enumerate(graphquery_list):
+            src = value[0]
+            dst = value[1]
+            current_queryID_list = [src, dst]
+            relevantInodeID_set = set(self.relevantComponentID_set) - set(current_queryID_list) #same relevant components as in check_Inodes_relevance
+            if path_cache is not None:
+                pri_plus_sec_path_counter = pri_plus_sec_path_counter + path_cache.get_or_compute(graph_fingerprint, src, dst, depth, "count", lambda: path_counter.count_paths(src, dst, depth))
+                nodepath_list = path_cache.get_or_compute(graph_fingerprint, src, dst, depth, "primary_node_paths/" + get_ids_fingerprint(self.relevantComponentID_set), lambda: list(interaction_graph.get_simple_node_paths(src, dst, depth, avoid_set = relevantInodeID_set)))
+            else:
+                pri_plus_sec_path_counter = pri_plus_sec_path_counter + path_counter.count_paths(src, dst, depth)
+                nodepath_list = interaction_graph.get_simple_node_paths(src, dst, depth, avoid_set = relevantInodeID_set)
+            primarygroup_list = [] #[(rank key, representative path)] of the groups of primary message paths of the current query
+            for nodepath in nodepath_list:
+                if len(nodepath) > 1:
+                    if value not in query_pripathfound_list:
+                        query_pripathfound_list.append(value)
+                primary_path_count = primary_path_count + interaction_graph.count_edge_paths(nodepath)
+                for rankkey, path, groupedpath_count in interaction_graph.get_endpoint_message_groups(nodepath):
+                    primarygroup_list.append((rankkey, path))
+            
+            primarygroup_list.sort(key = lambda element: element[0]) #networkx order of the first path of each group, which keeps the order in which the FIs are found
+            for rankkey, path in primarygroup_list:
+                ############### Retrieve FIs based on relevant messages and relevant software components##########
+                perpath_FIs_based_onRelvMsgandSWC_list = self.extract_FI_based_on_relvMsgs_and_SWC(path, src, dst, secnodeID_set, safnodeID_set, nodeID_name_dict)
+                for element in perpath_FIs_based_onRelvMsgandSWC_list:
+                    if element not in FIs_based_onRelvMsgandSWC_list:
+                        FIs_based_onRelvMsgandSWC_list.append(element)
+        return primary_path_count, pri_plus_sec_path_counter, FIs_based_onRelvMsgandSWC_list, query_pripathfound_list
+    
+    def get_interaction_paths_chunk(self, graph, path_counter, nodeID_name_dict, edgeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, depth, collapsed, path_cache, graph_fingerprint, graphquery_chunk_list):
+        "Outputs of the path search for a chunk of queries and the path cache update of the chunk"
+        path_cache_state = None if path_cache is None else path_cache.get_state()
+        if collapsed:
+            result_tuple = self.get_collapsed_interaction_paths_by_query_graph(graph, path_counter, graphquery_chunk_list, nodeID_name_dict, edgeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, depth, path_cache, graph_fingerprint)
+        else:
+            result_tuple = self.get_interaction_paths_by_query_graph(graph, graphquery_chunk_list, nodeID_name_dict, edgeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, depth, path_cache, graph_fingerprint)
+        return result_tuple, None if path_cache is None else path_cache.get_update(path_cache_state)
+    
+    def get_interaction_paths(self, graph, path_counter, graphquery_list, nodeID_name_dict, edgeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, depth, collapsed, path_cache = None, graph_fingerprint = None, workers = None):
+        "Primary path count, total path count, FIs and queries with a primary path of graphquery_list, in parallel with workers > 1"
+        if workers is None or workers <= 1 or len(graphquery_list) <= 1:
+            return self.get_interaction_paths_chunk(graph, path_counter, nodeID_name_dict, edgeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, depth, collapsed, path_cache, graph_fingerprint, graphquery_list)[0]
+        if isinstance(graph, CSRGraph):
+            result_iterator = iter_shared_graph_results(self.get_interaction_paths_chunk, graph, graphquery_list, workers, (path_counter, nodeID_name_dict, edgeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, depth, collapsed, path_cache, graph_fingerprint))
+        else:
+            result_iterator = iter_parallel_results(self.get_interaction_paths_chunk, split_task_list(graphquery_list, workers), workers, (graph, path_counter, nodeID_name_dict, edgeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, depth, collapsed, path_cache, graph_fingerprint))
+        primary_path_count = 0
+        pri_plus_sec_path_counter = 0
+        FIs_based_onRelvMsgandSWC_list = []
+        query_pripathfound_list = []
+        for result_tuple, path_cache_update in result_iterator:
+            chunk_primary_path_count, chunk_pri_plus_sec_path_counter, chunk_FIs_list, chunk_query_pripathfound_list = result_tuple
+            primary_path_count = primary_path_count + chunk_primary_path_count
+            pri_plus_sec_path_counter = pri_plus_sec_path_counter + chunk_pri_plus_sec_path_counter
+            for element in chunk_FIs_list:
+                if element not in FIs_based_onRelvMsgandSWC_list:
+                    FIs_based_onRelvMsgandSWC_list.append(element)
+            for query in chunk_query_pripathfound_list:
+                if query not in query_pripathfound_list:
+                    query_pripathfound_list.append(query)
+            if path_cache_update is not None:
+                path_cache.merge_update(path_cache_update)
+        return primary_path_count, pri_plus_sec_path_counter, FIs_based_onRelvMsgandSWC_list, query_pripathfound_list
+    
     def get_nodes_edges_of_all_saf_and_sec_features(self):
         "store nodes of all safety and security features in a single data struct; do the same for edges"
         nodeIDs_set = set()
@@ -868,7 +964,7 @@ class InteractionAnalysis():
         #print("\nDebug! edgeID_name_dict: ", edgeID_name_dict)
         return nodeIDs_set, nodeID_name_dict, edgeIDs_list, edgeID_name_dict
     
-    def get_interaction_list(self, depth):
+    def get_interaction_list(self, depth, collapsed = True, backend = "networkx", path_cache = None, workers = None):
         "Get a list of feature interactions between safety and security features"
         safFe_interactingSecFe_list = []
         secFe_interactingSafFe_list = []
@@ -886,8 +982,11 @@ class InteractionAnalysis():
         secnodeID_set, safnodeID_set, secsafnodeID_set, nonrelnodeID_set = self.get_relevant_lifelines(nodeIDs_set) #identify safety relevant, security relevant, and both safety and security relevant lifelines
         print("\nDebug! Relevant lifelines for .sd of all saf-&sec features! secnodeID_no: ", len(secnodeID_set), ", safnodeID_no: ", len(safnodeID_set), ", secsafnodeID_no: ", len(secsafnodeID_set))
         
-        print("\nCreating nx multi directed graph ...")
-        featureseqdiags_graph = create_multidi_graph(nodeIDs_set, edgeIDs_list)
+        if self.shared_graph is not None:
+            featureseqdiags_graph = self.shared_graph
+        else:
+            print("\nCreating nx multi directed graph ...")
+            featureseqdiags_graph = create_multidi_graph(nodeIDs_set, edgeIDs_list)
         
         print("\nGenerating graph query list ...")
         LLcmb_SafToSec_querylist, LLcmb_SecToSaf_querylist = self.get_graphquery_list(secnodeID_set, safnodeID_set, secsafnodeID_set)
@@ -900,15 +999,34 @@ class InteractionAnalysis():
             if query not in allQuery_list:
                 allQuery_list.append(query)
         
+        #drop the queries whose source cannot reach the destination within the cutoff before any path is enumerated
+        interaction_graph = create_interaction_graph_from_nx(featureseqdiags_graph)
+        graph_reachability = ReachabilityIndex(interaction_graph)
+        reachable_SafToSec_querylist, pruned_SafToSec_querylist = graph_reachability.prune_queries(LLcmb_SafToSec_querylist, depth)
+        reachable_SecToSaf_querylist, pruned_SecToSaf_querylist = graph_reachability.prune_queries(LLcmb_SecToSaf_querylist, depth)
+        print("\nDebug! Reachability prefilter pruned ", len(pruned_SafToSec_querylist), " out of ", len(LLcmb_SafToSec_querylist), " safety to security queries and ", len(pruned_SecToSaf_querylist), " out of ", len(LLcmb_SecToSaf_querylist), " security to safety queries (no path within depth: ", depth, ")")
+        
+        path_counter = PathCounter(interaction_graph, graph_reachability)
+        if collapsed or backend == "networkx":
+            edgepath_graph = featureseqdiags_graph
+        elif backend == "csr":
+            edgepath_graph = create_csr_graph_from_nx(featureseqdiags_graph)
+        else:
+            print("Warning! Unknown path backend: ", backend, ", networkx is used!")
+            edgepath_graph = featureseqdiags_graph
+        graph_fingerprint = None
+        if path_cache is not None:
+            graph_fingerprint = get_graph_fingerprint(featureseqdiags_graph)
+        
         print("\nQuerying graph to get interaction paths from safety to security...")
-        SafToSec_paths_counter, SafToSec_pri_plus_sec_path_counter, SafToSecFIs_based_onRelvMsgandSWC_list, querySafToSec_pripathfound_list = self.get_interaction_paths_by_query_graph(featureseqdiags_graph, LLcmb_SafToSec_querylist, nodeID_name_dict, edgeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, depth)
+        SafToSec_paths_counter, SafToSec_pri_plus_sec_path_counter, SafToSecFIs_based_onRelvMsgandSWC_list, querySafToSec_pripathfound_list = self.get_interaction_paths(interaction_graph if collapsed else edgepath_graph, path_counter, reachable_SafToSec_querylist, nodeID_name_dict, edgeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, depth, collapsed, path_cache, graph_fingerprint, workers)
         
         for query in querySafToSec_pripathfound_list:
             if query not in allQuery_pripathfound_list:
                 allQuery_pripathfound_list.append(query)
         
         print("\nQuerying graph to get interaction paths from security to safety...")
-        SecToSaf_paths_counter, SecToSaf_pri_plus_sec_path_counter, SecToSafFIs_based_onRelvMsgandSWC_list, querySecToSaf_pripathfound_list = self.get_interaction_paths_by_query_graph(featureseqdiags_graph, LLcmb_SecToSaf_querylist, nodeID_name_dict, edgeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, depth)
+        SecToSaf_paths_counter, SecToSaf_pri_plus_sec_path_counter, SecToSafFIs_based_onRelvMsgandSWC_list, querySecToSaf_pripathfound_list = self.get_interaction_paths(interaction_graph if collapsed else edgepath_graph, path_counter, reachable_SecToSaf_querylist, nodeID_name_dict, edgeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, depth, collapsed, path_cache, graph_fingerprint, workers)
         
         for query in querySecToSaf_pripathfound_list:
             if query not in allQuery_pripathfound_list:
@@ -933,6 +1051,10 @@ class InteractionAnalysis():
         create_table_for_interactingfeatures(pri_FInames_RelvMsgandSWC_list)
         
         print("\nDebug! Total_pri_and_sec_paths: ", pri_plus_sec_interac_paths, " total_pri_paths: ", interaction_paths_that_passedFilter, "\nFIs_basedonRelvMsg&SWC_due_to_pri_paths: ", len(SecToSafFIs_based_onRelvMsgandSWC_list))
+        if path_cache is not None:
+            path_cache.print_stats()
+            path_cache.save()
+        return pri_FInames_RelvMsgandSWC_list
 
 def main():
     msgID_name_dict = {}
@@ -968,11 +1090,11 @@ def main():
     
     print("\nAnalyzing sequence diagrams of security features to get messages and lifelines")
     GSecSDA = GetBehavioralElements(secFeaturePkgID_list, secFeaturePkgID_name_dict, secComponentID_set, secFeID_compID_dict)
-    secFeID_nodeIDset_dict, secFeID_nodeIDnamedict_dict, secFeID_edgeIDlist_dict, secFeID_edgeIDnamedict_dict, secMsgID_name_dict, secMsgID_msgSort_dict, secFeID_relMsgIDslist_dict, secFeID_msgIDnamedict_dict = GSecSDA.extract_lifelines_and_messages()
+    secFeID_nodeIDset_dict, secFeID_nodeIDnamedict_dict, secFeID_edgeIDlist_dict, secFeID_edgeIDnamedict_dict, secMsgID_name_dict, secMsgID_msgSort_dict, secFeID_relMsgIDslist_dict, secFeID_msgIDnamedict_dict = GSecSDA.extract_lifelines_and_messages(parallel_workers)
     
     print("\nAnalyzing sequence diagrams of safety features to get messages and lifelines")
     GSafSDA = GetBehavioralElements(safFeature_pkg_list, safFeaturePkgID_name_dict, safComponentID_set, safFeID_compID_dict)
-    safFeID_nodeIDset_dict, safFeID_nodeIDnamedict_dict, safFeID_edgeIDlist_dict, safFeID_edgeIDnamedict_dict, safMsgID_name_dict, safMsgID_msgSort_dict, safFeID_relMsgIDslist_dict, safFeID_msgIDnamedict_dict = GSafSDA.extract_lifelines_and_messages()
+    safFeID_nodeIDset_dict, safFeID_nodeIDnamedict_dict, safFeID_edgeIDlist_dict, safFeID_edgeIDnamedict_dict, safMsgID_name_dict, safMsgID_msgSort_dict, safFeID_relMsgIDslist_dict, safFeID_msgIDnamedict_dict = GSafSDA.extract_lifelines_and_messages(parallel_workers)
     
     msgID_name_dict.update(secMsgID_name_dict)
     msgID_name_dict.update(safMsgID_name_dict)
@@ -1002,7 +1124,7 @@ def main():
     
     print("Performing interaction analysis of security and safety features")
     GINA = InteractionAnalysis(featurePkgID_list, featurePkgID_name_dict, secComponentID_set, safComponentID_set, secsafComponentID_set, featureID_nodeIDset_dict, featureID_nodeIDnamedict_dict, featureID_edgeIDlist_dict, featureID_edgeIDnamedict_dict, secFeID_compID_dict, safFeID_compID_dict, msgID_name_dict, secComponentID_name_dict, safComponentID_name_dict, msgID_msgSort_dict, feID_relMsgIDslist_dict, feID_compID_dict, secFeaturePkgID_list, safFeature_pkg_list, relevantComponentID_set)
-    GINA.get_interaction_list(depth)
+    GINA.get_interaction_list(depth, collapsed_path_search, path_backend, PathQueryCache(path_cache_size, path_cache_file, path_cache_max_paths), parallel_workers)
     
     stop = timeit.default_timer()
     print('Time: ', stop - start)
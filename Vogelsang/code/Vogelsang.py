@@ -1,10 +1,13 @@
 # Copyright (c) 2024 Robert Bosch GmbH
 # SPDX-License-Identifier: MIT
 
+import os
 import sys
 from lib import *
 import networkx as nx
 from tabulate import tabulate
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'path_engine', 'code'))
+from path_engine import get_first_message_dict
 
 ######################################Configurable inputs#####################################
 #list of security features
@@ -154,7 +157,8 @@ class ExtractFeatureDependencies():
         self.componentID_name_dict = componentID_name_dict
         self.messageID_name_dict = messageID_name_dict
     
-    def get_interaction_paths(self, feature_combID, graphquery_list, graph):
+    def get_interaction_paths(self, feature_combID, graphquery_list, graph, firstmsg_dict):
+        "For each query, look up the first message from the source to the destination component in networkx order"
         pathIDs_list = []
         pathNames_list = []
         queryPathsFoundFeComb_list = []
@@ -165,7 +169,8 @@ class ExtractFeatureDependencies():
             eachQueryPathNames_list = []
             #print("src in G: ", graph.has_node(src), " dst in G: ", graph.has_node(dst))
             if graph.has_node(src) is True and graph.has_node(dst) is True:
-                for path in nx.all_simple_edge_paths(graph, source = src, target = dst, cutoff = 1): #query graph to find paths from source node to destination node
+                if (src, dst) in firstmsg_dict: #direct edge lookup instead of enumerating the paths with cutoff 1 and keeping the first one
+                    path = [(src, dst, firstmsg_dict[(src, dst)])]
                     eachsubpathNames_list = []
                     eachQueryPathIDs_list.append(path)
                     #print("type(path): ", type(path), " path: ", path)
@@ -178,9 +183,7 @@ class ExtractFeatureDependencies():
                         eachsubpathNames_list.append(subpathname_tuple)
                         #print("type(subpath): ", type(subpath), " subpath: ", subpath, " subpathname_tuple: ", subpathname_tuple)
                     eachQueryPathNames_list.append(eachsubpathNames_list)
-                    if len(path) != 0:
-                        print("Path for queryID:", value, " queryName: ", [self.componentID_name_dict[src], self.componentID_name_dict[dst]], " is: ", eachsubpathNames_list)
-                        break
+                    print("Path for queryID:", value, " queryName: ", [self.componentID_name_dict[src], self.componentID_name_dict[dst]], " is: ", eachsubpathNames_list)
                 if len(eachQueryPathIDs_list) != 0:
                     if value not in queryPathsFoundFeComb_list:
                         queryPathsFoundFeComb_list.append(value) #Store the query (for the selected feature combination) for which atleast one interaction path was found
@@ -218,8 +221,12 @@ class ExtractFeatureDependencies():
         print("Debug! len(featureIDcomb_list): ", len(featureIDcomb_list), " featureIDcomb_list: ", featureIDcomb_list)
         
         all_queries_list = []
+        allQueries_set = set() #membership checks for all_queries_list
         queryIDsPathsFound_list = []
+        queryIDsPathsFound_set = set() #membership checks for queryIDsPathsFound_list
         feComb_pathsfound_list = []
+        firstmsg_dict = get_first_message_dict(self.SWCInterac_graph) #component pairs exchanging a message with their first message, computed in one pass for all feature combinations
+        prunedQuery_count = 0
         for element in featureIDcomb_list:
             query_list = []
             pathIDs_list = []
@@ -253,14 +260,16 @@ class ExtractFeatureDependencies():
                 querynames_list = []
                 #creating a list of query names for debugging and store the queries generated per feature combination in a single list called all_queries_list
                 for query in query_list:
-                    if query not in all_queries_list:
+                    if query not in allQueries_set:
+                        allQueries_set.add(query)
                         all_queries_list.append(query)
                     queryname_list = get_listnames_from_listIDs(query, self.componentID_name_dict)
                     if len(queryname_list) != 0:
                         querynames_list.append(queryname_list)
                 print("Generated query_list! len(query_list): ", len(query_list), " queryIDs_list: ", query_list, "\nqueryNames_list: ", querynames_list)
                 print("Beginning search for the interaction paths for this query list...")
-                pathIDs_list, pathNames_list, queryPathsFoundFeComb_list = self.get_interaction_paths(element, query_list, self.SWCInterac_graph)
+                pathIDs_list, pathNames_list, queryPathsFoundFeComb_list = self.get_interaction_paths(element, query_list, self.SWCInterac_graph, firstmsg_dict)
+                prunedQuery_count = prunedQuery_count + len(query_list) - len(queryPathsFoundFeComb_list)
                 #print("queryIDs_list: ", query_list, " queryNames_list: ", querynames_list)
                 #print("pathIDs_list: ", pathIDs_list)
             
@@ -274,9 +283,11 @@ class ExtractFeatureDependencies():
                     queryname_list = get_listnames_from_listIDs(query, self.componentID_name_dict)
                     if len(queryname_list) != 0:
                         queryNamesPathsFound_list.append(queryname_list)
-                    if query not in queryIDsPathsFound_list:
+                    if query not in queryIDsPathsFound_set:
+                        queryIDsPathsFound_set.add(query)
                         queryIDsPathsFound_list.append(query)
                 print("Summary: \nlen(queryPathsFoundFeComb_list): ", len(queryPathsFoundFeComb_list), " queryPathsFoundFeComb_list: ", queryPathsFoundFeComb_list, " queryNamesPathsFound_list: ", queryNamesPathsFound_list, "\npathIDs_list: ", pathIDs_list, "\npathNames_list: ", pathNames_list, "\nFI: ", get_listnames_from_listIDs(list(element), self.featurePkgID_name_dict), "\n")
+        print("Debug! Direct edge lookup found no message for ", prunedQuery_count, " queries in total for ", len(featureIDcomb_list), " feature combinations")
         return FI_list, all_queries_list, queryIDsPathsFound_list, feComb_pathsfound_list
 
 def main():
@@ -19,6 +19,8 @@ import sys
 dirname = os.path.dirname(__file__)
 sys.path.append(os.path.join(dirname, '..', 'lib'))
 from XIFASST_lib import *
+sys.path.append(os.path.join(dirname, '..', '..', 'path_engine', 'code'))
+from path_engine import ReachabilityIndex, PathCounter, create_interaction_graph_from_nx, create_csr_graph_from_nx, all_simple_edge_paths, write_result_bundle, write_interaction_stream, EnumerationBudget, IncrementalPathIndex, get_incidence_matrix, get_group_reach_matrix, split_task_list, iter_parallel_results, CSRGraph, iter_shared_graph_results, SpoolWorkQueue, run_spool_worker, register_spool_task, get_graph_fingerprint
 
 ######################################Configurable inputs#####################################
 #Configurable inputs for security features
@@ -38,8 +40,34 @@ secComponentID_name_dict = {} #Specify a dict in which each key is the XMI ID of
 
 #For each safety relevant component ID, configure its name. Note that alternatively, the names can be automatically extracted from the architecture model
 safComponentID_name_dict = {} #Specify a dict in which each key is the XMI ID of a safety relevant component and the value corresponding to the key is the name of the safety relevant component
+
+#Configure a multi-depth sweep: the paths are enumerated once at the largest depth and summarized for each depth of the list
+sweep_depth_list = [] #Specify the cutoffs of the sweep e.g. [1, 2, 4] (None stands for an unbounded cutoff); if the list is empty, a single analysis with the depth configured in main() is performed
+sweep_bundle_file = os.path.join(dirname, '..', 'build', 'XIFASST_sweep_{}.json'.format(time.strftime("%Y%m%d_%H%M%S"))) #result bundle of the sweep, can be loaded by the methods comparison
+
+#Configure the path search
+collapsed_path_search = True #if True, simple paths are searched between components (parallel messages form one edge) and message-level paths are only expanded where needed; if False, every message-level path is enumerated with networkx (reference implementation)
+bidirectional_path_search = False #if True (with the collapsed search), paths are enumerated meet-in-the-middle with the same results, e.g. for depths of 4 and more on graphs with high fan-out components
+path_backend = "networkx" #backend of the message-level path enumeration (used if collapsed_path_search is False): "networkx" (reference backend) or "csr" (numpy CSR arrays, same paths in the same order)
+count_only_mode = False #if True, only the numbers of all, primary and secondary paths are computed (for the depth configured in main() or each depth of sweep_depth_list) without enumerating the paths or extracting FIs
+enumeration_budget_dict = {"max_paths": None, "max_expanded_nodes": None, "max_seconds": None, "run_max_paths": None, "run_max_expanded_nodes": None, "run_max_seconds": None} #budgets of the path enumeration per query and per run (None means no limit): maximum number of paths (node paths for the collapsed search), of expanded nodes and of wall-clock seconds
+parallel_workers = None #number of worker processes e.g. os.cpu_count() for the feature extraction and the queries; None or 1 processes the features and queries one after the other
+depth_plan_mode = False #if True, only the depth planning report (the minimum depth of each query and the number of queries reachable per depth) is computed, without enumerating any path
+feature_matrix_mode = False #if True, only the feature x feature interaction matrix within the depth configured in main() is computed, without enumerating any path
+feature_evidence_pair_list = [] #Specify pairs of feature XMI IDs e.g. [[secFeatureID, safFeatureID]] for which the feature matrix mode also enumerates the interaction paths (only for the pairs flagged by the matrix) as detailed evidence
+model_revision_list = [] #Specify model revisions for the dynamic mode, applied one after the other e.g. [{"added_messages": {(srcID, dstID, msgID): 'msgName'}, "removed_messages": [(srcID, dstID, msgID)], "added_components": {componentID: 'componentName'}, "removed_components": [componentID], "component_features": {componentID: [featureID]}, "message_features": {msgID: [featureID]}}], where the features are those for which the component or message is relevant. If the list is empty, no dynamic analysis is performed
+work_spool_dir = None #Specify a spool directory e.g. os.path.join(dirname, '..', 'build', 'spool') shared with worker processes, also on other hosts, to process the queries as work units of the spool instead of the process pool; it must only be writable by trusted users. None uses no spool
+spool_shard_size = 16 #number of queries per work unit of the spool
+spool_local_workers = 0 #number of worker processes started on this host for the work units of the spool e.g. os.cpu_count(); 0 relies on workers started separately (see spool_worker_mode)
+spool_worker_mode = False #if True, main() runs a worker of the spool in work_spool_dir instead of an analysis; start it with the same code, library, input files and configurable inputs as the analysis
+spool_worker_idle_seconds = None #a worker of spool_worker_mode stops after this number of seconds without work; None waits for work forever
+interaction_stream_file = None #Specify a file e.g. os.path.join(dirname, '..', 'build', 'XIFASST_stream.jsonl') to stream the classified interaction paths as JSON lines instead of the summary; None performs the summarized analysis
 ##############################################################################################
 nextiterationcheck = object()
+SEC_RELEVANT = 1 #relevance bits of a component: security relevant
+SAF_RELEVANT = 2 #safety relevant
+SECSAF_RELEVANT = 4 #safety and security relevant
+INODE_RELEVANT = 8 #component of relevantComponentID_set, i.e. an intermediate node that makes a path a secondary path candidate
 
 class GetSecurityFeatures():
     "Get a list of all security features"
@@ -517,7 +545,76 @@ class GetBehavioralElements():
             sequenceID_name_dict.update(seqID_name_dict1)
         return sequenceID_set, sequenceID_name_dict, node_set, nodeID_name_labeldict, edge_list, edge_label_dict
     
-    def extract_lifelines_and_messages(self):
+    def extract_feature_elements(self, feature):
+        "Extract the lifelines, the owned and used messages and the relevant messages of a feature"
+        feature_name = self.featurePkgID_name_dict[feature]
+        msguncoveredintupleID_list = []
+        msguncoveredintupleName_list = []
+        uncoveredMsgintupleID_list = []
+        uncoveredMsgintupleName_list = []
+        
+        lifeline_set = set()
+        classifierID_set = set()
+        classifierID_name_dict = {}
+        mappedLLID_classifierID_dict = {}
+        mappedOccurSpecID_lifelineID_dict = {}
+        nodeID_set = set()
+        nodeID_name_labeldict = {}
+        edge_list = []
+        edge_label_dict = {}
+        
+        #extracting lifelines of each feature
+        lifeline_set, classifierID_set, classifierID_name_dict, mappedLLID_classifierID_dict, SeqOccurSpecID_set, mappedOccurSpecID_lifelineID_dict, refSD_dependentFeID_dict, instSpecID_set, mappedISID_classifierID_dict = self.extract_lifelines(feature, 2) #search will be performed in the specified input xmi file
+        classifierNames_list = [value for value in classifierID_name_dict.values()]
+        #print("\nDebug! Feature: ", feature_name, " len(lifelines): ", len(classifierID_set), " lifelines: ", classifierID_name_dict)
+        
+        #extracting owned messages of each feature
+        ownedMsgID_list, ownedMsgID_name_dict, ownednode_set, ownednodeID_name_labeldict, ownededge_list, ownededge_tuple, ownededge_label_dict, feID_dependentFeID_dict, msgID_msgSort_dict = self.extract_owned_messages(feature, SeqOccurSpecID_set, mappedOccurSpecID_lifelineID_dict, mappedLLID_classifierID_dict, classifierID_name_dict, refSD_dependentFeID_dict, 2) #search will be performed in the specified input xmi file; for our case study, it is input xmi file 2
+        
+        #ownedMsgname_list = [value for value in ownedMsgID_name_dict.values()]
+        
+        #validating tuples obtained from extracted owned messages
+        msguncoveredintupleID_list, msguncoveredintupleName_list = self.validate_msgtuples(ownededge_list, ownedMsgID_list, ownedMsgID_name_dict)
+        
+        #print("\nDebug! Feature: ", feature_name, " owned_message_no: ", len(ownedMsgID_list), " ownedMsg: ", ownedMsgID_name_dict)
+        #print("\nDebug! Feature: ", feature_name, " owned_tuple_no: ", len(ownededge_list), " ownedMsg: ", ownededge_label_dict)
+        print("\nDebug! Feature: ", feature_name, " uncoveredMsgInTuples_no : ", len(msguncoveredintupleID_list), ", uncoveredMsgInTupleIDs: ", msguncoveredintupleID_list, " uncoveredMsgInTuples: ", msguncoveredintupleName_list)
+        
+        #extracting used messages of each feature
+        usedMsgID_set, usedMsgID_name_dict, usednode_set, usednodeID_name_labeldict, usededge_list, usededge_label_dict = self.extract_used_messages(ownedMsgID_list, instSpecID_set, mappedISID_classifierID_dict, classifierID_name_dict, 3) #search will be performed in the specified input xmi file; for our case study, it is input xmi file 3
+        
+        #validating tuples obtained from extracted used messages
+        uncoveredMsgintupleID_list, uncoveredMsgintupleName_list = self.validate_msgtuples(usededge_list, list(usedMsgID_set), usedMsgID_name_dict)
+        
+        #print("\nDebug! Feature: ", feature_name, " used_message_no: ", len(usedMsgID_set), " usedMsg: ", usedMsgID_name_dict)
+        #print("\nDebug! Feature: ", feature_name, " used_tuple_no: ", len(usededge_list), " usedTuple_list: ", usededge_list, " usedTuple_dict: ", usededge_label_dict)
+        print("\nDebug! Feature: ", feature_name, " uncoveredMsgInTuples_no : ", len(uncoveredMsgintupleID_list), ", uncoveredMsgInTupleIDs: ", uncoveredMsgintupleID_list, " uncoveredMsgInTuples: ", uncoveredMsgintupleName_list)
+        
+        nodeID_set.update(ownednode_set)
+        nodeID_set.update(usednode_set)
+        nodeID_name_labeldict.update(ownednodeID_name_labeldict)
+        nodeID_name_labeldict.update(usednodeID_name_labeldict)
+        edge_list.extend(ownededge_list)
+        for ele in usededge_list:
+            if ele not in edge_list:
+                edge_list.append(ele)
+        edge_label_dict.update(ownededge_label_dict)
+        edge_label_dict.update(usededge_label_dict)
+        
+        #Distinguishing relevant messages for each feature i.e. mapping each feature to its relevant messages
+        relCompID_list = self.feID_relCompID_dict[feature]
+        relCompNames_list = get_listnames_from_listIDs_fromdictwithmissingkeys(relCompID_list, nodeID_name_labeldict)
+        relMsgIDs_list = []
+        for element in edge_list:
+            eachtuples_srcID = element[-3]
+            eachtuples_dstID = element[-2]
+            if eachtuples_dstID in relCompID_list or eachtuples_srcID in relCompID_list:
+                relMsgID = element[-1]
+                if relMsgID not in relMsgIDs_list:
+                    relMsgIDs_list.append(relMsgID)
+        return feID_dependentFeID_dict, msgID_msgSort_dict, ownedMsgID_name_dict, usedMsgID_name_dict, nodeID_set, nodeID_name_labeldict, edge_list, edge_label_dict, relCompNames_list, relMsgIDs_list
+    
+    def extract_lifelines_and_messages(self, workers = None):
         "For each feature being analyzed, extract messages. Extract the lifelines involved in the message exchange."
         feID_dependentFeID_dict = {}
         allSD_feID_dependentFeID_dict = {'feature':'interacting_feature'}
@@ -532,77 +629,18 @@ class GetBehavioralElements():
         msgID_name_dict = {}
         feGroup_msgID_msgSort_dict = {}
         
-        for feature in self.featurePkgID_list:
+        if workers is None or workers <= 1 or len(self.featurePkgID_list) <= 1:
+            feature_element_iterator = map(self.extract_feature_elements, self.featurePkgID_list)
+        else:
+            feature_element_iterator = iter_parallel_results(self.extract_feature_elements, self.featurePkgID_list, workers)
+        for feature, feature_element_tuple in zip(self.featurePkgID_list, feature_element_iterator):
+            feID_dependentFeID_dict, msgID_msgSort_dict, ownedMsgID_name_dict, usedMsgID_name_dict, nodeID_set, nodeID_name_labeldict, edge_list, edge_label_dict, relCompNames_list, relMsgIDs_list = feature_element_tuple
             feature_name = self.featurePkgID_name_dict[feature]
-            msguncoveredintupleID_list = []
-            msguncoveredintupleName_list = []
-            uncoveredMsgintupleID_list = []
-            uncoveredMsgintupleName_list = []
-            
-            lifeline_set = set()
-            classifierID_set = set()
-            classifierID_name_dict = {}
-            mappedLLID_classifierID_dict = {}
-            mappedOccurSpecID_lifelineID_dict = {}
-            nodeID_set = set()
-            nodeID_name_labeldict = {}
-            edge_list = []
-            edge_label_dict = {}
-            
-            #extracting lifelines of each feature
-            lifeline_set, classifierID_set, classifierID_name_dict, mappedLLID_classifierID_dict, SeqOccurSpecID_set, mappedOccurSpecID_lifelineID_dict, refSD_dependentFeID_dict, instSpecID_set, mappedISID_classifierID_dict = self.extract_lifelines(feature, 2) #search will be performed in the specified input xmi file
-            classifierNames_list = [value for value in classifierID_name_dict.values()]
-            #print("\nDebug! Feature: ", feature_name, " len(lifelines): ", len(classifierID_set), " lifelines: ", classifierID_name_dict)
-            
-            #extracting owned messages of each feature
-            ownedMsgID_list, ownedMsgID_name_dict, ownednode_set, ownednodeID_name_labeldict, ownededge_list, ownededge_tuple, ownededge_label_dict, feID_dependentFeID_dict, msgID_msgSort_dict = self.extract_owned_messages(feature, SeqOccurSpecID_set, mappedOccurSpecID_lifelineID_dict, mappedLLID_classifierID_dict, classifierID_name_dict, refSD_dependentFeID_dict, 2) #search will be performed in the specified input xmi file; for our case study, it is input xmi file 2
-            
-            #ownedMsgname_list = [value for value in ownedMsgID_name_dict.values()]
             allSD_feID_dependentFeID_dict.update(feID_dependentFeID_dict)
             feGroup_msgID_msgSort_dict.update(msgID_msgSort_dict)
-            
-            #validating tuples obtained from extracted owned messages
-            msguncoveredintupleID_list, msguncoveredintupleName_list = self.validate_msgtuples(ownededge_list, ownedMsgID_list, ownedMsgID_name_dict)
-            
-            #print("\nDebug! Feature: ", feature_name, " owned_message_no: ", len(ownedMsgID_list), " ownedMsg: ", ownedMsgID_name_dict)
-            #print("\nDebug! Feature: ", feature_name, " owned_tuple_no: ", len(ownededge_list), " ownedMsg: ", ownededge_label_dict)
-            print("\nDebug! Feature: ", feature_name, " uncoveredMsgInTuples_no : ", len(msguncoveredintupleID_list), ", uncoveredMsgInTupleIDs: ", msguncoveredintupleID_list, " uncoveredMsgInTuples: ", msguncoveredintupleName_list)
-            
-            #extracting used messages of each feature
-            usedMsgID_set, usedMsgID_name_dict, usednode_set, usednodeID_name_labeldict, usededge_list, usededge_label_dict = self.extract_used_messages(ownedMsgID_list, instSpecID_set, mappedISID_classifierID_dict, classifierID_name_dict, 3) #search will be performed in the specified input xmi file; for our case study, it is input xmi file 3
-            
-            #validating tuples obtained from extracted used messages
-            uncoveredMsgintupleID_list, uncoveredMsgintupleName_list = self.validate_msgtuples(usededge_list, list(usedMsgID_set), usedMsgID_name_dict)
-            
-            #print("\nDebug! Feature: ", feature_name, " used_message_no: ", len(usedMsgID_set), " usedMsg: ", usedMsgID_name_dict)
-            #print("\nDebug! Feature: ", feature_name, " used_tuple_no: ", len(usededge_list), " usedTuple_list: ", usededge_list, " usedTuple_dict: ", usededge_label_dict)
-            print("\nDebug! Feature: ", feature_name, " uncoveredMsgInTuples_no : ", len(uncoveredMsgintupleID_list), ", uncoveredMsgInTupleIDs: ", uncoveredMsgintupleID_list, " uncoveredMsgInTuples: ", uncoveredMsgintupleName_list)
-            
             msgID_name_dict.update(ownedMsgID_name_dict)
             msgID_name_dict.update(usedMsgID_name_dict)
-            nodeID_set.update(ownednode_set)
-            nodeID_set.update(usednode_set)
-            nodeID_name_labeldict.update(ownednodeID_name_labeldict)
-            nodeID_name_labeldict.update(usednodeID_name_labeldict)
-            edge_list.extend(ownededge_list)
-            for ele in usededge_list:
-                if ele not in edge_list:
-                    edge_list.append(ele)
-            edge_label_dict.update(ownededge_label_dict)
-            edge_label_dict.update(usededge_label_dict)
             
-            #Distinguishing relevant messages for each feature i.e. mapping each feature to its relevant messages
-            relCompID_list = self.feID_relCompID_dict[feature]
-            relCompNames_list = get_listnames_from_listIDs_fromdictwithmissingkeys(relCompID_list, nodeID_name_labeldict)
-            relMsgIDs_list = []
-            relMsgNames_list = []
-            for element in edge_list:
-                eachtuples_srcID = element[-3]
-                eachtuples_dstID = element[-2]
-                if eachtuples_dstID in relCompID_list or eachtuples_srcID in relCompID_list:
-                    relMsgID = element[-1]
-                    if relMsgID not in relMsgIDs_list:
-                        relMsgIDs_list.append(relMsgID)
             relMsgNames_list = get_listnames_from_listIDs(relMsgIDs_list, msgID_name_dict)
             print("\nFeature: ", feature_name, " relevant_lifelines: ", relCompNames_list, "relevant_msgs: ", relMsgNames_list)
             feID_relMsgIDslist_dict.update({feature: relMsgIDs_list}) #Map feature id to its relevant message ids
@@ -641,6 +679,95 @@ class InteractionAnalysis():
         self.secFeaturePkgID_list = secFeaturePkgID_list
         self.safFeature_pkg_list = safFeature_pkg_list
         self.relevantComponentID_set = relevantComponentID_set
+        self.featureID_bit_dict = {featureID: 1 << index for index, featureID in enumerate(self.feID_compID_dict)} #bit of each feature in a feature bitset
+        self.componentID_relevance_dict, self.componentID_featureIDs_dict, self.componentID_featurebits_dict = self.get_component_bitmasks()
+        self.msgID_relfeatureIDs_dict = self.get_message_featureIDs_dict()
+        self.dynamic_dict = None #state of the dynamic mode (graph, queries, relevant lifelines, names, search settings and IncrementalPathIndex), see get_incremental_interaction_list
+        self.shared_graph = None #multi directed graph of all features created once by the unified pipeline for all methods; if set, it is used instead of creating the graph again
+        self.work_queue = None #SpoolWorkQueue of the spool workers; if set, the queries are processed by the workers of the spool (see get_query_record_list)
+        self.iterator_type = 2 #input file of the model the features were extracted from (see ingest_model); the spool workers rebuild the analysis from it
+        self.graph_fingerprint = None #fingerprint of the graph of the analysis, set for the spool workers (see get_query_record_list)
+    
+    def get_component_bitmasks(self):
+        "Relevance bitmask, features and feature bitset of each component"
+        componentID_relevance_dict = {}
+        for relevance_bit, componentID_set in ((SEC_RELEVANT, self.secComponentID_set), (SAF_RELEVANT, self.safComponentID_set), (SECSAF_RELEVANT, self.secsafComponentID_set), (INODE_RELEVANT, self.relevantComponentID_set)):
+            for componentID in componentID_set:
+                componentID_relevance_dict[componentID] = componentID_relevance_dict.get(componentID, 0) | relevance_bit
+        componentID_featureIDs_dict = {}
+        componentID_featurebits_dict = {}
+        for featureID, componentID_list in self.feID_compID_dict.items():
+            for componentID in componentID_list:
+                featurebits = componentID_featurebits_dict.get(componentID, 0)
+                if featurebits & self.featureID_bit_dict[featureID] == 0:
+                    componentID_featureIDs_dict.setdefault(componentID, []).append(featureID)
+                    componentID_featurebits_dict[componentID] = featurebits | self.featureID_bit_dict[featureID]
+        return componentID_relevance_dict, componentID_featureIDs_dict, componentID_featurebits_dict
+    
+    def get_message_featureIDs_dict(self):
+        "Map each relevant message to the features for which it is relevant"
+        msgID_relfeatureIDs_dict = {}
+        for featureID, relMsgIDs_list in self.feID_relMsgIDslist_dict.items():
+            for msgID in relMsgIDs_list:
+                featureIDs_list = msgID_relfeatureIDs_dict.setdefault(msgID, [])
+                if featureID not in featureIDs_list:
+                    featureIDs_list.append(featureID)
+        return msgID_relfeatureIDs_dict
+    
+    def revise_feature_maps(self, component_featureIDs_dict, message_featureIDs_dict, removed_component_list):
+        "Dynamic mode: apply the feature relevance of a model revision to the relevance and feature maps"
+        old_maps_tuple = (self.componentID_relevance_dict, self.componentID_featureIDs_dict, self.msgID_relfeatureIDs_dict)
+        self.secFeID_compID_dict = {featureID: [componentID for componentID in componentID_list if componentID not in removed_component_list] for featureID, componentID_list in self.secFeID_compID_dict.items()}
+        self.safFeID_compID_dict = {featureID: [componentID for componentID in componentID_list if componentID not in removed_component_list] for featureID, componentID_list in self.safFeID_compID_dict.items()}
+        self.feID_relMsgIDslist_dict = {featureID: list(relMsgIDs_list) for featureID, relMsgIDs_list in self.feID_relMsgIDslist_dict.items()}
+        for componentID, featureIDs_list in component_featureIDs_dict.items():
+            for featureID in featureIDs_list:
+                featureID_compID_dict = self.secFeID_compID_dict if featureID in self.secFeID_compID_dict else self.safFeID_compID_dict
+                if featureID not in featureID_compID_dict:
+                    print("Warning! Unknown feature: ", featureID, " of the added component: ", componentID)
+                elif componentID not in featureID_compID_dict[featureID]:
+                    featureID_compID_dict[featureID].append(componentID)
+        for msgID, featureIDs_list in message_featureIDs_dict.items():
+            for featureID in featureIDs_list:
+                if featureID not in self.feID_relMsgIDslist_dict:
+                    print("Warning! Unknown feature: ", featureID, " of the added message: ", msgID)
+                elif msgID not in self.feID_relMsgIDslist_dict[featureID]:
+                    self.feID_relMsgIDslist_dict[featureID].append(msgID)
+        
+        #relevant components as in ingest_model
+        self.secComponentID_set = get_values_from_dict(self.secFeID_compID_dict)
+        self.safComponentID_set = get_values_from_dict(self.safFeID_compID_dict)
+        self.secsafComponentID_set = get_commonelementIDsset(self.secComponentID_set, self.safComponentID_set)
+        if len(self.secsafComponentID_set) != 0:
+            self.secComponentID_set = get_uniqueelementIDsset(self.secComponentID_set, self.secsafComponentID_set)
+            self.safComponentID_set = get_uniqueelementIDsset(self.safComponentID_set, self.secsafComponentID_set)
+        self.feID_compID_dict = {}
+        self.feID_compID_dict.update(self.secFeID_compID_dict)
+        self.feID_compID_dict.update(self.safFeID_compID_dict)
+        self.relevantComponentID_set = set(self.secComponentID_set) | set(self.safComponentID_set)
+        self.componentID_relevance_dict, self.componentID_featureIDs_dict, self.componentID_featurebits_dict = self.get_component_bitmasks()
+        self.msgID_relfeatureIDs_dict = self.get_message_featureIDs_dict()
+        
+        changed_componentID_set = set()
+        for old_dict, new_dict in zip(old_maps_tuple[:2], (self.componentID_relevance_dict, self.componentID_featureIDs_dict)):
+            changed_componentID_set.update(componentID for componentID in set(old_dict) | set(new_dict) if old_dict.get(componentID) != new_dict.get(componentID))
+        changed_msgID_set = set(msgID for msgID in set(old_maps_tuple[2]) | set(self.msgID_relfeatureIDs_dict) if old_maps_tuple[2].get(msgID) != self.msgID_relfeatureIDs_dict.get(msgID))
+        return changed_componentID_set, changed_msgID_set
+    
+    def get_component_featureIDs(self, componentID):
+        "Features realized by a component (a new list, as callers extend it)"
+        return list(self.componentID_featureIDs_dict.get(componentID, ()))
+    
+    def get_message_featureIDs(self, msgID):
+        "Features for which a message is relevant (a new list, as callers extend it)"
+        return list(self.msgID_relfeatureIDs_dict.get(msgID, ()))
+    
+    def get_featureIDs_bits(self, featureIDs_list):
+        "Bitset of a list of features"
+        featurebits = 0
+        for featureID in featureIDs_list:
+            featurebits = featurebits | self.featureID_bit_dict.get(featureID, 0)
+        return featurebits
     
     def get_summed_itertoolsproductoflists(self, set1, set2):
         "For sets, i.e. set1 and set2, get the product of set1 and set2, and the product of set2 and set1 and combine (summation) the output of both products obtained"
@@ -744,10 +871,9 @@ class InteractionAnalysis():
     def check_Inodes_relevance(self, Inodes_list, firstandlastnode_list):
         "check if any node in the given list of intermediate nodes (for a path) is either safety or security relevant; if at least one intermediate node is safety or security relevant, set the intermediate node (Inode) relevance flag to 0 i.e. the path will be analyzed further to check if it is a secondary path"
         Inode_rel_flag = 1 #consider the path as primary path unless this flag is set to 0
-        relvComponentID_list = list(set(firstandlastnode_list).symmetric_difference(self.relevantComponentID_set))
         relvInodes_list = []
         for node in Inodes_list:
-            if node in relvComponentID_list:
+            if (self.componentID_relevance_dict.get(node, 0) & INODE_RELEVANT != 0) != (node in firstandlastnode_list): #node in the symmetric difference of the query nodes and the relevant components
                 relvInodes_list.append(node)
         if len(relvInodes_list) == 0:
             Inode_rel_flag = 1 #path is primary path
@@ -799,26 +925,28 @@ class InteractionAnalysis():
             subpathrow = [] #contains parts of data for creating path table
             nextsubpathrow = [] #for special cases e.g. [(A,B,K)]
             
-            if subpath[0] in self.secComponentID_set: #check if source node is safety or security relevant
+            relevancebits = self.componentID_relevance_dict.get(subpath[0], 0)
+            if relevancebits & SEC_RELEVANT != 0: #check if source node is safety or security relevant
                 SafORSecRelv_LL1_RxC3 = "sec"
                 SafORSecRelv_LL1_RxC4 = "-"
-            elif subpath[0] in self.safComponentID_set:
+            elif relevancebits & SAF_RELEVANT != 0:
                 SafORSecRelv_LL1_RxC3 = "-"
                 SafORSecRelv_LL1_RxC4 = "saf"
-            elif subpath[0] in self.secsafComponentID_set:
+            elif relevancebits & SECSAF_RELEVANT != 0:
                 SafORSecRelv_LL1_RxC3 = "sec"
                 SafORSecRelv_LL1_RxC4 = "saf"
             else:
                 SafORSecRelv_LL1_RxC3 = "-"
                 SafORSecRelv_LL1_RxC4 = "-"
             
-            if subpath[1] in self.secComponentID_set: #check if destination node is safety or security relevant
+            relevancebits = self.componentID_relevance_dict.get(subpath[1], 0)
+            if relevancebits & SEC_RELEVANT != 0: #check if destination node is safety or security relevant
                 SafORSecRelv_LL2_RxC3 = "sec"
                 SafORSecRelv_LL2_RxC4 = "-"
-            elif subpath[1] in self.safComponentID_set:
+            elif relevancebits & SAF_RELEVANT != 0:
                 SafORSecRelv_LL2_RxC3 = "-"
                 SafORSecRelv_LL2_RxC4 = "saf"
-            elif subpath[1] in self.secsafComponentID_set:
+            elif relevancebits & SECSAF_RELEVANT != 0:
                 SafORSecRelv_LL2_RxC3 = "sec"
                 SafORSecRelv_LL2_RxC4 = "saf"
             else:
@@ -894,18 +1022,18 @@ class InteractionAnalysis():
         for index, subpath in enumerate(path):
             if index == 0 and index == len(path) - 1:
                 firstorlastmsg = subpath[-1]
-                feID_list = query_dict_by_wlistvalue(self.feID_relMsgIDslist_dict, firstorlastmsg)
+                feID_list = self.get_message_featureIDs(firstorlastmsg)
                 if len(feID_list) == 0:
-                    srcfeID_list = query_dict_by_wlistvalue(self.feID_compID_dict, src)
-                    dstfeID_list = query_dict_by_wlistvalue(self.feID_compID_dict, dst)
+                    srcfeID_list = self.get_component_featureIDs(src)
+                    dstfeID_list = self.get_component_featureIDs(dst)
                 else:
                     for element in feID_list:
                         if (element in self.secFeaturePkgID_list and src in secnodeID_set) or (element in self.safFeature_pkg_list and src in safnodeID_set):
-                            dstfeID_list = query_dict_by_wlistvalue(self.feID_compID_dict, dst)
+                            dstfeID_list = self.get_component_featureIDs(dst)
                             if element not in srcfeID_list:
                                 srcfeID_list.append(element)
                         elif (element in self.secFeaturePkgID_list and dst in secnodeID_set) or (element in self.safFeature_pkg_list and dst in safnodeID_set):
-                            srcfeID_list = query_dict_by_wlistvalue(self.feID_compID_dict, src)
+                            srcfeID_list = self.get_component_featureIDs(src)
                             if element not in dstfeID_list:
                                 dstfeID_list.append(element)
                         else:
@@ -914,9 +1042,9 @@ class InteractionAnalysis():
                 continue
             elif index != 0 and index == len(path)-1:
                 lastmsg = subpath[-1]
-                feID_list = query_dict_by_wlistvalue(self.feID_relMsgIDslist_dict, lastmsg)
+                feID_list = self.get_message_featureIDs(lastmsg)
                 if len(feID_list) == 0:
-                    dstfeID_list = query_dict_by_wlistvalue(self.feID_compID_dict, dst)
+                    dstfeID_list = self.get_component_featureIDs(dst)
                 else:
                     for element in feID_list:
                         if (element in self.secFeaturePkgID_list and dst in secnodeID_set) or (element in self.safFeature_pkg_list and dst in safnodeID_set):
@@ -926,9 +1054,9 @@ class InteractionAnalysis():
                             print("Warning! Mismatch in safety and security relevance of software component & feature!")
             elif index == 0 and index != len(path)-1:
                 firstmsg = subpath[-1]
-                feID_list = query_dict_by_wlistvalue(self.feID_relMsgIDslist_dict, firstmsg)
+                feID_list = self.get_message_featureIDs(firstmsg)
                 if len(feID_list) == 0:
-                    srcfeID_list = query_dict_by_wlistvalue(self.feID_compID_dict, src)
+                    srcfeID_list = self.get_component_featureIDs(src)
                 else:
                     for element in feID_list:
                         if (element in self.secFeaturePkgID_list and src in secnodeID_set) or (element in self.safFeature_pkg_list and src in safnodeID_set):
@@ -954,7 +1082,7 @@ class InteractionAnalysis():
             src = value[0]
             dst = value[1]
             current_queryID_list = [src, dst]
-            for path in nx.all_simple_edge_paths(graph, source = src, target = dst, cutoff = depth): #query graph to get paths for the selected query (source and destination components) in the graph query list
+            for path in all_simple_edge_paths(graph, src, dst, depth): #query graph to get paths for the selected query (source and destination components) in the graph query list
                 if path not in primarydirectIP_list and path not in primaryindirectIP_list:
                     path_count = path_count + 1 #counting total number of paths found for all queries
                     path_name = self.get_path_name(path, nodeID_name_dict) #get pathname for debugging/validating the path as primary or secondary
@@ -1014,7 +1142,7 @@ class InteractionAnalysis():
             src = value[0]
             dst = value[1]
             current_queryID_list = [src, dst]
-            for path in nx.all_simple_edge_paths(graph, source = src, target = dst, cutoff = depth): #query graph to get paths for the current query (source and destination pair) in the graph query list
+            for path in all_simple_edge_paths(graph, src, dst, depth): #query graph to get paths for the current query (source and destination pair) in the graph query list
                 if path not in primaryIP_list:
                     path_count = path_count + 1 #counting total number of paths found for all queries
                     path_name = self.get_path_name(path, nodeID_name_dict) #get pathname for debugging/validating the path as primary or secondary
@@ -1066,13 +1194,13 @@ class InteractionAnalysis():
             
             #get a list of features that are mapped to src and dst lifelines of the current query; this list will be used to inspect whether the path obtained for the current query is a secondary path or not.
             for element in current_queryID_list:
-                feID_list = query_dict_by_wlistvalue(self.feID_compID_dict, element)
+                feID_list = self.get_component_featureIDs(element)
                 for featureID in feID_list:
                     if featureID not in queryFeIDs_list:
                         queryFeIDs_list.append(featureID)
             
             #query graph to find paths for the current query of the graph query list
-            for path in nx.all_simple_edge_paths(graph, source = src, target = dst, cutoff = depth):
+            for path in all_simple_edge_paths(graph, src, dst, depth):
                 if path not in secondaryIP_list:
                     relvInodesFeIDs_list = [] #get features realized by the intermediate nodes
                     secondaryInodesFeIDs_list = [] #get features realized by the intermediate nodes that are different/unique with respect to features realized by the lifelines specified in the query
@@ -1087,7 +1215,7 @@ class InteractionAnalysis():
                             #print("\nDebug! Inode_rel_flag: ", Inode_rel_flag, " relvInodes_list: ", relvInodes_list)
                             if Inode_rel_flag == 0:
                                 for relvInode in relvInodes_list:
-                                    feID_list = query_dict_by_wlistvalue(self.feID_compID_dict, relvInode)
+                                    feID_list = self.get_component_featureIDs(relvInode)
                                     for featureID in feID_list:
                                         if featureID not in relvInodesFeIDs_list:
                                             relvInodesFeIDs_list.append(featureID)
@@ -1130,6 +1258,268 @@ class InteractionAnalysis():
                                 secondaryFI_IDs_list.append(element)
         return path_count, queryID_secondarypathfound_list, secondaryPath_count, secondaryIP_list, secondaryFI_IDs_list, secondaryFI_IDs_dict
     
+    def get_query_featureIDs(self, current_queryID_list):
+        "Get a list of features that are mapped to the src and dst lifelines of a query"
+        queryFeIDs_list = []
+        for element in current_queryID_list:
+            feID_list = self.get_component_featureIDs(element)
+            for featureID in feID_list:
+                if featureID not in queryFeIDs_list:
+                    queryFeIDs_list.append(featureID)
+        return queryFeIDs_list
+    
+    def classify_interaction_path(self, path, current_queryID_list, queryFeIDs_list):
+        "Classify a path of a query as 'direct' primary, 'indirect' primary or 'secondary' interaction path (None otherwise)"
+        if len(path) == 1:
+            return "direct", []
+        elif len(path) > 1:
+            Inodes_list = self.get_Inodes(path, current_queryID_list)
+            if len(Inodes_list) == 0:
+                return "indirect", []
+            Inode_rel_flag, relvInodes_list = self.check_Inodes_relevance(Inodes_list, current_queryID_list) #flag set to 0 if there exists at least one safety or security relevant Inode
+            if Inode_rel_flag == 1:
+                return "indirect", []
+            secondaryfeaturebits = 0 #features of the relevant intermediate nodes that are not realized by the lifelines of the query
+            for relvInode in relvInodes_list:
+                secondaryfeaturebits = secondaryfeaturebits | self.componentID_featurebits_dict.get(relvInode, 0)
+            secondaryfeaturebits = secondaryfeaturebits & ~self.get_featureIDs_bits(queryFeIDs_list)
+            if secondaryfeaturebits != 0:
+                secondaryInodesFeIDs_list = [] #the same features as a list, in the order in which the relevant intermediate nodes realize them
+                for relvInode in relvInodes_list:
+                    for featureID in self.componentID_featureIDs_dict.get(relvInode, ()):
+                        if secondaryfeaturebits & self.featureID_bit_dict[featureID] != 0:
+                            secondaryInodesFeIDs_list.append(featureID)
+                            secondaryfeaturebits = secondaryfeaturebits & ~self.featureID_bit_dict[featureID]
+                return "secondary", secondaryInodesFeIDs_list
+        else:
+            print("Warning! Unexpected path len found: ", len(path))
+        return None, []
+    
+    def iter_interactions_per_query(self, graph, current_queryID_list, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict, depth, keep_all_secondary = False, pathlength_count_dict = None, budget = None, pathedge_set = None):
+        "Enumerate the paths of a query once and yield its interaction paths, classified on the fly"
+        src = current_queryID_list[0]
+        dst = current_queryID_list[1]
+        queryFeIDs_list = self.get_query_featureIDs(current_queryID_list)
+        if pathlength_count_dict is None:
+            pathlength_count_dict = {}
+        primarypathfound_flag = False
+        secondarycandidate_list = []
+        for path in all_simple_edge_paths(graph, src, dst, depth, budget):
+            pathlength_count_dict[len(path)] = pathlength_count_dict.get(len(path), 0) + 1
+            if pathedge_set is not None:
+                pathedge_set.update((edge[0], edge[1]) for edge in path)
+            category, secondaryInodesFeIDs_list = self.classify_interaction_path(path, current_queryID_list, queryFeIDs_list)
+            if category == "direct" or category == "indirect":
+                primarypathfound_flag = True
+                if not keep_all_secondary:
+                    secondarycandidate_list = [] #the secondary candidates are not needed any more
+                perpathPriFI_IDs_list = self.extract_FI_based_on_relvMsgs_and_SWC(path, src, dst, secnodeID_set, safnodeID_set, nodeID_name_dict)
+                yield category, path, perpathPriFI_IDs_list, [], 1
+            elif category == "secondary" and (keep_all_secondary or not primarypathfound_flag):
+                secondarycandidate_list.append((path, secondaryInodesFeIDs_list))
+        if keep_all_secondary or not primarypathfound_flag: #secondary interaction paths are only considered for queries without any primary path
+            for path, secondaryInodesFeIDs_list in secondarycandidate_list:
+                self.edgepath_tabular_rep(current_queryID_list, path, componentID_name_dict)
+                perpathSecFI_IDs_list = self.extract_FI_based_on_relvMsgs_and_SWC(path, src, dst, secnodeID_set, safnodeID_set, nodeID_name_dict)
+                yield "secondary", path, perpathSecFI_IDs_list, secondaryInodesFeIDs_list, 1
+    
+    def get_query_record(self, current_queryID_list, interaction_iterator, pathlength_count_dict):
+        "Collect the interaction paths yielded for a query into a query record"
+        query_record = {"query": current_queryID_list, "path_count": 0, "pathlength_count_dict": pathlength_count_dict, "primary": [], "secondary": []}
+        for category, path, perpathFI_IDs_list, secondaryInodesFeIDs_list, edgepath_count in interaction_iterator:
+            if category == "secondary":
+                query_record["secondary"].append((path, secondaryInodesFeIDs_list, perpathFI_IDs_list))
+            else:
+                query_record["primary"].append((category, path, perpathFI_IDs_list, edgepath_count))
+        query_record["path_count"] = sum(pathlength_count_dict.values())
+        return query_record
+    
+    def get_budgeted_query_record(self, current_queryID_list, interaction_iterator, pathlength_count_dict, budget):
+        "get_query_record within the budgets of a query; the record of a query that hit a budget holds the budget under 'truncated'"
+        if budget is None:
+            return self.get_query_record(current_queryID_list, interaction_iterator, pathlength_count_dict)
+        budget.start_query(current_queryID_list)
+        query_record = self.get_query_record(current_queryID_list, interaction_iterator, pathlength_count_dict)
+        query_record["truncated"] = budget.end_query()
+        return query_record
+    
+    def get_interactions_per_query(self, graph, current_queryID_list, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict, depth, keep_all_secondary = False, budget = None, pathedge_set = None):
+        "Query record of the paths of a query, classified on the fly (see iter_interactions_per_query)"
+        pathlength_count_dict = {}
+        return self.get_budgeted_query_record(current_queryID_list, self.iter_interactions_per_query(graph, current_queryID_list, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict, depth, keep_all_secondary, pathlength_count_dict, budget, pathedge_set), pathlength_count_dict, budget)
+    
+    def get_query_record_chunk(self, graph, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict, depth, collapsed, keep_all_secondary, bidirectional, budget, queryID_chunk_list):
+        "Query records of a chunk of queries and the budget update of the chunk"
+        budget_state = None if budget is None else budget.get_state()
+        query_record_list = []
+        for current_queryID_list in queryID_chunk_list:
+            if collapsed:
+                query_record_list.append(self.get_collapsed_interactions_per_query(graph, current_queryID_list, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict, depth, keep_all_secondary, bidirectional, budget))
+            else:
+                query_record_list.append(self.get_interactions_per_query(graph, current_queryID_list, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict, depth, keep_all_secondary, budget))
+        return query_record_list, None if budget is None else budget.get_update(budget_state)
+    
+    def get_query_record_list(self, graph, queryID_list, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict, depth, collapsed, keep_all_secondary = False, bidirectional = False, budget = None, workers = None):
+        "Query records of the queries of queryID_list in query order, in parallel with workers > 1"
+        if self.work_queue is not None and len(queryID_list) != 0:
+            return self.get_spool_query_record_list(graph, queryID_list, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict, depth, collapsed, keep_all_secondary, bidirectional, budget)
+        elif workers is None or workers <= 1 or len(queryID_list) <= 1:
+            return self.get_query_record_chunk(graph, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict, depth, collapsed, keep_all_secondary, bidirectional, budget, queryID_list)[0]
+        elif isinstance(graph, CSRGraph):
+            result_iterator = iter_shared_graph_results(self.get_query_record_chunk, graph, queryID_list, workers, (nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict, depth, collapsed, keep_all_secondary, bidirectional, budget))
+        else:
+            result_iterator = iter_parallel_results(self.get_query_record_chunk, split_task_list(queryID_list, workers), workers, (graph, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict, depth, collapsed, keep_all_secondary, bidirectional, budget))
+        return self.merge_query_record_chunks(result_iterator, budget)
+    
+    def merge_query_record_chunks(self, result_iterator, budget):
+        "Query records of the chunks yielded in query order, with their budget updates merged into budget"
+        query_record_list = []
+        for chunk_query_record_list, budget_update in result_iterator:
+            query_record_list.extend(chunk_query_record_list)
+            if budget_update is not None:
+                budget.merge_update(budget_update)
+        return query_record_list
+    
+    def get_spool_query_record_list(self, graph, queryID_list, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict, depth, collapsed, keep_all_secondary, bidirectional, budget):
+        "Query records of get_query_record_list computed by the workers of the spool"
+        backend = "csr" if isinstance(graph, CSRGraph) else "networkx"
+        job_config_dict = {"iterator_type": self.iterator_type, "graph_fingerprint": self.graph_fingerprint, "collapsed": collapsed, "backend": backend, "depth": depth, "keep_all_secondary": keep_all_secondary, "bidirectional": bidirectional, "budget": None if budget is None else budget.get_limit_dict()}
+        analysis_key = (self.iterator_type, collapsed, backend, self.graph_fingerprint)
+        spool_analysis_dict[analysis_key] = (self, graph, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict)
+        try:
+            return self.merge_query_record_chunks(self.work_queue.iter_results("X-I-FASST.query_records", job_config_dict, self.work_queue.get_shard_list(queryID_list)), budget)
+        finally:
+            spool_analysis_dict.pop(analysis_key, None)
+    
+    def get_secondary_Inodes(self, current_queryID_list, queryFeIDs_list):
+        "Relevant components (other than the lifelines of the query) that realize a feature not realized by the lifelines of the query"
+        secondaryInodeID_set = set()
+        queryfeaturebits = self.get_featureIDs_bits(queryFeIDs_list)
+        for componentID in self.relevantComponentID_set:
+            if componentID in current_queryID_list:
+                continue
+            if self.componentID_featurebits_dict.get(componentID, 0) & ~queryfeaturebits != 0:
+                secondaryInodeID_set.add(componentID)
+        return secondaryInodeID_set
+    
+    def iter_collapsed_interactions_per_query(self, interaction_graph, current_queryID_list, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict, depth, keep_all_secondary = False, bidirectional = False, pathlength_count_dict = None, budget = None, pathedge_set = None):
+        "Same classification as iter_interactions_per_query on the node paths of the collapsed graph, pruned by relevance"
+        if bidirectional:
+            search_node_paths = interaction_graph.get_bidirectional_node_paths
+        else:
+            search_node_paths = interaction_graph.get_simple_node_paths
+        src = current_queryID_list[0]
+        dst = current_queryID_list[1]
+        queryFeIDs_list = self.get_query_featureIDs(current_queryID_list)
+        if pathlength_count_dict is None:
+            pathlength_count_dict = {} #path counts of the primary and secondary paths found
+        primarypathfound_flag = False
+        primarygroup_list = [] #[(rank key, category, representative path, number of message paths)]
+        relevantInodeID_set = set(self.relevantComponentID_set) - set(current_queryID_list) #same relevant components as in check_Inodes_relevance
+        for nodepath in search_node_paths(src, dst, depth, avoid_set = relevantInodeID_set, budget = budget):
+            edgepath_count = interaction_graph.count_edge_paths(nodepath)
+            pathlength_count_dict[len(nodepath) - 1] = pathlength_count_dict.get(len(nodepath) - 1, 0) + edgepath_count
+            if pathedge_set is not None:
+                nodepathID_list = interaction_graph.get_node_path_IDs(nodepath)
+                pathedge_set.update(zip(nodepathID_list[:-1], nodepathID_list[1:]))
+            category = "direct" if len(nodepath) == 2 else "indirect"
+            for rankkey, path, groupedpath_count in interaction_graph.get_endpoint_message_groups(nodepath):
+                primarygroup_list.append((rankkey, category, path, groupedpath_count))
+        primarygroup_list.sort(key = lambda element: element[0]) #networkx order of the first path of each group, which keeps the order in which the FIs are found
+        for rankkey, category, path, groupedpath_count in primarygroup_list:
+            primarypathfound_flag = True
+            perpathPriFI_IDs_list = self.extract_FI_based_on_relvMsgs_and_SWC(path, src, dst, secnodeID_set, safnodeID_set, nodeID_name_dict)
+            yield category, path, perpathPriFI_IDs_list, [], groupedpath_count
+        if keep_all_secondary or not primarypathfound_flag: #secondary interaction paths are only considered for queries without any primary path
+            secondarynodepath_list = []
+            secondaryInodesFeIDs_list_list = [] #intermediate features per secondary node path
+            for nodepath in search_node_paths(src, dst, depth, require_set = self.get_secondary_Inodes(current_queryID_list, queryFeIDs_list), budget = budget):
+                edgepath_count = interaction_graph.count_edge_paths(nodepath)
+                pathlength_count_dict[len(nodepath) - 1] = pathlength_count_dict.get(len(nodepath) - 1, 0) + edgepath_count
+                if pathedge_set is not None:
+                    nodepathID_list = interaction_graph.get_node_path_IDs(nodepath)
+                    pathedge_set.update(zip(nodepathID_list[:-1], nodepathID_list[1:]))
+                category, secondaryInodesFeIDs_list = self.classify_interaction_path(interaction_graph.get_representative_edge_path(nodepath), current_queryID_list, queryFeIDs_list) #the intermediate features only depend on the nodes of the path
+                secondarynodepath_list.append(nodepath)
+                secondaryInodesFeIDs_list_list.append(secondaryInodesFeIDs_list)
+            for nodepathIndex, path in interaction_graph.expand_node_paths(secondarynodepath_list):
+                self.edgepath_tabular_rep(current_queryID_list, path, componentID_name_dict)
+                perpathSecFI_IDs_list = self.extract_FI_based_on_relvMsgs_and_SWC(path, src, dst, secnodeID_set, safnodeID_set, nodeID_name_dict)
+                yield "secondary", path, perpathSecFI_IDs_list, list(secondaryInodesFeIDs_list_list[nodepathIndex]), 1 #one list of intermediate features per message path, as in the message-level search
+    
+    def get_collapsed_interactions_per_query(self, interaction_graph, current_queryID_list, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict, depth, keep_all_secondary = False, bidirectional = False, budget = None, pathedge_set = None):
+        "Classify the paths of a query on the collapsed graph (see iter_collapsed_interactions_per_query); returns the query record"
+        pathlength_count_dict = {}
+        return self.get_budgeted_query_record(current_queryID_list, self.iter_collapsed_interactions_per_query(interaction_graph, current_queryID_list, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict, depth, keep_all_secondary, bidirectional, pathlength_count_dict, budget, pathedge_set), pathlength_count_dict, budget)
+    
+    def get_primary_interactions_from_records(self, query_record_list):
+        "Collect the direct and indirect primary interaction paths and their FIs from the query records"
+        path_count = 0 #count total number of paths found for all queries
+        primarydirectPath_count = 0
+        primaryindirectPath_count = 0
+        primarydirectIP_list = []
+        primaryindirectIP_list = []
+        queryID_directPPF_list = []
+        queryID_indirectPPF_list = []
+        directprimaryFI_IDs_list = []
+        indirectprimaryFI_IDs_list = []
+        for query_record in query_record_list:
+            current_queryID_list = query_record["query"]
+            path_count = path_count + query_record["path_count"]
+            for category, path, perpathPriFI_IDs_list, groupedpath_count in query_record["primary"]:
+                if category == "direct":
+                    primarydirectIP_list.append(path)
+                    primarydirectPath_count = primarydirectPath_count + groupedpath_count
+                    if current_queryID_list not in queryID_directPPF_list:
+                        queryID_directPPF_list.append(current_queryID_list)
+                    for element in perpathPriFI_IDs_list:
+                        if element not in directprimaryFI_IDs_list:
+                            directprimaryFI_IDs_list.append(element)
+                else:
+                    primaryindirectIP_list.append(path)
+                    primaryindirectPath_count = primaryindirectPath_count + groupedpath_count
+                    if current_queryID_list not in queryID_indirectPPF_list:
+                        queryID_indirectPPF_list.append(current_queryID_list)
+                    for element in perpathPriFI_IDs_list:
+                        if element not in directprimaryFI_IDs_list:
+                            if element not in indirectprimaryFI_IDs_list:
+                                indirectprimaryFI_IDs_list.append(element)
+        return path_count, queryID_directPPF_list, queryID_indirectPPF_list, primarydirectPath_count, primaryindirectPath_count, primarydirectIP_list, primaryindirectIP_list, directprimaryFI_IDs_list, indirectprimaryFI_IDs_list
+    
+    def get_secondary_interactions_from_records(self, query_record_list):
+        "Collect the secondary interaction paths, their FIs and intermediate features from the query records"
+        path_count = 0 #count total number of paths found for all queries
+        secondaryPath_count = 0 #count number of secondary paths found for all queries
+        secondaryIP_list = []
+        queryID_secondarypathfound_list = []
+        secondaryFI_IDs_list = [] #store feature interactions (FIs) for secondary paths based on relevant messages; in case of missing relevant messages, store FIs based on relevant components
+        secondaryFI_IDs_dict = {} #secondary feature interaction (FI) is stored in the format {FI: [Intermedite features]} wherein FI = [F1, F2]
+        for query_record in query_record_list:
+            if len(query_record["primary"]) != 0:
+                continue
+            current_queryID_list = query_record["query"]
+            path_count = path_count + query_record["path_count"]
+            for path, secondaryInodesFeIDs_list, perpathSecFI_IDs_list in query_record["secondary"]:
+                secondaryIP_list.append(path)
+                secondaryPath_count = secondaryPath_count + 1
+                if current_queryID_list not in queryID_secondarypathfound_list:
+                    queryID_secondarypathfound_list.append(current_queryID_list)
+                for FI_ID in perpathSecFI_IDs_list:
+                    FI_tuple = tuple(FI_ID) #converting type of feature interaction (FI) from list to tuple becuase the keys of dict must be of hashable data type
+                    if FI_tuple not in secondaryFI_IDs_dict.keys():
+                        secondaryFI_IDs_dict.update({FI_tuple: secondaryInodesFeIDs_list})
+                    else:
+                        IFe_forFI = secondaryFI_IDs_dict[FI_tuple] #get the intermediate (interacting) features for this FI (feature interaction)
+                        for featureID in secondaryInodesFeIDs_list:
+                            if featureID not in IFe_forFI:
+                                IFe_forFI.append(featureID)
+                perpathSecFI_names_list = get_listoflistnames_from_listoflistIDs(perpathSecFI_IDs_list, self.featurePkgID_name_dict)
+                print("Extracted_FIs: ", len(perpathSecFI_IDs_list), " are ", perpathSecFI_names_list)
+                for element in perpathSecFI_IDs_list:
+                    if element not in secondaryFI_IDs_list:
+                        secondaryFI_IDs_list.append(element)
+        return path_count, queryID_secondarypathfound_list, secondaryPath_count, secondaryIP_list, secondaryFI_IDs_list, secondaryFI_IDs_dict
+    
     def get_feIDactIDlistdict(self, featureID_list, activityID_list, feID_actWdependencylist_dict, actID_name_dict):
         lifelinesactivityID_list = []
         feID_actIDlist_dict = {}
@@ -1170,21 +1560,8 @@ class InteractionAnalysis():
         #print("\nDebug! edgeID_name_dict: ", edgeID_name_dict)
         return nodeIDs_set, nodeID_name_dict, edgeIDs_list, edgeID_name_dict
     
-    def get_interaction_list(self, depth):
-        "Get a list of primary and secondary feature interactions between safety and security features"
-        safFe_interactingSecFe_list = []
-        secFe_interactingSafFe_list = []
-        relComponentID_name_dict = {}
-        relComponentID_name_dict.update(self.secComponentID_name_dict)
-        relComponentID_name_dict.update(self.safComponentID_name_dict)
-        all_FInames_listsoflist = []
-        queryID_list = [] #List of queries to search the graph for primary interaction paths
-        queryID_SIP_list = [] #List of queries to search the graph for secondary interaction paths
-        primaryIP_list = [] #List of primary interaction paths
-        secondaryIP_list = [] #List of secondary interaction paths
-        queryID_pripathfound_list = [] #collect queries for which atleast 1 primary path was found.
-        queryID_secondarypathfound_list = [] #collect queries for which atleast 1 secondary path was found.
-        
+    def get_interaction_graph_and_queries(self):
+        "Create the multi directed graph of all safety and security features and the queries between relevant lifelines"
         componentID_name_dict = {}
         nodeIDnamedict_list = list(self.feID_nodeIDnamedict_dict.values())
         for nodeIDnamedict in nodeIDnamedict_list:
@@ -1198,20 +1575,352 @@ class InteractionAnalysis():
         secnodeID_set, safnodeID_set, secsafnodeID_set, nonrelnodeID_set = self.get_relevant_lifelines(nodeIDs_set)
         print("\nDebug! Relevant lifelines for .sd of all saf-&sec features! secnodeID_no: ", len(secnodeID_set), ", safnodeID_no: ", len(safnodeID_set), ", secsafnodeID_no: ", len(secsafnodeID_set))
         
-        print("\nCreating nx multi directed graph ...")
-        featureseqdiags_graph = create_multidi_graph(nodeIDs_set, edgeIDs_list)
+        if self.shared_graph is not None:
+            featureseqdiags_graph = self.shared_graph
+        else:
+            print("\nCreating nx multi directed graph ...")
+            featureseqdiags_graph = create_multidi_graph(nodeIDs_set, edgeIDs_list)
+        self.graph_fingerprint = None if self.work_queue is None else get_graph_fingerprint(featureseqdiags_graph) #the spool workers check that they rebuilt the same graph
         
         print("\nGenerating graph query list ...")
         queryID_list = self.get_graphquery_list(secnodeID_set, safnodeID_set, secsafnodeID_set)
         print("\nDebug! len(queryID_list): ", len(queryID_list))
+        return componentID_name_dict, nodeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, featureseqdiags_graph, queryID_list
+    
+    def get_edgepath_graph(self, featureseqdiags_graph, collapsed, backend):
+        "Graph for the message-level path enumeration: the networkx graph itself (reference backend) or its CSR form"
+        if collapsed or backend == "networkx":
+            return featureseqdiags_graph
+        elif backend == "csr":
+            return create_csr_graph_from_nx(featureseqdiags_graph)
+        else:
+            print("Warning! Unknown path backend: ", backend, ", networkx is used!")
+            return featureseqdiags_graph
+    
+    def get_interaction_list(self, depth, collapsed = True, bidirectional = False, backend = "networkx", budget = None, workers = None):
+        "Get a list of primary and secondary feature interactions between safety and security features"
+        componentID_name_dict, nodeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, featureseqdiags_graph, queryID_list = self.get_interaction_graph_and_queries()
         
-        primarydirectIP_list = []
-        primaryindirectIP_list = []
-        queryID_directPPF_list = []
-        queryID_indirectPPF_list = []
+        #drop the queries whose source cannot reach the destination within the cutoff before any path is enumerated
+        interaction_graph = create_interaction_graph_from_nx(featureseqdiags_graph)
+        graph_reachability = ReachabilityIndex(interaction_graph)
+        reachable_queryID_list, pruned_queryID_list = graph_reachability.prune_queries(queryID_list, depth)
+        print("\nDebug! Reachability prefilter pruned ", len(pruned_queryID_list), " out of ", len(queryID_list), " queries (no path within depth: ", depth, ")")
         
-        print("\nQuerying graph to get primary direct and indirect interaction paths...")
-        path_count, queryID_directPPF_list, queryID_indirectPPF_list, primarydirectPath_count, primaryindirectPath_count, primarydirectIP_list, primaryindirectIP_list, directprimaryFI_IDs_list, indirectprimaryFI_IDs_list = self.get_direct_indirect_primary_interactions(featureseqdiags_graph, queryID_list, nodeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, primarydirectIP_list, primaryindirectIP_list, queryID_directPPF_list, queryID_indirectPPF_list, componentID_name_dict, depth)
+        edgepath_graph = self.get_edgepath_graph(featureseqdiags_graph, collapsed, backend)
+        
+        print("\nQuerying graph to get primary direct, primary indirect and secondary interaction paths in a single pass...")
+        query_record_list = self.get_query_record_list(interaction_graph if collapsed else edgepath_graph, reachable_queryID_list, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict, depth, collapsed, bidirectional = bidirectional, budget = budget, workers = workers) #one record of classified paths per query
+        interaction_summary = self.summarize_interactions(query_record_list, queryID_list, depth)
+        if budget is not None:
+            budget.print_report()
+            interaction_summary["truncated_queries"] = budget.get_truncated_query_list()
+        return interaction_summary
+    
+    def iter_interactions(self, depth, collapsed = True, bidirectional = False, backend = "networkx", budget = None):
+        "Streaming variant of get_interaction_list: yield one event (dict) per classified interaction path"
+        componentID_name_dict, nodeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, featureseqdiags_graph, queryID_list = self.get_interaction_graph_and_queries()
+        
+        interaction_graph = create_interaction_graph_from_nx(featureseqdiags_graph)
+        graph_reachability = ReachabilityIndex(interaction_graph)
+        reachable_queryID_list, pruned_queryID_list = graph_reachability.prune_queries(queryID_list, depth)
+        print("\nDebug! Reachability prefilter pruned ", len(pruned_queryID_list), " out of ", len(queryID_list), " queries (no path within depth: ", depth, ")")
+        
+        edgepath_graph = self.get_edgepath_graph(featureseqdiags_graph, collapsed, backend)
+        
+        print("\nQuerying graph to stream primary direct, primary indirect and secondary interaction paths...")
+        for current_queryID_list in reachable_queryID_list:
+            if collapsed:
+                interaction_iterator = self.iter_collapsed_interactions_per_query(interaction_graph, current_queryID_list, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict, depth, bidirectional = bidirectional, budget = budget)
+            else:
+                interaction_iterator = self.iter_interactions_per_query(edgepath_graph, current_queryID_list, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict, depth, budget = budget)
+            if budget is not None:
+                budget.start_query(current_queryID_list)
+            for category, path, perpathFI_IDs_list, secondaryInodesFeIDs_list, edgepath_count in interaction_iterator:
+                yield {"event": "path", "query": current_queryID_list, "category": category, "path": path, "path_count": edgepath_count, "FIs": perpathFI_IDs_list, "FI_names": get_listoflistnames_from_listoflistIDs(perpathFI_IDs_list, self.featurePkgID_name_dict), "intermediate_features": secondaryInodesFeIDs_list}
+            if budget is not None and budget.end_query() is not None:
+                yield {"event": "truncated", "query": current_queryID_list, "reason": budget.truncated_reason}
+        if budget is not None:
+            budget.print_report()
+    
+    def iter_feature_interactions(self, depth, collapsed = True, bidirectional = False, backend = "networkx", budget = None):
+        "Yield each feature interaction once, with the first interaction path realizing it in iter_interactions"
+        FI_set = set()
+        for event_dict in self.iter_interactions(depth, collapsed, bidirectional, backend, budget):
+            if event_dict["event"] != "path":
+                continue
+            for FI, FI_names in zip(event_dict["FIs"], event_dict["FI_names"]):
+                if tuple(FI) not in FI_set:
+                    FI_set.add(tuple(FI))
+                    yield {"event": "FI", "FI": FI, "FI_names": FI_names, "category": event_dict["category"], "query": event_dict["query"]}
+    
+    def get_interaction_sweep(self, depth_list, bundle_file = None, collapsed = True, bidirectional = False, backend = "networkx", budget = None, workers = None):
+        "Multi-depth sweep: the primary and secondary feature interactions for every depth in depth_list as a result bundle"
+        depth_list = sorted(set(depth_list), key = lambda depth: float('inf') if depth is None else depth)
+        max_depth = depth_list[-1]
+        componentID_name_dict, nodeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, featureseqdiags_graph, queryID_list = self.get_interaction_graph_and_queries()
+        
+        interaction_graph = create_interaction_graph_from_nx(featureseqdiags_graph)
+        graph_reachability = ReachabilityIndex(interaction_graph)
+        reachable_queryID_list, pruned_queryID_list = graph_reachability.prune_queries(queryID_list, max_depth)
+        print("\nDebug! Reachability prefilter pruned ", len(pruned_queryID_list), " out of ", len(queryID_list), " queries (no path within depth: ", max_depth, ")")
+        
+        edgepath_graph = self.get_edgepath_graph(featureseqdiags_graph, collapsed, backend)
+        
+        print("\nQuerying graph once at depth: ", max_depth, " for the depths: ", depth_list, " ...")
+        query_record_list = self.get_query_record_list(interaction_graph if collapsed else edgepath_graph, reachable_queryID_list, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict, max_depth, collapsed, keep_all_secondary = True, bidirectional = bidirectional, budget = budget, workers = workers)
+        
+        result_bundle = {"method": "X-I-FASST", "depths": []}
+        if budget is not None:
+            budget.print_report()
+            result_bundle["truncated_queries"] = budget.get_truncated_query_list()
+        for depth in depth_list:
+            print("\n\n######## Results for depth: ", depth, " ########")
+            depth_query_record_list = [self.filter_query_record(query_record, depth) for query_record in query_record_list]
+            result_bundle["depths"].append(self.summarize_interactions(depth_query_record_list, queryID_list, depth))
+        if bundle_file is not None:
+            write_result_bundle(result_bundle, bundle_file)
+        return result_bundle
+    
+    def get_query_depth_plan(self, bundle_file = None):
+        "Depth planning: the minimum depth of each query and the number of queries reachable at each depth"
+        componentID_name_dict, nodeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, featureseqdiags_graph, queryID_list = self.get_interaction_graph_and_queries()
+        csr_graph = create_csr_graph_from_nx(featureseqdiags_graph)
+        distance_matrix = csr_graph.get_hop_distance_matrix()
+        
+        querydepth_list = [] #[(query, minimum depth)], minimum depth None for unreachable queries
+        for current_queryID_list in queryID_list:
+            srcIndex = csr_graph.nodeID_index_dict.get(current_queryID_list[0])
+            dstIndex = csr_graph.nodeID_index_dict.get(current_queryID_list[1])
+            if srcIndex is None or dstIndex is None or distance_matrix[srcIndex, dstIndex] < 0:
+                querydepth_list.append((current_queryID_list, None))
+            else:
+                querydepth_list.append((current_queryID_list, int(distance_matrix[srcIndex, dstIndex])))
+        
+        depth_querycount_dict = {}
+        for current_queryID_list, min_depth in querydepth_list:
+            if min_depth is not None:
+                depth_querycount_dict[min_depth] = depth_querycount_dict.get(min_depth, 0) + 1
+        depthlevel_list = [] #[depth, queries that become reachable at the depth, queries reachable within the depth]
+        reachable_count = 0
+        for depth in sorted(depth_querycount_dict):
+            reachable_count = reachable_count + depth_querycount_dict[depth]
+            depthlevel_list.append([depth, depth_querycount_dict[depth], reachable_count])
+        directquery_list = [current_queryID_list for current_queryID_list, min_depth in querydepth_list if min_depth == 1]
+        unreachable_count = len(queryID_list) - reachable_count
+        
+        print("\nSummary! Depth plan! len(queryID_list): ", len(queryID_list), "\nQueries with a direct message (direct primary path candidates): ", len(directquery_list), "\nQueries not reachable at any depth: ", unreachable_count)
+        print(tabulate(depthlevel_list, headers = ["Depth", "Queries_added", "Queries_reachable"], tablefmt = 'grid'))
+        
+        result_bundle = {"method": "X-I-FASST", "query_count": len(queryID_list), "unreachable_query_count": unreachable_count, "direct_queries": get_listoflistnames_from_listoflistIDs(directquery_list, componentID_name_dict), "depth_levels": [{"depth": depth, "added_queries": added_count, "reachable_queries": reachable_count} for depth, added_count, reachable_count in depthlevel_list], "query_min_depths": [[componentID_name_dict[current_queryID_list[0]], componentID_name_dict[current_queryID_list[1]], min_depth] for current_queryID_list, min_depth in querydepth_list]}
+        if bundle_file is not None:
+            write_result_bundle(result_bundle, bundle_file)
+        return result_bundle
+    
+    def get_feature_interaction_matrix(self, depth, evidence_featurepair_list = None, collapsed = True, bidirectional = False, backend = "networkx", workers = None):
+        "Aggregate mode: the feature x feature interaction matrix within depth hops, with evidence paths for evidence_featurepair_list"
+        componentID_name_dict, nodeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, featureseqdiags_graph, queryID_list = self.get_interaction_graph_and_queries()
+        interaction_graph = create_interaction_graph_from_nx(featureseqdiags_graph)
+        graph_reachability = ReachabilityIndex(interaction_graph)
+        featureID_list = list(self.feID_compID_dict)
+        featureID_index_dict = {featureID: index for index, featureID in enumerate(featureID_list)}
+        feature_reach_matrix = get_group_reach_matrix(graph_reachability, get_incidence_matrix(interaction_graph, featureID_list, self.feID_compID_dict), depth)
+        
+        SecToSaf_pair_list = []
+        SafToSec_pair_list = []
+        for srcIndex, dstIndex in zip(*feature_reach_matrix.nonzero()):
+            srcfeatureID = featureID_list[srcIndex]
+            dstfeatureID = featureID_list[dstIndex]
+            if srcfeatureID in self.secFeaturePkgID_list and dstfeatureID in self.safFeature_pkg_list:
+                SecToSaf_pair_list.append([srcfeatureID, dstfeatureID])
+            elif srcfeatureID in self.safFeature_pkg_list and dstfeatureID in self.secFeaturePkgID_list:
+                SafToSec_pair_list.append([srcfeatureID, dstfeatureID])
+        SecToSaf_pairnames_list = get_listoflistnames_from_listoflistIDs(SecToSaf_pair_list, self.featurePkgID_name_dict)
+        SafToSec_pairnames_list = get_listoflistnames_from_listoflistIDs(SafToSec_pair_list, self.featurePkgID_name_dict)
+        print("\nSummary! Feature interaction matrix! depth: ", depth, "\nSecurity to safety feature pairs that can interact: ", len(SecToSaf_pair_list), " out of ", len(self.secFeaturePkgID_list) * len(self.safFeature_pkg_list))
+        print(tabulate(SecToSaf_pairnames_list, headers = ["Security_feature", "Safety_feature"], tablefmt = 'grid'))
+        print("\nSafety to security feature pairs that can interact: ", len(SafToSec_pair_list), " out of ", len(self.secFeaturePkgID_list) * len(self.safFeature_pkg_list))
+        print(tabulate(SafToSec_pairnames_list, headers = ["Safety_feature", "Security_feature"], tablefmt = 'grid'))
+        matrix_dict = {"method": "X-I-FASST", "depth": depth, "features": get_listnames_from_listIDs(featureID_list, self.featurePkgID_name_dict), "feature_reach_matrix": feature_reach_matrix.tolist(), "SecToSaf_pairs": SecToSaf_pairnames_list, "SafToSec_pairs": SafToSec_pairnames_list, "evidence": None}
+        
+        if evidence_featurepair_list is None or len(evidence_featurepair_list) == 0:
+            return matrix_dict
+        flaggedpair_list = []
+        for featurepair in evidence_featurepair_list:
+            if featurepair[0] not in featureID_index_dict or featurepair[1] not in featureID_index_dict:
+                print("Warning! Unknown feature in the evidence pair: ", featurepair, "!")
+            elif feature_reach_matrix[featureID_index_dict[featurepair[0]], featureID_index_dict[featurepair[1]]]:
+                flaggedpair_list.append(featurepair)
+            else:
+                print("Debug! No evidence needed for the feature pair: ", get_listnames_from_listIDs(featurepair, self.featurePkgID_name_dict), ", its features cannot interact within depth: ", depth)
+        evidence_queryID_list = [] #queries between the components of the flagged feature pairs
+        for current_queryID_list in queryID_list:
+            for featurepair in flaggedpair_list:
+                if current_queryID_list[0] in self.feID_compID_dict[featurepair[0]] and current_queryID_list[1] in self.feID_compID_dict[featurepair[1]]:
+                    evidence_queryID_list.append(current_queryID_list)
+                    break
+        reachable_queryID_list, pruned_queryID_list = graph_reachability.prune_queries(evidence_queryID_list, depth)
+        print("\nDebug! Evidence of ", len(flaggedpair_list), " feature pairs: ", len(reachable_queryID_list), " reachable out of ", len(evidence_queryID_list), " queries between their components (", len(queryID_list), " queries in total)")
+        
+        edgepath_graph = self.get_edgepath_graph(featureseqdiags_graph, collapsed, backend)
+        
+        print("\nQuerying graph to get primary direct, primary indirect and secondary interaction paths of the flagged feature pairs...")
+        query_record_list = self.get_query_record_list(interaction_graph if collapsed else edgepath_graph, reachable_queryID_list, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict, depth, collapsed, bidirectional = bidirectional, workers = workers)
+        matrix_dict["evidence"] = self.summarize_interactions(query_record_list, evidence_queryID_list, depth)
+        return matrix_dict
+    
+    def get_incremental_interaction_list(self, depth, collapsed = True, bidirectional = False, backend = "networkx"):
+        "Dynamic mode: get_interaction_list, keeping the graph and the query records for update_interaction_list"
+        componentID_name_dict, nodeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, featureseqdiags_graph, queryID_list = self.get_interaction_graph_and_queries()
+        self.dynamic_dict = {"graph": featureseqdiags_graph, "queryID_list": queryID_list, "componentID_name_dict": componentID_name_dict, "nodeID_name_dict": nodeID_name_dict, "secnodeID_set": secnodeID_set, "safnodeID_set": safnodeID_set, "collapsed": collapsed, "bidirectional": bidirectional, "backend": backend, "path_index": IncrementalPathIndex(depth)}
+        return self.get_dynamic_summary([], [])
+    
+    def update_interaction_list(self, added_message_dict = None, removed_message_list = (), added_component_dict = None, removed_component_list = (), component_featureIDs_dict = None, message_featureIDs_dict = None):
+        "Dynamic mode: apply a model revision and update the summary"
+        if self.dynamic_dict is None:
+            print("Warning! No dynamic analysis to update, get_incremental_interaction_list has to be called first!")
+            return None
+        graph = self.dynamic_dict["graph"]
+        deleted_edge_list = []
+        for edge in removed_message_list:
+            if graph.has_edge(edge[0], edge[1], edge[2]):
+                graph.remove_edge(edge[0], edge[1], edge[2])
+                deleted_edge_list.append(edge)
+            else:
+                print("Warning! Removed message: ", edge, " not found in the graph!")
+        for componentID in removed_component_list:
+            if componentID in graph:
+                deleted_edge_list.extend(graph.in_edges(componentID, keys = True))
+                deleted_edge_list.extend(graph.out_edges(componentID, keys = True))
+                graph.remove_node(componentID)
+            else:
+                print("Warning! Removed component: ", componentID, " not found in the graph!")
+        if added_component_dict is not None:
+            for componentID, component_name in added_component_dict.items():
+                graph.add_node(componentID)
+                self.dynamic_dict["componentID_name_dict"][componentID] = component_name
+                self.dynamic_dict["nodeID_name_dict"][componentID] = component_name
+        inserted_edge_list = []
+        if added_message_dict is not None:
+            for edge, message_name in added_message_dict.items():
+                if edge[0] not in graph or edge[1] not in graph:
+                    print("Warning! Added message: ", edge, " skipped, its components are not in the graph!")
+                elif not graph.has_edge(edge[0], edge[1], edge[2]):
+                    graph.add_edge(edge[0], edge[1], key = edge[2])
+                    self.msgID_name_dict[edge[2]] = message_name
+                    inserted_edge_list.append(edge)
+        changed_componentID_set, changed_msgID_set = self.revise_feature_maps(component_featureIDs_dict or {}, message_featureIDs_dict or {}, set(removed_component_list))
+        changed_edge_list = [edge for edge in graph.edges(keys = True) if edge[0] in changed_componentID_set or edge[1] in changed_componentID_set or edge[2] in changed_msgID_set] #their paths are classified differently
+        if len(removed_component_list) != 0 or (added_component_dict is not None and len(added_component_dict) != 0) or len(changed_componentID_set) != 0: #the relevant lifelines and hence the queries changed
+            secnodeID_set, safnodeID_set, secsafnodeID_set, nonrelnodeID_set = self.get_relevant_lifelines(set(graph.nodes()))
+            self.dynamic_dict["secnodeID_set"] = secnodeID_set
+            self.dynamic_dict["safnodeID_set"] = safnodeID_set
+            self.dynamic_dict["queryID_list"] = self.get_graphquery_list(secnodeID_set, safnodeID_set, secsafnodeID_set)
+        print("\nDebug! Model revision: ", len(inserted_edge_list), " messages added, ", len(deleted_edge_list), " messages removed, ", len(changed_edge_list), " messages of changed relevance")
+        return self.get_dynamic_summary(inserted_edge_list + changed_edge_list, deleted_edge_list + changed_edge_list)
+    
+    def get_dynamic_summary(self, inserted_edge_list, deleted_edge_list):
+        "Dynamic mode: enumerate again the queries affected by the inserted and deleted edges and summarize all query records"
+        dynamic_dict = self.dynamic_dict
+        path_index = dynamic_dict["path_index"]
+        depth = path_index.depth
+        queryID_list = dynamic_dict["queryID_list"]
+        interaction_graph = create_interaction_graph_from_nx(dynamic_dict["graph"])
+        graph_reachability = ReachabilityIndex(interaction_graph)
+        reachable_queryID_list, pruned_queryID_list = graph_reachability.prune_queries(queryID_list, depth)
+        print("\nDebug! Reachability prefilter pruned ", len(pruned_queryID_list), " out of ", len(queryID_list), " queries (no path within depth: ", depth, ")")
+        reachable_query_set = set(tuple(current_queryID_list) for current_queryID_list in reachable_queryID_list)
+        for query in path_index.get_query_list():
+            if query not in reachable_query_set:
+                path_index.discard(query)
+        affected_queryID_list = path_index.get_affected_queries(interaction_graph, inserted_edge_list, deleted_edge_list, reachable_queryID_list)
+        print("\nDebug! Incremental path index: ", len(affected_queryID_list), " out of ", len(reachable_queryID_list), " reachable queries are enumerated again")
+        
+        edgepath_graph = self.get_edgepath_graph(dynamic_dict["graph"], dynamic_dict["collapsed"], dynamic_dict["backend"])
+        
+        print("\nQuerying graph to get primary direct, primary indirect and secondary interaction paths of the affected queries...")
+        for current_queryID_list in affected_queryID_list:
+            pathedge_set = set()
+            if dynamic_dict["collapsed"]:
+                query_record = self.get_collapsed_interactions_per_query(interaction_graph, current_queryID_list, dynamic_dict["nodeID_name_dict"], dynamic_dict["secnodeID_set"], dynamic_dict["safnodeID_set"], dynamic_dict["componentID_name_dict"], depth, bidirectional = dynamic_dict["bidirectional"], pathedge_set = pathedge_set)
+            else:
+                query_record = self.get_interactions_per_query(edgepath_graph, current_queryID_list, dynamic_dict["nodeID_name_dict"], dynamic_dict["secnodeID_set"], dynamic_dict["safnodeID_set"], dynamic_dict["componentID_name_dict"], depth, pathedge_set = pathedge_set)
+            path_index.put(current_queryID_list, query_record, pathedge_set)
+        query_record_list = [self.filter_query_record(path_index.get_result(current_queryID_list), depth) for current_queryID_list in reachable_queryID_list] #copies, as the summary extends the intermediate features of the records in place
+        return self.summarize_interactions(query_record_list, queryID_list, depth)
+    
+    def get_interaction_counts(self, depth_list, bundle_file = None):
+        "Count-only mode: the numbers of all, primary direct, primary indirect and secondary paths per depth of depth_list"
+        depth_list = sorted(set(depth_list), key = lambda depth: float('inf') if depth is None else depth)
+        max_depth = depth_list[-1]
+        componentID_name_dict, nodeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, featureseqdiags_graph, queryID_list = self.get_interaction_graph_and_queries()
+        
+        interaction_graph = create_interaction_graph_from_nx(featureseqdiags_graph)
+        graph_reachability = ReachabilityIndex(interaction_graph)
+        reachable_queryID_list, pruned_queryID_list = graph_reachability.prune_queries(queryID_list, max_depth)
+        print("\nDebug! Reachability prefilter pruned ", len(pruned_queryID_list), " out of ", len(queryID_list), " queries (no path within depth: ", max_depth, ")")
+        path_counter = PathCounter(interaction_graph, graph_reachability)
+        
+        print("\nCounting paths of the graph at depth: ", max_depth, " for the depths: ", depth_list, " ...")
+        querycount_list = [] #per query, the number of all, primary and secondary paths per path length
+        for current_queryID_list in reachable_queryID_list:
+            src = current_queryID_list[0]
+            dst = current_queryID_list[1]
+            queryFeIDs_list = self.get_query_featureIDs(current_queryID_list)
+            relevantInodeID_set = set(self.relevantComponentID_set) - set(current_queryID_list) #same relevant components as in check_Inodes_relevance
+            all_pathlength_count_dict = path_counter.count_paths_by_length(src, dst, max_depth)
+            primary_pathlength_count_dict = path_counter.count_paths_by_length(src, dst, max_depth, avoid_set = relevantInodeID_set)
+            secondary_pathlength_count_dict = path_counter.count_paths_by_length(src, dst, max_depth, require_set = self.get_secondary_Inodes(current_queryID_list, queryFeIDs_list))
+            querycount_list.append((all_pathlength_count_dict, primary_pathlength_count_dict, secondary_pathlength_count_dict))
+        
+        result_bundle = {"method": "X-I-FASST", "mode": "count", "depths": []}
+        for depth in depth_list:
+            maxpathlength = float('inf') if depth is None else depth
+            path_count = 0
+            primarydirectPath_count = 0
+            primaryindirectPath_count = 0
+            secondaryPath_count = 0
+            queryID_pripathfound_count = 0
+            queryID_secondarypathfound_count = 0
+            for all_pathlength_count_dict, primary_pathlength_count_dict, secondary_pathlength_count_dict in querycount_list:
+                path_count = path_count + sum(count for pathlength, count in all_pathlength_count_dict.items() if pathlength <= maxpathlength)
+                querydirectPath_count = sum(count for pathlength, count in primary_pathlength_count_dict.items() if pathlength == 1) #a path of one message has no intermediate node
+                queryindirectPath_count = sum(count for pathlength, count in primary_pathlength_count_dict.items() if 1 < pathlength <= maxpathlength)
+                primarydirectPath_count = primarydirectPath_count + querydirectPath_count
+                primaryindirectPath_count = primaryindirectPath_count + queryindirectPath_count
+                if querydirectPath_count + queryindirectPath_count != 0:
+                    queryID_pripathfound_count = queryID_pripathfound_count + 1
+                    continue
+                querysecondaryPath_count = sum(count for pathlength, count in secondary_pathlength_count_dict.items() if pathlength <= maxpathlength) #secondary interaction paths are only considered for queries without any primary path
+                secondaryPath_count = secondaryPath_count + querysecondaryPath_count
+                if querysecondaryPath_count != 0:
+                    queryID_secondarypathfound_count = queryID_secondarypathfound_count + 1
+            primaryPath_count = primarydirectPath_count + primaryindirectPath_count
+            print("\nSummary! depth:", depth, "\npath_count: ", path_count, "\nprimarydirectPath_count: ", primarydirectPath_count, "\nprimaryindirectPath_count: ", primaryindirectPath_count, "\nprimaryPath_count: ", primaryPath_count, "\nsecondaryPath_count: ", secondaryPath_count, "\nQueries_with_primary_path: ", queryID_pripathfound_count, "\nQueries_with_only_secondary_path: ", queryID_secondarypathfound_count, "\nout_of_total_queries: ", len(queryID_list))
+            result_bundle["depths"].append({"depth": depth, "query_count": len(queryID_list), "path_count": path_count, "primarydirectPath_count": primarydirectPath_count, "primaryindirectPath_count": primaryindirectPath_count, "primaryPath_count": primaryPath_count, "secondaryPath_count": secondaryPath_count, "queries_with_primary_path": queryID_pripathfound_count, "queries_with_only_secondary_path": queryID_secondarypathfound_count})
+        if bundle_file is not None:
+            write_result_bundle(result_bundle, bundle_file)
+        return result_bundle
+    
+    def filter_query_record(self, query_record, depth):
+        "Restrict a query record classified at a larger depth to the paths with at most depth edges"
+        if depth is None:
+            depth = float('inf')
+        depth_query_record = {"query": query_record["query"], "path_count": 0, "pathlength_count_dict": {}, "primary": [], "secondary": []}
+        for pathlength, count in query_record["pathlength_count_dict"].items():
+            if pathlength <= depth:
+                depth_query_record["pathlength_count_dict"][pathlength] = count
+                depth_query_record["path_count"] = depth_query_record["path_count"] + count
+        depth_query_record["primary"] = [element for element in query_record["primary"] if len(element[1]) <= depth]
+        if len(depth_query_record["primary"]) == 0:
+            depth_query_record["secondary"] = [(path, list(secondaryInodesFeIDs_list), perpathSecFI_IDs_list) for path, secondaryInodesFeIDs_list, perpathSecFI_IDs_list in query_record["secondary"] if len(path) <= depth] #the intermediate features are copied as the summary extends them in place
+        return depth_query_record
+    
+    def summarize_interactions(self, query_record_list, queryID_list, depth):
+        "Collect and report the primary and secondary feature interactions of the query records"
+        queryID_SIP_list = [] #List of queries to search the graph for secondary interaction paths
+        queryID_pripathfound_list = [] #collect queries for which atleast 1 primary path was found.
+        path_count, queryID_directPPF_list, queryID_indirectPPF_list, primarydirectPath_count, primaryindirectPath_count, primarydirectIP_list, primaryindirectIP_list, directprimaryFI_IDs_list, indirectprimaryFI_IDs_list = self.get_primary_interactions_from_records(query_record_list)
         
         for FI in indirectprimaryFI_IDs_list:
             if FI in directprimaryFI_IDs_list:
@@ -1243,14 +1952,13 @@ class InteractionAnalysis():
         
         #Generating primaryIPs_list (primarydirectIP_list + primaryindirectIP_list)
         primaryIPs_list = []
-        for IP in primarydirectIP_list:
-            if IP not in primaryIPs_list:
+        primaryIP_set = set() #paths of primaryIPs_list as tuples, for constant time membership tests
+        for IP in primarydirectIP_list + primaryindirectIP_list:
+            if tuple(IP) not in primaryIP_set:
+                primaryIP_set.add(tuple(IP))
                 primaryIPs_list.append(IP)
-        for IP in primaryindirectIP_list:
-            if IP not in primaryIPs_list:
-                primaryIPs_list.append(IP)
-        #Generating primaryPath_count
-        primaryPath_count = len(primaryIPs_list)
+        #Generating primaryPath_count; each path is found once and is either direct or indirect, and with the collapsed search an IP list only holds one representative per group of message paths
+        primaryPath_count = primarydirectPath_count + primaryindirectPath_count
         
         #preparing the query list for identifying secondary paths by removing the queries for which at least 1 primary interaction path has been found.
         #print("Debug!Before! len(queryID_list): ", len(queryID_list), " queryID_list: ", queryID_list, "\nlen(queryID_pripathfound_list): ", len(queryID_pripathfound_list), " queryID_pripathfound_list: ", queryID_pripathfound_list, "\nlen(queryID_SIP_list): ", len(queryID_SIP_list))
@@ -1261,8 +1969,8 @@ class InteractionAnalysis():
                 queryID_SIP_list.append(queryID)
         #print("Debug!After! len(queryID_list): ", len(queryID_list), " len(queryID_SIP_list): ", len(queryID_SIP_list))
         
-        print("\nQuerying graph to get secondary interaction paths...")
-        path_count, queryID_secondarypathfound_list, secondaryPath_count, secondaryIPs_list, secondaryFI_IDs_list, secondaryFI_IDs_dict = self.get_secondary_interactions(featureseqdiags_graph, queryID_SIP_list, nodeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, secondaryIP_list, queryID_secondarypathfound_list, componentID_name_dict, depth)
+        print("\nCollecting secondary interaction paths of the queries without primary interaction path...")
+        path_count, queryID_secondarypathfound_list, secondaryPath_count, secondaryIPs_list, secondaryFI_IDs_list, secondaryFI_IDs_dict = self.get_secondary_interactions_from_records(query_record_list)
         secondaryFI_names_list = get_listoflistnames_from_listoflistIDs(secondaryFI_IDs_list, self.featurePkgID_name_dict)
         create_table_for_interactingfeatures(secondaryFI_names_list)
         print("Debug! secondaryFI_IDs_list: ", secondaryFI_IDs_list)
@@ -1290,18 +1998,10 @@ class InteractionAnalysis():
         
         common_priANDsecIP = [] #common primary and secondary interaction path.
         for IP in secondaryIPs_list:
-            if IP in primaryIPs_list:
+            if tuple(IP) in primaryIP_set:
                 common_priANDsecIP.append(IP)
         print("Debug! Common primary & secondary IP: ", len(common_priANDsecIP))
         
-        priANDsecIP_list = [] #total primary and secondary interaction paths.
-        for IP in primaryIPs_list:
-            if IP not in priANDsecIP_list:
-                priANDsecIP_list.append(IP)
-        for IP in secondaryIPs_list:
-            if IP not in priANDsecIP_list:
-                priANDsecIP_list.append(IP)
-        
         total_FIs = [] #total primary and secondary feature interactions.
         total_FIs.extend(primaryFI_IDs_list)
         for FI in secondaryFI_IDs_list:
@@ -1324,7 +2024,7 @@ class InteractionAnalysis():
             if FI not in primaryFI_IDs_list:
                 secondaryFI_IDs_updatedlist.append(FI)
         
-        print("\nSummary Overview (of primary and secondary interactions)! depth: ", depth, "\n\nSummary_Primary_Interactions...", "\nlen(queryID_list): ", len(queryID_list), "\nqueryID_forwhich_primaryIPfound_list: ", len(queryID_pripathfound_list), "\nprimaryPaths_count: ", primaryPath_count, "\nTotal Primary FIs: ", len(primaryFI_IDs_list), "\n\nSummary_Secondary_Interactions...", "\nlen(queryID_SIP_list): ", len(queryID_SIP_list),"\nqueryID_forwhich_secondaryIPfound_list: ", len(queryID_secondarypathfound_list), "\nsecondaryPaths_count: ", secondaryPath_count, "\nTotal Secondary FIs (before removing FIs common to primary FIs): ", len(secondaryFI_IDs_list), "\nTotal Secondary FIs (after removing FIs that are same as primary ones): ", len(secondaryFI_IDs_updatedlist), "\n\nSummary_Common_Primary_and_Secondary_Interactions...", "\nlen(common_primary_and_secondaryFI): ", len(common_primary_and_secondaryFI), "\ncommon_primary_and_secondaryFI: ", get_listoflistnames_from_listoflistIDs(common_primary_and_secondaryFI, self.featurePkgID_name_dict), "\n\nSummary_Total_Interactions...", "\nlen(Query_pathFound): ", len(Query_pathFound), "\nlen(priANDsecIP_list): ", len(priANDsecIP_list), "\nlen(total_FIs): ", len(total_FIs), "\nlen(total_SafToSec_FIs): ", len(total_SafToSec_FIs), "\nlen(total_SecToSaf_FIs): ", len(total_SecToSaf_FIs), "\ntotal_FIs: ", get_listoflistnames_from_listoflistIDs(total_FIs, self.featurePkgID_name_dict), "\ntotal_SafToSec_FIs: ", get_listoflistnames_from_listoflistIDs(total_SafToSec_FIs, self.featurePkgID_name_dict), "\ntotal_SecToSaf_FIs: ", get_listoflistnames_from_listoflistIDs(total_SecToSaf_FIs, self.featurePkgID_name_dict))
+        print("\nSummary Overview (of primary and secondary interactions)! depth: ", depth, "\n\nSummary_Primary_Interactions...", "\nlen(queryID_list): ", len(queryID_list), "\nqueryID_forwhich_primaryIPfound_list: ", len(queryID_pripathfound_list), "\nprimaryPaths_count: ", primaryPath_count, "\nTotal Primary FIs: ", len(primaryFI_IDs_list), "\n\nSummary_Secondary_Interactions...", "\nlen(queryID_SIP_list): ", len(queryID_SIP_list),"\nqueryID_forwhich_secondaryIPfound_list: ", len(queryID_secondarypathfound_list), "\nsecondaryPaths_count: ", secondaryPath_count, "\nTotal Secondary FIs (before removing FIs common to primary FIs): ", len(secondaryFI_IDs_list), "\nTotal Secondary FIs (after removing FIs that are same as primary ones): ", len(secondaryFI_IDs_updatedlist), "\n\nSummary_Common_Primary_and_Secondary_Interactions...", "\nlen(common_primary_and_secondaryFI): ", len(common_primary_and_secondaryFI), "\ncommon_primary_and_secondaryFI: ", get_listoflistnames_from_listoflistIDs(common_primary_and_secondaryFI, self.featurePkgID_name_dict), "\n\nSummary_Total_Interactions...", "\nlen(Query_pathFound): ", len(Query_pathFound), "\nlen(priANDsecIP_list): ", primaryPath_count + secondaryPath_count - len(common_priANDsecIP), "\nlen(total_FIs): ", len(total_FIs), "\nlen(total_SafToSec_FIs): ", len(total_SafToSec_FIs), "\nlen(total_SecToSaf_FIs): ", len(total_SecToSaf_FIs), "\ntotal_FIs: ", get_listoflistnames_from_listoflistIDs(total_FIs, self.featurePkgID_name_dict), "\ntotal_SafToSec_FIs: ", get_listoflistnames_from_listoflistIDs(total_SafToSec_FIs, self.featurePkgID_name_dict), "\ntotal_SecToSaf_FIs: ", get_listoflistnames_from_listoflistIDs(total_SecToSaf_FIs, self.featurePkgID_name_dict))
         
         for FI in common_primary_and_secondaryFI:
             FI_tuple = tuple(FI) #FI converted from list to tuple as tuple is a hashable data type used as key in the dict secondaryFI_IDs_dict
@@ -1376,8 +2076,11 @@ class InteractionAnalysis():
         secondaryFI_IDs_withIFe.sort()
         updated_secondaryFI_IDs_withIFe = list(secondaryFI_IDs_withIFe for secondaryFI_IDs_withIFe, _ in itertools.groupby(secondaryFI_IDs_withIFe))
         print(tabulate(updated_secondaryFI_IDs_withIFe, headers = ["Interacting_source_feature", "Interacting_destination_feature", "Intermediate_features"], tablefmt = 'grid'))
+        
+        return {"depth": depth, "query_count": len(queryID_list), "primary_path_count": primaryPath_count, "secondary_path_count": secondaryPath_count, "primary_FIs": get_listoflistnames_from_listoflistIDs(primaryFI_IDs_list, self.featurePkgID_name_dict), "secondary_FIs": get_listoflistnames_from_listoflistIDs(secondaryFI_IDs_updatedlist, self.featurePkgID_name_dict), "total_FIs": get_listoflistnames_from_listoflistIDs(total_FIs, self.featurePkgID_name_dict), "secondary_FIs_with_intermediate_features": updated_secondaryFI_IDs_withIFe}
 
-def main():
+def ingest_model(iterator_type, workers = None):
+    "Extract the features, their lifelines and messages and the relevant components; returns the arguments of InteractionAnalysis as a dict"
     msgID_name_dict = {}
     featurePkgID_list = []
     featurePkgID_name_dict = {}
@@ -1390,8 +2093,6 @@ def main():
     feID_compID_dict = {}
     relevantComponentID_set = set() #this set will include both safety and security relevant components
     
-    iterator_type = 2 #configure the search to be performed in the appropriate input file (for our case study, it was input xmi file 2)
-    
     print("\nGetting security features...")
     GSeF = GetSecurityFeatures(secFeaturePkgID_list)
     secFeaturePkgID_name_dict = GSeF.get_security_feature_name(iterator_type) #search will be performed in the specified input xmi file
@@ -1412,11 +2113,11 @@ def main():
     
     print("\nAnalyzing sequence diagrams of security features to get messages and lifelines")
     GSecSDA = GetBehavioralElements(secFeaturePkgID_list, secFeaturePkgID_name_dict, secComponentID_set, secFeID_compID_dict)
-    secFeID_nodeIDset_dict, secFeID_nodeIDnamedict_dict, secFeID_edgeIDlist_dict, secFeID_edgeIDnamedict_dict, secMsgID_name_dict, secMsgID_msgSort_dict, secFeID_relMsgIDslist_dict, secFeID_msgIDnamedict_dict = GSecSDA.extract_lifelines_and_messages()
+    secFeID_nodeIDset_dict, secFeID_nodeIDnamedict_dict, secFeID_edgeIDlist_dict, secFeID_edgeIDnamedict_dict, secMsgID_name_dict, secMsgID_msgSort_dict, secFeID_relMsgIDslist_dict, secFeID_msgIDnamedict_dict = GSecSDA.extract_lifelines_and_messages(workers)
     
     print("\nAnalyzing sequence diagrams of safety features to get messages and lifelines")
     GSafSDA = GetBehavioralElements(safFeature_pkg_list, safFeaturePkgID_name_dict, safComponentID_set, safFeID_compID_dict)
-    safFeID_nodeIDset_dict, safFeID_nodeIDnamedict_dict, safFeID_edgeIDlist_dict, safFeID_edgeIDnamedict_dict, safMsgID_name_dict, safMsgID_msgSort_dict, safFeID_relMsgIDslist_dict, safFeID_msgIDnamedict_dict = GSafSDA.extract_lifelines_and_messages()
+    safFeID_nodeIDset_dict, safFeID_nodeIDnamedict_dict, safFeID_edgeIDlist_dict, safFeID_edgeIDnamedict_dict, safMsgID_name_dict, safMsgID_msgSort_dict, safFeID_relMsgIDslist_dict, safFeID_msgIDnamedict_dict = GSafSDA.extract_lifelines_and_messages(workers)
     
     msgID_name_dict.update(secMsgID_name_dict)
     msgID_name_dict.update(safMsgID_name_dict)
@@ -1441,12 +2142,70 @@ def main():
     feID_compID_dict.update(safFeID_compID_dict)
     relevantComponentID_set.update(secComponentID_set)
     relevantComponentID_set.update(safComponentID_set)
+    return {"featurePkgID_list": featurePkgID_list, "featurePkgID_name_dict": featurePkgID_name_dict, "secComponentID_set": secComponentID_set, "safComponentID_set": safComponentID_set, "secsafComponentID_set": secsafComponentID_set, "feID_nodeIDset_dict": featureID_nodeIDset_dict, "feID_nodeIDnamedict_dict": featureID_nodeIDnamedict_dict, "feID_edgeIDlist_dict": featureID_edgeIDlist_dict, "feID_edgeIDnamedict_dict": featureID_edgeIDnamedict_dict, "secFeID_compID_dict": secFeID_compID_dict, "safFeID_compID_dict": safFeID_compID_dict, "msgID_name_dict": msgID_name_dict, "secComponentID_name_dict": secComponentID_name_dict, "safComponentID_name_dict": safComponentID_name_dict, "msgID_msgSort_dict": msgID_msgSort_dict, "feID_relMsgIDslist_dict": feID_relMsgIDslist_dict, "feID_compID_dict": feID_compID_dict, "secFeaturePkgID_list": secFeaturePkgID_list, "safFeature_pkg_list": safFeature_pkg_list, "relevantComponentID_set": relevantComponentID_set}
+
+spool_analysis_dict = {} #(iterator_type, collapsed, backend, graph fingerprint) -> analysis of a spool job and its graph, see get_spool_analysis
+
+def get_spool_analysis(iterator_type, collapsed, backend, graph_fingerprint):
+    "Analysis of a spool job in a worker process, rebuilt from the model of the worker, and the arguments of its get_query_record_chunk"
+    analysis_key = (iterator_type, collapsed, backend, graph_fingerprint)
+    if analysis_key not in spool_analysis_dict:
+        print("Debug! Spool worker rebuilding the analysis from the model (iterator_type: ", iterator_type, ")")
+        GINA = InteractionAnalysis(**ingest_model(iterator_type))
+        componentID_name_dict, nodeID_name_dict, secnodeID_set, safnodeID_set, secsafnodeID_set, featureseqdiags_graph, queryID_list = GINA.get_interaction_graph_and_queries()
+        worker_graph_fingerprint = get_graph_fingerprint(featureseqdiags_graph)
+        if worker_graph_fingerprint != graph_fingerprint:
+            raise ValueError("Graph of the spool worker differs from the graph of the analysis (fingerprint {} instead of {}); the worker needs the same input files and configurable inputs".format(worker_graph_fingerprint, graph_fingerprint))
+        graph = create_interaction_graph_from_nx(featureseqdiags_graph) if collapsed else GINA.get_edgepath_graph(featureseqdiags_graph, collapsed, backend)
+        spool_analysis_dict.clear() #the analyses of earlier jobs are not kept
+        spool_analysis_dict[analysis_key] = (GINA, graph, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict)
+    return spool_analysis_dict[analysis_key]
+
+def create_query_record_task(job_config_dict):
+    "Task function of a spool job of get_query_record_list: the query records of a shard and its budget update"
+    GINA, graph, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict = get_spool_analysis(job_config_dict["iterator_type"], job_config_dict["collapsed"], job_config_dict["backend"], job_config_dict["graph_fingerprint"])
+    budget = None if job_config_dict["budget"] is None else EnumerationBudget(**job_config_dict["budget"])
+    return lambda queryID_chunk_list: GINA.get_query_record_chunk(graph, nodeID_name_dict, secnodeID_set, safnodeID_set, componentID_name_dict, job_config_dict["depth"], job_config_dict["collapsed"], job_config_dict["keep_all_secondary"], job_config_dict["bidirectional"], budget, queryID_chunk_list)
+
+register_spool_task("X-I-FASST.query_records", create_query_record_task)
+
+def main():
+    if spool_worker_mode:
+        print("\nDebug! Spool worker waiting for work units in: ", work_spool_dir)
+        run_spool_worker(work_spool_dir, spool_worker_idle_seconds)
+        return
+    iterator_type = 2 #configure the search to be performed in the appropriate input file (for our case study, it was input xmi file 2)
+    model_dict = ingest_model(iterator_type, parallel_workers)
     
     depth = 2 #cutoff for edge path search
     
+    enumeration_budget = None
+    if any(value is not None for value in enumeration_budget_dict.values()):
+        enumeration_budget = EnumerationBudget(**enumeration_budget_dict)
+    
     print("\nDebug! Performing interaction analysis of security and safety features")
-    GINA = InteractionAnalysis(featurePkgID_list, featurePkgID_name_dict, secComponentID_set, safComponentID_set, secsafComponentID_set, featureID_nodeIDset_dict, featureID_nodeIDnamedict_dict, featureID_edgeIDlist_dict, featureID_edgeIDnamedict_dict, secFeID_compID_dict, safFeID_compID_dict, msgID_name_dict, secComponentID_name_dict, safComponentID_name_dict, msgID_msgSort_dict, feID_relMsgIDslist_dict, feID_compID_dict, secFeaturePkgID_list, safFeature_pkg_list, relevantComponentID_set)
-    GINA.get_interaction_list(depth)
+    GINA = InteractionAnalysis(**model_dict)
+    GINA.iterator_type = iterator_type
+    if work_spool_dir is not None:
+        GINA.work_queue = SpoolWorkQueue(work_spool_dir, spool_shard_size, spool_local_workers)
+    if count_only_mode and len(sweep_depth_list) != 0:
+        GINA.get_interaction_counts(sweep_depth_list, sweep_bundle_file)
+    elif count_only_mode:
+        GINA.get_interaction_counts([depth])
+    elif len(sweep_depth_list) != 0:
+        GINA.get_interaction_sweep(sweep_depth_list, sweep_bundle_file, collapsed_path_search, bidirectional_path_search, path_backend, enumeration_budget, parallel_workers)
+    elif interaction_stream_file is not None:
+        write_interaction_stream(GINA.iter_interactions(depth, collapsed_path_search, bidirectional_path_search, path_backend, enumeration_budget), interaction_stream_file, {"method": "X-I-FASST", "depth": depth})
+    elif depth_plan_mode:
+        GINA.get_query_depth_plan()
+    elif feature_matrix_mode:
+        GINA.get_feature_interaction_matrix(depth, feature_evidence_pair_list, collapsed_path_search, bidirectional_path_search, path_backend, parallel_workers)
+    elif len(model_revision_list) != 0:
+        GINA.get_incremental_interaction_list(depth, collapsed_path_search, bidirectional_path_search, path_backend)
+        for revision_dict in model_revision_list:
+            GINA.update_interaction_list(revision_dict.get("added_messages"), revision_dict.get("removed_messages", ()), revision_dict.get("added_components"), revision_dict.get("removed_components", ()), revision_dict.get("component_features"), revision_dict.get("message_features"))
+    else:
+        GINA.get_interaction_list(depth, collapsed_path_search, bidirectional_path_search, path_backend, enumeration_budget, parallel_workers)
     
     stop = timeit.default_timer()
     print('Time: ', stop - start)
@@ -0,0 +1,68 @@
+# Copyright (c) 2024 Robert Bosch GmbH
+# SPDX-License-Identifier: MIT
+
+import os
+import sys
+import random
+import pytest
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'code'))
+X_I_FASST = pytest.importorskip("X_I_FASST") #needs the library of X-I-FASST in its lib directory
+
+secFeatureID_list = ['S0', 'S1']
+safFeatureID_list = ['A0', 'A1']
+search_list = [(True, False, "networkx"), (True, True, "networkx"), (False, False, "networkx")] #collapsed, bidirectional, backend
+
+def create_model_dict(feID_compID_dict, feID_edgeIDlist_dict, feID_relMsgIDslist_dict):
+    "Arguments of InteractionAnalysis for features with their relevant components, messages and relevant messages, as ingest_model returns them"
+    secFeID_compID_dict = {featureID: list(feID_compID_dict[featureID]) for featureID in secFeatureID_list}
+    safFeID_compID_dict = {featureID: list(feID_compID_dict[featureID]) for featureID in safFeatureID_list}
+    secComponentID_set = set(componentID for componentID_list in secFeID_compID_dict.values() for componentID in componentID_list)
+    safComponentID_set = set(componentID for componentID_list in safFeID_compID_dict.values() for componentID in componentID_list)
+    secsafComponentID_set = secComponentID_set & safComponentID_set
+    featureID_list = secFeatureID_list + safFeatureID_list
+    feID_nodeIDset_dict = {featureID: set(nodeID for edge in feID_edgeIDlist_dict[featureID] for nodeID in edge[:2]) for featureID in featureID_list}
+    return {"featurePkgID_list": featureID_list, "featurePkgID_name_dict": {featureID: 'F' + featureID for featureID in featureID_list}, "secComponentID_set": secComponentID_set - secsafComponentID_set, "safComponentID_set": safComponentID_set - secsafComponentID_set, "secsafComponentID_set": secsafComponentID_set,
+        "feID_nodeIDset_dict": feID_nodeIDset_dict, "feID_nodeIDnamedict_dict": {featureID: {nodeID: 'N' + nodeID for nodeID in feID_nodeIDset_dict[featureID]} for featureID in featureID_list}, "feID_edgeIDlist_dict": feID_edgeIDlist_dict, "feID_edgeIDnamedict_dict": {featureID: {edge[2]: 'M' + edge[2] for edge in feID_edgeIDlist_dict[featureID]} for featureID in featureID_list},
+        "secFeID_compID_dict": secFeID_compID_dict, "safFeID_compID_dict": safFeID_compID_dict, "msgID_name_dict": {edge[2]: 'M' + edge[2] for edge_list in feID_edgeIDlist_dict.values() for edge in edge_list}, "secComponentID_name_dict": {}, "safComponentID_name_dict": {}, "msgID_msgSort_dict": {},
+        "feID_relMsgIDslist_dict": feID_relMsgIDslist_dict, "feID_compID_dict": dict(secFeID_compID_dict, **safFeID_compID_dict), "secFeaturePkgID_list": secFeatureID_list, "safFeature_pkg_list": safFeatureID_list, "relevantComponentID_set": (secComponentID_set | safComponentID_set) - secsafComponentID_set}
+
+def create_random_feature_dicts(seed, node_count=8, edge_count=30):
+    "Random relevant components, messages and relevant messages of the features"
+    rnd = random.Random(seed)
+    nodeID_list = ['C{}'.format(index) for index in range(node_count)]
+    feID_compID_dict = {featureID: rnd.sample(nodeID_list, 2) for featureID in secFeatureID_list + safFeatureID_list}
+    feID_edgeIDlist_dict = {featureID: [] for featureID in feID_compID_dict}
+    for index in range(edge_count):
+        feID_edgeIDlist_dict[rnd.choice(list(feID_compID_dict))].append(tuple(rnd.sample(nodeID_list, 2)) + ('m{}'.format(index),))
+    feID_relMsgIDslist_dict = {featureID: [edge[2] for edge in edge_list if rnd.random() < 0.4] for featureID, edge_list in feID_edgeIDlist_dict.items()}
+    return feID_compID_dict, feID_edgeIDlist_dict, feID_relMsgIDslist_dict
+
+def get_fresh_summary(model_dict, graph, depth, search):
+    "Summary of get_interaction_list on the revised model and graph"
+    GINA = X_I_FASST.InteractionAnalysis(**model_dict)
+    GINA.shared_graph = graph.copy()
+    return GINA.get_interaction_list(depth, search[0], search[1], search[2])
+
+def test_revised_interaction_list_is_fresh_interaction_list(capsys):
+    for seed in range(8):
+        for search in search_list:
+            feID_compID_dict, feID_edgeIDlist_dict, feID_relMsgIDslist_dict = create_random_feature_dicts(seed)
+            GINA = X_I_FASST.InteractionAnalysis(**create_model_dict(feID_compID_dict, feID_edgeIDlist_dict, feID_relMsgIDslist_dict))
+            assert GINA.get_incremental_interaction_list(3, search[0], search[1], search[2]) == get_fresh_summary(create_model_dict(feID_compID_dict, feID_edgeIDlist_dict, feID_relMsgIDslist_dict), GINA.dynamic_dict["graph"], 3, search)
+            
+            #revision: a new component relevant for a safety feature with a message relevant for a security feature, a removed relevant component and a removed message
+            removed_componentID = feID_compID_dict['S1'][0]
+            removed_edge = next(edge for edge_list in feID_edgeIDlist_dict.values() for edge in edge_list if removed_componentID not in edge[:2])
+            added_edge_list = [('C0' if removed_componentID != 'C0' else 'C1', 'X', 'x0'), ('X', feID_compID_dict['S0'][0], 'x1')]
+            added_edge_list = [edge for edge in added_edge_list if edge[0] != edge[1]]
+            summary = GINA.update_interaction_list({edge: 'M' + edge[2] for edge in added_edge_list}, [removed_edge], {'X': 'NX'}, [removed_componentID], {'X': ['A1']}, {'x1': ['S0']})
+            
+            for featureID in feID_compID_dict:
+                feID_compID_dict[featureID] = [componentID for componentID in feID_compID_dict[featureID] if componentID != removed_componentID]
+                feID_edgeIDlist_dict[featureID] = [edge for edge in feID_edgeIDlist_dict[featureID] if edge != removed_edge and removed_componentID not in edge[:2]]
+            feID_compID_dict['A1'].append('X')
+            feID_edgeIDlist_dict['A1'].extend(added_edge_list)
+            feID_relMsgIDslist_dict['S0'].append('x1')
+            assert 'X' in GINA.relevantComponentID_set and removed_componentID not in GINA.relevantComponentID_set
+            assert summary == get_fresh_summary(create_model_dict(feID_compID_dict, feID_edgeIDlist_dict, feID_relMsgIDslist_dict), GINA.dynamic_dict["graph"], 3, search)
+    capsys.readouterr()
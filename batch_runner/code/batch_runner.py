@@ -0,0 +1,267 @@
+# Copyright (c) 2024 Robert Bosch GmbH
+# SPDX-License-Identifier: MIT
+
+import os
+import sys
+import time
+import json
+import signal
+import contextlib
+import traceback
+import importlib.util
+import multiprocessing
+import multiprocessing.connection
+from lxml import etree
+from tabulate import tabulate
+try:
+    import resource #memory cap of the model processes (not available on Windows)
+except ImportError:
+    resource = None
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', 'path_engine', 'code'))
+from path_engine import write_result_bundle, read_result_bundle
+
+######################################Configurable inputs#####################################
+dirname = os.path.dirname(__file__)
+
+batch_manifest_file = os.path.join(dirname, '..', 'data', 'batch_manifest.json') #Specify the manifest of the models to be analysed, a JSON list with one dict per model e.g. [{"name": "ECU_A", "method": "X-I-FASST", "model_dir": "ECU_A", "memory_limit_mb": 8192, "config": {"secFeaturePkgID_list": [...], "path_backend": "csr"}}]; "model_dir" (relative to the manifest) holds inputfile1.xml, inputfile2.xml, ...
+batch_workers = None #number of models analysed at the same time e.g. os.cpu_count(); None or 1 analyses the models one after the other
+model_memory_limit_mb = None #memory cap in MB of each process of a model and of the total memory of its processes, a model that exceeds it gets the status 'memory_limit'; "memory_limit_mb" in the manifest overrides it per model. None means no cap
+memory_poll_seconds = 0.5 #interval at which the total memory of the running models is checked against their cap
+batch_output_dir = os.path.join(dirname, '..', 'build', "batch_" + time.strftime("%Y%m%d-%H%M%S")) #directory of the per-model result bundles, console logs and output files
+path_cache_dir = os.path.join(dirname, '..', 'build', 'path_cache') #directory of the persisted path cache of each model (methods with a path cache), reused by the next batch run; None keeps the caches in memory only
+
+#Method modules and the number of their input xml files
+method_module_path_dict = {"FIISS": os.path.join(dirname, '..', '..', 'FIISS', 'code', 'FIISS.py'), "I-FASST": os.path.join(dirname, '..', '..', 'I-FASST', 'code', 'I_FASST.py'), "X-I-FASST": os.path.join(dirname, '..', '..', 'X-I-FASST', 'code', 'X_I_FASST.py')}
+input_file_count = 7
+
+#Define namespace
+ns = {
+    'uml':'http://schema.omg.org/spec/UML/2.1',
+    'xmi':'http://schema.omg.org/spec/XMI/2.1',
+    'SysML':'http://www.omg.org/spec/SysML/20120322/SysML',
+    'sysml':'http://www.omg.org/spec/SysML/20080501/SysML-profile'
+    }
+##############################################################################################
+
+method_module_dict = {} #method -> imported module, shared by all models of the method
+
+def read_manifest(manifest_file):
+    "Models of the manifest; model_dir is resolved relative to the manifest and each model gets a unique name"
+    with open(manifest_file) as json_file:
+        model_list = json.load(json_file)
+    manifest_dir = os.path.dirname(os.path.abspath(manifest_file))
+    name_set = set()
+    for index, model_dict in enumerate(model_list):
+        if model_dict.get("method") not in method_module_path_dict:
+            raise ValueError("Unknown method of model {}: {}".format(index, model_dict.get("method")))
+        model_dict.setdefault("name", "model{}".format(index))
+        if model_dict["name"] in name_set:
+            raise ValueError("Duplicate model name in the manifest: {}".format(model_dict["name"]))
+        name_set.add(model_dict["name"])
+        if model_dict.get("model_dir") is not None:
+            model_dict["model_dir"] = os.path.join(manifest_dir, model_dict["model_dir"])
+    return model_list
+
+def load_method_module(method, module_path = None):
+    "Import the module of a method once; the models of the method reuse it"
+    if method not in method_module_dict:
+        if module_path is None:
+            module_path = method_module_path_dict[method]
+        module_name = os.path.splitext(os.path.basename(module_path))[0]
+        spec = importlib.util.spec_from_file_location(module_name, module_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+        method_module_dict[method] = module
+    return method_module_dict[method]
+
+def get_model_iterator_function(root_list):
+    "get_iterator(path, iterator_type) over the parsed input files of a model, i.e. iterator_type 1 searches inputfile1.xml of the model"
+    return lambda path, iterator_type: root_list[iterator_type - 1].iterfind(path=path, namespaces=ns)
+
+def configure_model(module, model_dict, output_dir):
+    "Set the configurable inputs of the method module for a model: its input files, its config and its output files"
+    name = model_dict["name"]
+    for key, value in model_dict.get("config", {}).items():
+        if not hasattr(module, key):
+            raise ValueError("Unknown configurable input of {}: {}".format(model_dict["method"], key))
+        setattr(module, key, value)
+    if model_dict.get("model_dir") is not None:
+        file_path_list = [os.path.join(model_dict["model_dir"], "inputfile{}.xml".format(index + 1)) for index in range(input_file_count)]
+        if hasattr(module, "load_input_files"): #FIISS parses its input files in main()
+            for index, file_path in enumerate(file_path_list):
+                setattr(module, "file_path_inputfile{}".format(index + 1), file_path)
+        else: #the other methods search the input files with get_iterator of their library
+            module.get_iterator = get_model_iterator_function([etree.parse(file_path).getroot() if os.path.exists(file_path) else None for file_path in file_path_list])
+    config_dict = model_dict.get("config", {})
+    if hasattr(module, "sweep_bundle_file") and "sweep_bundle_file" not in config_dict:
+        module.sweep_bundle_file = os.path.join(output_dir, name + "_sweep.json")
+    if hasattr(module, "interaction_sequences"):
+        module.interaction_sequences = os.path.join(output_dir, name + "_interaction_sequences.txt")
+    if hasattr(module, "output_file_nxdraw"):
+        module.output_file_nxdraw = os.path.join(output_dir, name + "_nx_graph.png")
+    if hasattr(module, "path_cache_file") and "path_cache_file" not in config_dict and path_cache_dir is not None:
+        if not os.path.exists(path_cache_dir):
+            os.makedirs(path_cache_dir)
+        module.path_cache_file = os.path.join(path_cache_dir, name + "_path_cache.pkl")
+
+def set_memory_limit(memory_limit_mb):
+    "Cap the address space of the current process"
+    if memory_limit_mb is None:
+        return
+    if resource is None:
+        print("Warning! Memory cap is not supported on this platform, the model runs without a cap")
+        return
+    hard_limit = resource.getrlimit(resource.RLIMIT_AS)[1]
+    soft_limit = int(memory_limit_mb) * 1024 * 1024
+    if hard_limit != resource.RLIM_INFINITY:
+        soft_limit = min(soft_limit, hard_limit)
+    resource.setrlimit(resource.RLIMIT_AS, (soft_limit, hard_limit))
+
+def get_model_memory_limit(model_dict):
+    return model_dict.get("memory_limit_mb", model_memory_limit_mb)
+
+def get_process_tree_pid_list(pid):
+    "Process ID and the IDs of all its descendants, from the parent IDs in /proc (Linux)"
+    childpid_dict = {}
+    for name in os.listdir("/proc"):
+        if name.isdigit():
+            try:
+                with open(os.path.join("/proc", name, "stat")) as stat_file:
+                    ppid = int(stat_file.read().rsplit(")", 1)[1].split()[1])
+            except (OSError, IndexError, ValueError): #the process ended
+                continue
+            childpid_dict.setdefault(ppid, []).append(int(name))
+    pid_list = [pid]
+    for treepid in pid_list:
+        pid_list.extend(childpid_dict.get(treepid, ()))
+    return pid_list
+
+def get_process_memory_mb(pid):
+    "Proportional set size of a process in MB, or its RSS without smaps_rollup; 0 for a process that ended"
+    for file_name, field in (("smaps_rollup", "Pss:"), ("status", "VmRSS:")):
+        try:
+            with open(os.path.join("/proc", str(pid), file_name)) as memory_file:
+                for line in memory_file:
+                    if line.startswith(field):
+                        return int(line.split()[1]) / 1024.0
+        except OSError:
+            continue
+    return 0.0
+
+def get_process_tree_memory_mb(pid):
+    "Total memory of a process and its descendants (see get_process_memory_mb); None where /proc is not available"
+    if not os.path.isdir("/proc"):
+        return None
+    return sum(get_process_memory_mb(treepid) for treepid in get_process_tree_pid_list(pid))
+
+def kill_process_tree(pid):
+    for treepid in reversed(get_process_tree_pid_list(pid)):
+        try:
+            os.kill(treepid, signal.SIGKILL)
+        except OSError:
+            pass
+
+def get_model_bundle_file(model_dict, output_dir):
+    return os.path.join(output_dir, model_dict["name"] + ".json")
+
+def run_model(model_dict, output_dir):
+    "Analyse one model of the manifest by the main() of its method, in a process of its own"
+    log_file = os.path.join(output_dir, model_dict["name"] + ".log")
+    model_record = {"model": model_dict["name"], "method": model_dict["method"], "model_dir": model_dict.get("model_dir"), "status": "ok", "error": None, "seconds": None, "max_rss_mb": None, "log_file": log_file, "bundle_files": []}
+    start_time = time.time()
+    with open(log_file, "w") as log, contextlib.redirect_stdout(log):
+        try:
+            set_memory_limit(get_model_memory_limit(model_dict))
+            module = load_method_module(model_dict["method"])
+            configure_model(module, model_dict, output_dir)
+            module.main()
+        except MemoryError:
+            model_record["status"] = "memory_limit"
+            model_record["error"] = "MemoryError"
+        except Exception as error:
+            model_record["status"] = "failed"
+            model_record["error"] = repr(error)
+            traceback.print_exc(file=log)
+    model_record["seconds"] = time.time() - start_time
+    if resource is not None:
+        model_record["max_rss_mb"] = max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss) / 1024.0 #peak of the model process or of its largest worker process
+    sweep_bundle_file = os.path.join(output_dir, model_dict["name"] + "_sweep.json")
+    if os.path.exists(sweep_bundle_file):
+        model_record["bundle_files"].append(sweep_bundle_file)
+    write_result_bundle(model_record, get_model_bundle_file(model_dict, output_dir))
+
+def get_model_record(model_dict, output_dir, exitcode, peak_memory_mb=None, killed_memory_mb=None):
+    "Batch record of a finished model process with the peak total memory of its processes"
+    bundle_file = get_model_bundle_file(model_dict, output_dir)
+    if exitcode == 0 and killed_memory_mb is None and os.path.exists(bundle_file):
+        model_record = read_result_bundle(bundle_file)
+    else:
+        model_record = {"model": model_dict["name"], "method": model_dict["method"], "model_dir": model_dict.get("model_dir"), "status": "crashed", "error": "exit code {}".format(exitcode), "seconds": None, "max_rss_mb": None, "log_file": os.path.join(output_dir, model_dict["name"] + ".log"), "bundle_files": []}
+        if killed_memory_mb is not None:
+            model_record["status"] = "memory_limit"
+            model_record["error"] = "total memory of {} MB exceeded the cap".format(round(killed_memory_mb))
+    model_record["peak_memory_mb"] = peak_memory_mb
+    write_result_bundle(model_record, bundle_file)
+    return model_record
+
+def check_model_memory(running_dict, memory_dict):
+    "Kill the processes of the running models whose total memory exceeds their cap"
+    for sentinel, (process, index, model_dict) in running_dict.items():
+        memory_mb = get_process_tree_memory_mb(process.pid)
+        if memory_mb is None:
+            return
+        memory_list = memory_dict.setdefault(sentinel, [None, None])
+        if memory_mb > 0: #0 once the process ended
+            memory_list[0] = max(memory_list[0] or 0.0, memory_mb)
+        memory_limit_mb = get_model_memory_limit(model_dict)
+        if memory_limit_mb is not None and memory_mb > memory_limit_mb and memory_list[1] is None:
+            print("Warning! Model: ", model_dict["name"], " uses ", round(memory_mb), " MB in total, more than its cap of ", memory_limit_mb, " MB, it is stopped")
+            memory_list[1] = memory_mb
+            kill_process_tree(process.pid)
+
+def run_batch(model_list, workers, output_dir):
+    "Analyse the models with up to workers model processes at the same time; the records are in manifest order"
+    if not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+    start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+    if start_method == "fork":
+        for method in sorted(set(model_dict["method"] for model_dict in model_list)):
+            load_method_module(method)
+    context = multiprocessing.get_context(start_method)
+    pending_list = list(enumerate(model_list))
+    running_dict = {} #process sentinel -> (process, manifest index, model)
+    memory_dict = {} #process sentinel -> [peak total memory, total memory when killed]
+    model_record_dict = {}
+    while pending_list or running_dict:
+        while pending_list and len(running_dict) < max(1, workers or 1):
+            index, model_dict = pending_list.pop(0)
+            print("Debug! Starting model: ", model_dict["name"], " method: ", model_dict["method"])
+            process = context.Process(target=run_model, args=(model_dict, output_dir)) #not a daemon, so the method can run its own process pool
+            process.start()
+            running_dict[process.sentinel] = (process, index, model_dict)
+        check_model_memory(running_dict, memory_dict)
+        for sentinel in multiprocessing.connection.wait(list(running_dict), memory_poll_seconds):
+            process, index, model_dict = running_dict.pop(sentinel)
+            process.join()
+            memory_list = memory_dict.pop(sentinel, [None, None])
+            model_record_dict[index] = get_model_record(model_dict, output_dir, process.exitcode, memory_list[0], memory_list[1])
+            print("Debug! Finished model: ", model_dict["name"], " status: ", model_record_dict[index]["status"])
+    return [model_record_dict[index] for index in range(len(model_list))]
+
+def print_batch_report(model_record_list):
+    table_list = [[model_record["model"], model_record["method"], model_record["status"], "-" if model_record["seconds"] is None else round(model_record["seconds"], 1), "-" if model_record["max_rss_mb"] is None else round(model_record["max_rss_mb"]), "-" if model_record.get("peak_memory_mb") is None else round(model_record["peak_memory_mb"]), model_record["log_file"]] for model_record in model_record_list]
+    print(tabulate(table_list, headers = ["Model", "Method", "Status", "Seconds", "Peak RSS (MB)", "Peak total (MB)", "Log"]))
+
+def main():
+    start = time.time()
+    model_list = read_manifest(batch_manifest_file)
+    print("\nDebug! Batch of ", len(model_list), " models from the manifest: ", batch_manifest_file)
+    model_record_list = run_batch(model_list, batch_workers, batch_output_dir)
+    write_result_bundle({"manifest": os.path.abspath(batch_manifest_file), "models": model_record_list}, os.path.join(batch_output_dir, "batch_summary.json"))
+    print("\n")
+    print_batch_report(model_record_list)
+    print('Time: ', time.time() - start)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Copyright (c) 2024 Robert Bosch GmbH
+# SPDX-License-Identifier: MIT
+
+import os
+import sys
+import json
+import pytest
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'code'))
+batch_runner = pytest.importorskip("batch_runner") #needs lxml
+
+fake_method_code = '''
+import time
+import multiprocessing
+worker_count = 0 #configurable inputs of the fake method
+worker_memory_mb = 0
+worker_seconds = 1
+memory_mb = 0
+fail = False
+
+def hold_memory(memory_mb, seconds):
+    data = b"x" * (memory_mb * 1024 * 1024)
+    time.sleep(seconds)
+
+def main():
+    print("Debug! Fake method with workers: ", worker_count)
+    if fail:
+        raise ValueError("fake failure")
+    data = b"x" * (memory_mb * 1024 * 1024)
+    process_list = [multiprocessing.get_context("fork").Process(target=hold_memory, args=(worker_memory_mb, worker_seconds)) for index in range(worker_count)]
+    for process in process_list:
+        process.start()
+    for process in process_list:
+        process.join()
+'''
+
+@pytest.fixture
+def fake_method(tmp_path, monkeypatch):
+    "Method 'Fake' of the batch runner, imported from a module written into tmp_path"
+    module_file = tmp_path / "fake_method.py"
+    module_file.write_text(fake_method_code)
+    monkeypatch.setitem(batch_runner.method_module_path_dict, "Fake", str(module_file))
+    monkeypatch.setattr(batch_runner, "method_module_dict", {})
+    monkeypatch.setattr(batch_runner, "path_cache_dir", None)
+    monkeypatch.setattr(batch_runner, "memory_poll_seconds", 0.1)
+    return tmp_path
+
+def run_manifest(tmp_path, model_list):
+    manifest_file = tmp_path / "manifest.json"
+    manifest_file.write_text(json.dumps(model_list))
+    return batch_runner.run_batch(batch_runner.read_manifest(str(manifest_file)), 2, str(tmp_path / "out"))
+
+def test_batch_records_are_in_manifest_order(fake_method):
+    model_record_list = run_manifest(fake_method, [{"method": "Fake", "model_dir": "model_a"}, {"name": "failing", "method": "Fake", "config": {"fail": True}}, {"method": "Fake", "config": {"unknown_input": 1}}])
+    assert [(model_record["model"], model_record["status"]) for model_record in model_record_list] == [("model0", "ok"), ("failing", "failed"), ("model2", "failed")]
+    assert model_record_list[0]["model_dir"] == str(fake_method / "model_a")
+    assert "ValueError('fake failure')" == model_record_list[1]["error"]
+    with open(model_record_list[0]["log_file"]) as log:
+        assert "Fake method with workers:  0" in log.read()
+    with pytest.raises(ValueError):
+        run_manifest(fake_method, [{"name": "twice", "method": "Fake"}, {"name": "twice", "method": "Fake"}])
+
+def test_memory_cap_of_a_process(fake_method):
+    model_record_list = run_manifest(fake_method, [{"method": "Fake", "memory_limit_mb": 2048, "config": {"memory_mb": 4096}}]) #the allocation exceeds the address space cap before any page is used
+    assert model_record_list[0]["status"] == "memory_limit"
+
+@pytest.mark.skipif(not os.path.isdir("/proc"), reason = "the total memory of a model is read from /proc")
+def test_memory_cap_of_all_processes_of_a_model(fake_method, monkeypatch):
+    monkeypatch.setattr(batch_runner, "set_memory_limit", lambda memory_limit_mb: None) #only the total memory is capped
+    model_record_list = run_manifest(fake_method, [{"method": "Fake", "memory_limit_mb": 200, "config": {"worker_count": 3, "worker_memory_mb": 100, "worker_seconds": 30}}, {"method": "Fake", "memory_limit_mb": 200, "config": {"worker_count": 3, "worker_memory_mb": 10}}])
+    assert [model_record["status"] for model_record in model_record_list] == ["memory_limit", "ok"]
+    assert model_record_list[0]["peak_memory_mb"] > 200
@@ -0,0 +1,1545 @@
+# Copyright (c) 2024 Robert Bosch GmbH
+# SPDX-License-Identifier: MIT
+
+import json, os, sys
+import io
+import contextlib
+import gc
+import multiprocessing
+from multiprocessing import shared_memory
+import heapq
+import hashlib
+import itertools
+import pickle
+import shutil
+import socket
+import threading
+import time
+import traceback
+from collections import OrderedDict
+import numpy as np
+
+class InteractionGraph():
+    "Interned adjacency of a component interaction graph with the messages as edges, in the insertion order of networkx"
+    def __init__(self, nodeIDs=(), edgeIDs_list=()):
+        self.nodeID_list = [] #index -> node ID
+        self.nodeID_index_dict = {} #node ID -> index
+        self.succ_list = [] #for each node index, a dict {dst index: [msgIDs]}
+        self.pred_list = [] #for each node index, a dict {src index: [msgIDs]}
+        self.edge_count = 0
+        self.backwardPartial_dict = {} #cache of the backward partial paths of the bidirectional search, cleared when the graph changes
+        self.succRank_list = None #adjacency ranks of the successors (see get_succ_rank_list), cleared when the graph changes
+        for nodeID in nodeIDs:
+            self.add_node(nodeID)
+        for edge in edgeIDs_list:
+            self.add_edge(edge[0], edge[1], edge[2])
+
+    def add_node(self, nodeID):
+        "Intern a node ID and return its index"
+        index = self.nodeID_index_dict.get(nodeID)
+        if index is None:
+            index = len(self.nodeID_list)
+            self.nodeID_list.append(nodeID)
+            self.nodeID_index_dict[nodeID] = index
+            self.succ_list.append({})
+            self.pred_list.append({})
+            self.backwardPartial_dict = {}
+            self.succRank_list = None
+        return index
+
+    def add_edge(self, src, dst, msgID):
+        "Add a message edge; like networkx, an edge that already exists with the same key (msgID) is not added twice"
+        srcIndex = self.add_node(src)
+        dstIndex = self.add_node(dst)
+        msgIDs_list = self.succ_list[srcIndex].setdefault(dstIndex, [])
+        if msgID in msgIDs_list:
+            return False
+        msgIDs_list.append(msgID)
+        self.pred_list[dstIndex].setdefault(srcIndex, []).append(msgID)
+        self.edge_count = self.edge_count + 1
+        self.backwardPartial_dict = {}
+        self.succRank_list = None
+        return True
+
+    def has_node(self, nodeID):
+        return nodeID in self.nodeID_index_dict
+
+    def number_of_nodes(self):
+        return len(self.nodeID_list)
+
+    def number_of_edges(self):
+        return self.edge_count
+
+    def edges(self):
+        "Iterate over all edges as (srcID, dstID, msgID) in adjacency order"
+        for srcIndex, succ_dict in enumerate(self.succ_list):
+            src = self.nodeID_list[srcIndex]
+            for dstIndex, msgIDs_list in succ_dict.items():
+                dst = self.nodeID_list[dstIndex]
+                for msgID in msgIDs_list:
+                    yield (src, dst, msgID)
+
+    def get_simple_node_paths(self, src, dst, depth=None, avoid_set=None, require_set=None, budget=None):
+        "Collapsed search: simple node paths from src to dst with at most depth edges, parallel messages counting as one edge"
+        srcIndex = self.nodeID_index_dict.get(src)
+        dstIndex = self.nodeID_index_dict.get(dst)
+        if srcIndex is None or dstIndex is None:
+            return
+        if srcIndex == dstIndex: #like networkx, the empty path
+            if require_set is None and (budget is None or budget.add_path()):
+                yield [srcIndex]
+            return
+        if depth is None or depth > self.number_of_nodes() - 1:
+            depth = self.number_of_nodes() - 1
+        if depth < 1:
+            return
+        avoidIndex_set = self.get_index_set(avoid_set, (srcIndex, dstIndex))
+        requireIndex_set = self.get_index_set(require_set, (srcIndex, dstIndex))
+        if require_set is not None and len(requireIndex_set) == 0:
+            return
+        distance_list = self.get_distances_to_target(dstIndex, avoidIndex_set, requireIndex_set)
+        required_flag = 0 if require_set is not None else 1 #1 once the path contains a required intermediate node
+        nodepath_list = [srcIndex]
+        onpath_set = {srcIndex}
+        requiredcount = 0
+        stack = [iter(self.succ_list[srcIndex])]
+        while stack:
+            nextIndex = next(stack[-1], None)
+            if nextIndex is None:
+                stack.pop()
+                popped = nodepath_list.pop()
+                onpath_set.discard(popped)
+                if popped in requireIndex_set:
+                    requiredcount = requiredcount - 1
+            elif nextIndex in onpath_set:
+                continue
+            elif nextIndex == dstIndex:
+                if required_flag == 1 or requiredcount > 0:
+                    if budget is not None and not budget.add_path():
+                        return
+                    yield nodepath_list + [dstIndex]
+            elif nextIndex in avoidIndex_set:
+                continue
+            else:
+                seen = 1 if (required_flag == 1 or requiredcount > 0 or nextIndex in requireIndex_set) else 0
+                if len(nodepath_list) + distance_list[seen][nextIndex] > depth: #lower bound of the path length through nextIndex
+                    continue
+                if budget is not None and not budget.expand():
+                    return
+                nodepath_list.append(nextIndex)
+                onpath_set.add(nextIndex)
+                if nextIndex in requireIndex_set:
+                    requiredcount = requiredcount + 1
+                stack.append(iter(self.succ_list[nextIndex]))
+
+    def get_bidirectional_node_paths(self, src, dst, depth=None, avoid_set=None, require_set=None, budget=None):
+        "Meet-in-the-middle variant of get_simple_node_paths with the same paths in the same order"
+        srcIndex = self.nodeID_index_dict.get(src)
+        dstIndex = self.nodeID_index_dict.get(dst)
+        if srcIndex is None or dstIndex is None:
+            return
+        if srcIndex == dstIndex: #like networkx, the empty path
+            if require_set is None and (budget is None or budget.add_path()):
+                yield [srcIndex]
+            return
+        if depth is None or depth > self.number_of_nodes() - 1:
+            depth = self.number_of_nodes() - 1
+        if depth < 1:
+            return
+        avoidIndex_set = self.get_index_set(avoid_set, (srcIndex, dstIndex))
+        requireIndex_set = self.get_index_set(require_set, (srcIndex, dstIndex))
+        if require_set is not None and len(requireIndex_set) == 0:
+            return
+        distance_list = self.get_distances_to_target(dstIndex, avoidIndex_set, requireIndex_set)
+        required_flag = 0 if require_set is not None else 1
+        if distance_list[required_flag][srcIndex] > depth:
+            return
+        query_dict = {"dst": dstIndex, "depth": depth, "forwardlength": (depth + 1) // 2, "avoid": avoidIndex_set, "require": requireIndex_set, "required": required_flag == 1, "distance": distance_list[1], "backward": self.get_backward_partial_paths(dstIndex, depth // 2, avoidIndex_set | {srcIndex}), "budget": budget}
+        for nodepath in self.get_joined_paths([srcIndex], query_dict):
+            if budget is not None and not budget.add_path():
+                return
+            yield nodepath
+
+    def get_joined_paths(self, forwardpath, query_dict):
+        "Paths of the bidirectional search whose forward part is forwardpath or one of its extensions, in depth-first order"
+        forwardpathlength = len(forwardpath) - 1
+        middleIndex = forwardpath[-1]
+        joinedpath_iterator_list = []
+        if forwardpathlength == 0: #a path of one edge has no backward part
+            if query_dict["required"] and query_dict["dst"] in self.succ_list[middleIndex]:
+                joinedpath_iterator_list.append([forwardpath + [query_dict["dst"]]])
+        else:
+            for backwardpathlength in (forwardpathlength - 1, forwardpathlength):
+                if backwardpathlength >= 1 and forwardpathlength + backwardpathlength <= query_dict["depth"]:
+                    joinedpath_iterator_list.append(self.join_backward_paths(forwardpath, query_dict["backward"].get((middleIndex, backwardpathlength), ()), query_dict))
+        if forwardpathlength < query_dict["forwardlength"]:
+            joinedpath_iterator_list.append(self.get_extended_joined_paths(forwardpath, query_dict))
+        if len(joinedpath_iterator_list) == 1:
+            yield from joinedpath_iterator_list[0]
+        else:
+            succRank_list = self.get_succ_rank_list()
+            yield from heapq.merge(*joinedpath_iterator_list, key=lambda nodepath: [succRank_list[nodepath[index]][nodepath[index + 1]] for index in range(forwardpathlength, len(nodepath) - 1)]) #the paths share forwardpath, so the hop ranks after it give the depth-first order
+
+    def join_backward_paths(self, forwardpath, backwardpath_list, query_dict):
+        "Joins of forwardpath with the backward partial paths (in depth-first order) of its middle node that share no other node with it"
+        forwardnode_set = set(forwardpath)
+        forwardrequired = query_dict["required"] or not forwardnode_set.isdisjoint(query_dict["require"])
+        for backwardpath, backwardInode_set in backwardpath_list:
+            if forwardnode_set.isdisjoint(backwardInode_set) and (forwardrequired or not backwardInode_set.isdisjoint(query_dict["require"])):
+                yield forwardpath + backwardpath[1:]
+
+    def get_extended_joined_paths(self, forwardpath, query_dict):
+        "get_joined_paths of the one-edge extensions of forwardpath in adjacency order"
+        budget = query_dict["budget"]
+        for succ in self.succ_list[forwardpath[-1]]:
+            if succ == query_dict["dst"] or succ in query_dict["avoid"] or succ in forwardpath:
+                continue
+            if len(forwardpath) + query_dict["distance"][succ] > query_dict["depth"]:
+                continue
+            if budget is not None and (budget.truncated_reason is not None or not budget.expand()):
+                return
+            yield from self.get_joined_paths(forwardpath + [succ], query_dict)
+
+    def get_succ_rank_list(self):
+        "For each node index, {successor index: rank in the adjacency order}; built once per graph"
+        if self.succRank_list is None:
+            self.succRank_list = [{succ: rank for rank, succ in enumerate(succ_dict)} for succ_dict in self.succ_list]
+        return self.succRank_list
+
+    def get_backward_partial_paths(self, dstIndex, maxlength, blockedIndex_set):
+        "Simple partial paths to dst with 1 to maxlength edges per (first node, length), cached per dst"
+        key = (dstIndex, maxlength, frozenset(blockedIndex_set))
+        if key in self.backwardPartial_dict:
+            return self.backwardPartial_dict[key]
+        backwardPartial_dict = {}
+        stack = [[dstIndex]]
+        while stack:
+            reversedpath = stack.pop()
+            for pred in self.pred_list[reversedpath[-1]]:
+                if pred == dstIndex or pred in blockedIndex_set or pred in reversedpath:
+                    continue
+                nextreversedpath = reversedpath + [pred]
+                partialpath = nextreversedpath[::-1]
+                backwardPartial_dict.setdefault((pred, len(partialpath) - 1), []).append((partialpath, frozenset(partialpath[1:-1])))
+                if len(nextreversedpath) - 1 < maxlength:
+                    stack.append(nextreversedpath)
+        succRank_list = self.get_succ_rank_list()
+        for backwardpath_list in backwardPartial_dict.values():
+            backwardpath_list.sort(key=lambda backwardpath: [succRank_list[backwardpath[0][index]][backwardpath[0][index + 1]] for index in range(len(backwardpath[0]) - 1)])
+        self.backwardPartial_dict[key] = backwardPartial_dict
+        return backwardPartial_dict
+
+    def get_index_set(self, nodeIDs, excludeIndices=()):
+        "Indices of the given node IDs that are in the graph, without the excluded indices"
+        index_set = set()
+        if nodeIDs is not None:
+            for nodeID in nodeIDs:
+                index = self.nodeID_index_dict.get(nodeID)
+                if index is not None and index not in excludeIndices:
+                    index_set.add(index)
+        return index_set
+
+    def get_distances_to_target(self, dstIndex, avoidIndex_set=frozenset(), requireIndex_set=frozenset()):
+        "Backward BFS from dst; distance_list[seen][node] is the minimum number of edges from the node to dst"
+        unreached = self.number_of_nodes() + 1
+        distance_list = [[unreached] * self.number_of_nodes(), [unreached] * self.number_of_nodes()]
+        distance_list[1][dstIndex] = 0
+        queue = [(dstIndex, 1)]
+        for node, seen in queue: #the list grows while it is iterated, i.e. a FIFO queue
+            if node != dstIndex and node in avoidIndex_set: #an avoided node cannot be passed
+                continue
+            required = node != dstIndex and node in requireIndex_set
+            if seen == 1 and required:
+                predseen_list = [0, 1]
+            elif seen == 1:
+                predseen_list = [1]
+            elif required: #state (required node, 0) cannot occur
+                predseen_list = []
+            else:
+                predseen_list = [0]
+            for pred in self.pred_list[node]:
+                for predseen in predseen_list:
+                    if distance_list[predseen][pred] == unreached:
+                        distance_list[predseen][pred] = distance_list[seen][node] + 1
+                        queue.append((pred, predseen))
+        return distance_list
+
+    def get_distances_from_source(self, srcIndex):
+        "Forward BFS from src; distance_list[node] is the minimum number of edges from src to the node"
+        unreached = self.number_of_nodes() + 1
+        distance_list = [unreached] * self.number_of_nodes()
+        distance_list[srcIndex] = 0
+        queue = [srcIndex]
+        for node in queue: #the list grows while it is iterated, i.e. a FIFO queue
+            for succ in self.succ_list[node]:
+                if distance_list[succ] == unreached:
+                    distance_list[succ] = distance_list[node] + 1
+                    queue.append(succ)
+        return distance_list
+
+    def get_hop_msgIDs_list(self, nodepath):
+        "For a node path, the list of parallel messages of each hop"
+        return [self.succ_list[nodepath[index]][nodepath[index + 1]] for index in range(len(nodepath) - 1)]
+
+    def count_edge_paths(self, nodepath):
+        "Number of message-level paths represented by a node path (product of the message multiplicities of its hops)"
+        count = 1
+        for msgIDs_list in self.get_hop_msgIDs_list(nodepath):
+            count = count * len(msgIDs_list)
+        return count
+
+    def get_node_path_IDs(self, nodepath):
+        return [self.nodeID_list[nodeIndex] for nodeIndex in nodepath]
+
+    def get_representative_edge_path(self, nodepath):
+        "The first message-level path of a node path (first message of each hop), e.g. to classify a node path by its intermediate nodes"
+        return [(self.nodeID_list[nodepath[index]], self.nodeID_list[nodepath[index + 1]], msgIDs_list[0]) for index, msgIDs_list in enumerate(self.get_hop_msgIDs_list(nodepath))]
+
+    def get_hop_rank_list(self, nodepath):
+        "Position of each hop among the successors of its source node"
+        rank_list = []
+        for index in range(len(nodepath) - 1):
+            rank_list.append(list(self.succ_list[nodepath[index]]).index(nodepath[index + 1]))
+        return rank_list
+
+    def expand_node_path(self, nodepath):
+        "Lazily expand a node path into its message-level paths as (rank key, edge path) in networkx order"
+        hop_list = []
+        for index, msgIDs_list in enumerate(self.get_hop_msgIDs_list(nodepath)):
+            src = self.nodeID_list[nodepath[index]]
+            dst = self.nodeID_list[nodepath[index + 1]]
+            hop_list.append([(position, (src, dst, msgID)) for position, msgID in enumerate(msgIDs_list)])
+        rank_list = self.get_hop_rank_list(nodepath)
+        for combination in itertools.product(*hop_list):
+            rankkey = tuple((rank_list[index], element[0]) for index, element in enumerate(combination))
+            yield rankkey, [element[1] for element in combination]
+
+    def expand_node_paths(self, nodepath_list):
+        "Expand the node paths of one query into their message-level paths in the order of networkx.all_simple_edge_paths"
+        expansion_list = [self.expand_indexed_node_path(nodepathIndex, nodepath) for nodepathIndex, nodepath in enumerate(nodepath_list)]
+        for rankkey, nodepathIndex, edgepath in heapq.merge(*expansion_list, key=lambda element: element[0]):
+            yield nodepathIndex, edgepath
+
+    def expand_indexed_node_path(self, nodepathIndex, nodepath):
+        for rankkey, edgepath in self.expand_node_path(nodepath):
+            yield rankkey, nodepathIndex, edgepath
+
+    def get_endpoint_message_groups(self, nodepath):
+        "Group the message-level paths of a node path by their first and last message, in networkx order"
+        hopmsgIDs_list = self.get_hop_msgIDs_list(nodepath)
+        rank_list = self.get_hop_rank_list(nodepath)
+        nodeID_list = self.get_node_path_IDs(nodepath)
+        if len(hopmsgIDs_list) == 0: #empty path of a query with src == dst
+            yield (), [], 1
+            return
+        middle_count = 1
+        for msgIDs_list in hopmsgIDs_list[1:-1]:
+            middle_count = middle_count * len(msgIDs_list)
+        middle_list = [(nodeID_list[index], nodeID_list[index + 1], hopmsgIDs_list[index][0]) for index in range(1, len(hopmsgIDs_list) - 1)]
+        middlerank_list = [(rank_list[index], 0) for index in range(1, len(hopmsgIDs_list) - 1)]
+        for firstPosition, firstmsgID in enumerate(hopmsgIDs_list[0]):
+            firsthop = (nodeID_list[0], nodeID_list[1], firstmsgID)
+            if len(hopmsgIDs_list) == 1:
+                yield ((rank_list[0], firstPosition),), [firsthop], 1
+                continue
+            for lastPosition, lastmsgID in enumerate(hopmsgIDs_list[-1]):
+                lasthop = (nodeID_list[-2], nodeID_list[-1], lastmsgID)
+                rankkey = tuple([(rank_list[0], firstPosition)] + middlerank_list + [(rank_list[-1], lastPosition)])
+                yield rankkey, [firsthop] + middle_list + [lasthop], middle_count
+
+def create_interaction_graph_from_nx(graph):
+    "Intern the nodes and keyed edges of a networkx (Multi)DiGraph into an InteractionGraph, preserving the iteration order of networkx"
+    IG = InteractionGraph(graph.nodes())
+    if graph.is_multigraph():
+        for src, dst, msgID in graph.edges(keys=True):
+            IG.add_edge(src, dst, msgID)
+    else:
+        for src, dst in graph.edges():
+            IG.add_edge(src, dst, None)
+    return IG
+
+def get_first_message_dict(graph):
+    "Map each ordered pair of distinct nodes joined by an edge to its first message in networkx order"
+    firstmsg_dict = {}
+    if graph.is_multigraph():
+        for src, dst, msgID in graph.edges(keys=True):
+            if src != dst and (src, dst) not in firstmsg_dict:
+                firstmsg_dict[(src, dst)] = msgID
+    else:
+        for src, dst in graph.edges():
+            if src != dst:
+                firstmsg_dict[(src, dst)] = None
+    return firstmsg_dict
+
+class CSRGraph():
+    "Compressed sparse row (CSR) form of a message graph with the edges of each node in networkx order"
+    def __init__(self, interaction_graph):
+        self.nodeID_list = list(interaction_graph.nodeID_list)
+        self.nodeID_index_dict = dict(interaction_graph.nodeID_index_dict)
+        self.msgID_list = [] #msg index -> msg ID
+        msgID_index_dict = {}
+        indptr_list = [0]
+        indices_list = []
+        edgemsg_list = []
+        for succ_dict in interaction_graph.succ_list:
+            for dstIndex, msgIDs_list in succ_dict.items():
+                for msgID in msgIDs_list:
+                    msgIndex = msgID_index_dict.get(msgID)
+                    if msgIndex is None:
+                        msgIndex = len(self.msgID_list)
+                        msgID_index_dict[msgID] = msgIndex
+                        self.msgID_list.append(msgID)
+                    indices_list.append(dstIndex)
+                    edgemsg_list.append(msgIndex)
+            indptr_list.append(len(indices_list))
+        self.indptr = np.array(indptr_list, dtype=np.int64)
+        self.indices = np.array(indices_list, dtype=np.int64)
+        self.edgemsg = np.array(edgemsg_list, dtype=np.int64)
+        self.indptr_list = indptr_list #python list views of the arrays for the search loop, which is faster than indexing numpy arrays element by element
+        self.indices_list = indices_list
+        self.edgeID_list = [] #edge index -> (srcID, dstID, msgID)
+        self.edgeID_index_dict = None #(srcID, dstID, msgID) -> edge index, created on first use by get_edge_index_dict
+        for srcIndex in range(len(self.nodeID_list)):
+            for position in range(indptr_list[srcIndex], indptr_list[srcIndex + 1]):
+                self.edgeID_list.append((self.nodeID_list[srcIndex], self.nodeID_list[indices_list[position]], self.msgID_list[edgemsg_list[position]]))
+
+    def number_of_nodes(self):
+        return len(self.nodeID_list)
+
+    def number_of_edges(self):
+        return len(self.edgeID_list)
+
+    def has_node(self, nodeID):
+        return nodeID in self.nodeID_index_dict
+
+    def get_edgeID(self, edgeIndex):
+        return self.edgeID_list[edgeIndex]
+
+    def get_edge_index_dict(self):
+        "(srcID, dstID, msgID) -> edge index, created on first use"
+        if self.edgeID_index_dict is None:
+            self.edgeID_index_dict = {self.get_edgeID(edgeIndex): edgeIndex for edgeIndex in range(self.number_of_edges())}
+        return self.edgeID_index_dict
+
+    def get_edge_mask(self, edgeIDs):
+        "Boolean mask over the edge indices that is True for the given (srcID, dstID, msgID) edges"
+        edgeID_index_dict = self.get_edge_index_dict()
+        edgemask = np.zeros(self.number_of_edges(), dtype=bool)
+        edgeIndex_list = [edgeID_index_dict[edgeID] for edgeID in edgeIDs if edgeID in edgeID_index_dict]
+        edgemask[edgeIndex_list] = True
+        return edgemask
+
+    def get_shared_arrays(self):
+        "Flat arrays of the graph and its interned ID tables for a SharedArrayStore"
+        nodeID_data, nodeID_offsets = encode_id_table(self.nodeID_list)
+        msgID_data, msgID_offsets = encode_id_table(self.msgID_list)
+        edgesrc = np.repeat(np.arange(self.number_of_nodes(), dtype=np.int64), np.diff(self.indptr))
+        return {"indptr": self.indptr, "indices": self.indices, "edgemsg": self.edgemsg, "edgesrc": edgesrc, "nodeID_data": nodeID_data, "nodeID_offsets": nodeID_offsets, "msgID_data": msgID_data, "msgID_offsets": msgID_offsets}
+
+    def get_hop_distance_matrix(self, batch_size=256):
+        "All-pairs shortest hop distances by batched BFS over the CSR arrays (-1 if not reachable)"
+        node_count = self.number_of_nodes()
+        distance_matrix = np.full((node_count, node_count), -1, dtype=np.int32)
+        edgesrc = np.repeat(np.arange(node_count), np.diff(self.indptr)) #src node index of each edge
+        nodepair_array = np.unique(self.indices * node_count + edgesrc) #one edge per (dst, src) pair, i.e. without parallel messages, sorted by dst
+        sortedsrc = nodepair_array % node_count
+        dst_array, start_array = np.unique(nodepair_array // node_count, return_index=True) #dst nodes with incoming edges and the first of their edges in sortedsrc
+        for first in range(0, node_count, batch_size):
+            source_array = np.arange(first, min(first + batch_size, node_count))
+            frontier = np.zeros((len(source_array), node_count), dtype=bool)
+            frontier[np.arange(len(source_array)), source_array] = True
+            visited = frontier.copy()
+            batch_distance_matrix = distance_matrix[source_array]
+            batch_distance_matrix[frontier] = 0
+            hop = 0
+            while len(dst_array) != 0 and frontier.any():
+                hop = hop + 1
+                reached = np.zeros_like(frontier)
+                reached[:, dst_array] = np.logical_or.reduceat(frontier[:, sortedsrc], start_array, axis=1)
+                frontier = reached & ~visited
+                visited |= frontier
+                batch_distance_matrix[frontier] = hop
+            distance_matrix[source_array] = batch_distance_matrix
+        return distance_matrix
+
+    def get_simple_edge_index_paths(self, src, dst, cutoff=None, edgemask_list=None, budget=None):
+        "Simple paths from src to dst with at most cutoff edges as lists of edge indices, in networkx order"
+        srcIndex = self.nodeID_index_dict.get(src)
+        dstIndex = self.nodeID_index_dict.get(dst)
+        if srcIndex is None or dstIndex is None:
+            return
+        if srcIndex == dstIndex: #like networkx, the empty path
+            if budget is None or budget.add_path():
+                yield []
+            return
+        if cutoff is None or cutoff > self.number_of_nodes() - 1:
+            cutoff = self.number_of_nodes() - 1
+        if cutoff < 1:
+            return
+        indptr_list = self.indptr_list
+        indices_list = self.indices_list
+        visited_bitmap = bytearray(self.number_of_nodes())
+        visited_bitmap[srcIndex] = 1
+        edgepath_list = [] #edge indices of the current path
+        node_stack = [srcIndex]
+        position_stack = [indptr_list[srcIndex]] #next edge position to try per node of the current path
+        while position_stack:
+            node = node_stack[-1]
+            position = position_stack[-1]
+            if position == indptr_list[node + 1]: #all edges of the node tried, backtrack
+                position_stack.pop()
+                node_stack.pop()
+                visited_bitmap[node] = 0
+                if edgepath_list:
+                    edgepath_list.pop()
+                continue
+            position_stack[-1] = position + 1
+            if edgemask_list is not None and not edgemask_list[position]:
+                continue
+            nextIndex = indices_list[position]
+            if visited_bitmap[nextIndex]:
+                continue
+            if nextIndex == dstIndex:
+                if budget is not None and not budget.add_path():
+                    return
+                yield edgepath_list + [position]
+                continue
+            if len(edgepath_list) + 1 < cutoff:
+                if budget is not None and not budget.expand():
+                    return
+                edgepath_list.append(position)
+                visited_bitmap[nextIndex] = 1
+                node_stack.append(nextIndex)
+                position_stack.append(indptr_list[nextIndex])
+
+    def all_simple_edge_paths(self, src, dst, cutoff=None, budget=None):
+        "Same paths as networkx.all_simple_edge_paths on the MultiDiGraph, i.e. lists of (srcID, dstID, msgID)"
+        for edgeIndex_list in self.get_simple_edge_index_paths(src, dst, cutoff, None, budget):
+            yield [self.edgeID_list[edgeIndex] for edgeIndex in edgeIndex_list]
+
+class CSRGraphView():
+    "Edge-masked view of a CSRGraph, e.g. the messages of one feature in the CSR graph of all features"
+    def __init__(self, csr_graph, edgemask):
+        self.csr_graph = csr_graph
+        self.edgemask = edgemask
+        self.edgemask_list = edgemask.tolist() #python list view of the mask for the search loop
+
+    def number_of_edges(self):
+        return int(self.edgemask.sum())
+
+    def has_node(self, nodeID):
+        return self.csr_graph.has_node(nodeID)
+
+    def all_simple_edge_paths(self, src, dst, cutoff=None, budget=None):
+        "Same paths as networkx.all_simple_edge_paths on the edge-filtered view of the MultiDiGraph"
+        get_edgeID = self.csr_graph.get_edgeID
+        for edgeIndex_list in self.csr_graph.get_simple_edge_index_paths(src, dst, cutoff, self.edgemask_list, budget):
+            yield [get_edgeID(edgeIndex) for edgeIndex in edgeIndex_list]
+
+class SharedCSRGraph(CSRGraph):
+    "CSRGraph over the flat arrays of CSRGraph.get_shared_arrays, e.g. attached from shared memory in a worker process"
+    def __init__(self, array_dict):
+        self.nodeID_list = decode_id_table(array_dict["nodeID_data"], array_dict["nodeID_offsets"])
+        self.nodeID_index_dict = {nodeID: nodeIndex for nodeIndex, nodeID in enumerate(self.nodeID_list)}
+        self.msgID_list = decode_id_table(array_dict["msgID_data"], array_dict["msgID_offsets"])
+        self.indptr = array_dict["indptr"]
+        self.indices = array_dict["indices"]
+        self.edgemsg = array_dict["edgemsg"]
+        self.edgesrc = array_dict["edgesrc"]
+        self.indptr_list = memoryview(self.indptr) #zero-copy views for the search loop
+        self.indices_list = memoryview(self.indices)
+        self.edgemsg_list = memoryview(self.edgemsg)
+        self.edgesrc_list = memoryview(self.edgesrc)
+        self.edgeID_list = None
+        self.edgeID_index_dict = None
+
+    def number_of_edges(self):
+        return len(self.indices)
+
+    def get_edgeID(self, edgeIndex):
+        return (self.nodeID_list[self.edgesrc_list[edgeIndex]], self.nodeID_list[self.indices_list[edgeIndex]], self.msgID_list[self.edgemsg_list[edgeIndex]])
+
+    def all_simple_edge_paths(self, src, dst, cutoff=None, budget=None):
+        "Same paths as CSRGraph.all_simple_edge_paths"
+        for edgeIndex_list in self.get_simple_edge_index_paths(src, dst, cutoff, None, budget):
+            yield [self.get_edgeID(edgeIndex) for edgeIndex in edgeIndex_list]
+
+def get_fork_csr_graph(csr_graph):
+    "SharedCSRGraph over the numpy arrays of csr_graph with its edge index built, for workers forked after the model is loaded"
+    fork_csr_graph = SharedCSRGraph(csr_graph.get_shared_arrays())
+    fork_csr_graph.get_edge_index_dict()
+    return fork_csr_graph
+
+def create_csr_graph(nodeIDs, edgeIDs_list):
+    "Create the CSR graph from the nodes and (srcID, dstID, msgID) edges in the order of a networkx MultiDiGraph"
+    return CSRGraph(InteractionGraph(nodeIDs, edgeIDs_list))
+
+def create_csr_graph_from_nx(graph):
+    "Create the CSR graph of a networkx (Multi)DiGraph, preserving the iteration order of networkx"
+    return CSRGraph(create_interaction_graph_from_nx(graph))
+
+def all_simple_edge_paths(graph, source, target, cutoff=None, budget=None):
+    "Message-level simple paths with the CSR engine for a CSRGraph or CSRGraphView and networkx otherwise"
+    if isinstance(graph, (CSRGraph, CSRGraphView)):
+        return graph.all_simple_edge_paths(source, target, cutoff, budget)
+    if budget is not None:
+        return get_nx_simple_edge_paths(graph, source, target, cutoff, budget)
+    import networkx as nx
+    return nx.all_simple_edge_paths(graph, source = source, target = target, cutoff = cutoff)
+
+def get_nx_simple_edge_paths(graph, source, target, cutoff=None, budget=None):
+    "Simple edge paths of a networkx graph in the order of networkx.all_simple_edge_paths, with the budget checked at every expanded node"
+    if source not in graph or target not in graph:
+        return
+    if source == target: #like networkx, the empty path
+        if budget is None or budget.add_path():
+            yield []
+        return
+    if cutoff is None or cutoff > len(graph) - 1:
+        cutoff = len(graph) - 1
+    if cutoff < 1:
+        return
+    if graph.is_multigraph():
+        get_out_edges = lambda node: graph.edges(node, keys=True)
+    else:
+        get_out_edges = lambda node: graph.edges(node)
+    onpath_set = {source}
+    edgepath_list = []
+    stack = [iter(get_out_edges(source))]
+    while stack:
+        edge = next(stack[-1], None)
+        if edge is None:
+            stack.pop()
+            if edgepath_list:
+                onpath_set.discard(edgepath_list.pop()[1])
+            continue
+        nextnode = edge[1]
+        if nextnode in onpath_set:
+            continue
+        if nextnode == target:
+            if budget is not None and not budget.add_path():
+                return
+            yield edgepath_list + [edge]
+            continue
+        if len(edgepath_list) + 1 < cutoff:
+            if budget is not None and not budget.expand():
+                return
+            edgepath_list.append(edge)
+            onpath_set.add(nextnode)
+            stack.append(iter(get_out_edges(nextnode)))
+
+class ReachabilityIndex():
+    "Transitive closure of the condensed strongly connected components (SCC) of an interaction graph as bitsets"
+    def __init__(self, interaction_graph):
+        self.IG = interaction_graph
+        self.succMask_list = [] #bitset of direct successors per node index
+        for succ_dict in self.IG.succ_list:
+            mask = 0
+            for dstIndex in succ_dict:
+                mask |= 1 << dstIndex
+            self.succMask_list.append(mask)
+        self.nodeSCC_list, self.sccNodes_list = self.get_strongly_connected_components()
+        self.sccReach_list = self.get_transitive_closure()
+        self.depthReach_dict = {} #cutoff -> list of bitsets of the nodes reachable within 1..cutoff hops per node index
+
+    def get_strongly_connected_components(self):
+        "Iterative Tarjan; the SCCs are returned in reverse topological order of the condensation (sinks first)"
+        node_count = self.IG.number_of_nodes()
+        nodeSCC_list = [-1] * node_count
+        sccNodes_list = []
+        index_list = [-1] * node_count
+        lowlink_list = [0] * node_count
+        onstack_list = [False] * node_count
+        stack = []
+        counter = 0
+        for root in range(node_count):
+            if index_list[root] != -1:
+                continue
+            work = [(root, iter(self.IG.succ_list[root]))]
+            index_list[root] = lowlink_list[root] = counter
+            counter = counter + 1
+            stack.append(root)
+            onstack_list[root] = True
+            while work:
+                node, succ_iter = work[-1]
+                advanced = False
+                for succ in succ_iter:
+                    if index_list[succ] == -1:
+                        index_list[succ] = lowlink_list[succ] = counter
+                        counter = counter + 1
+                        stack.append(succ)
+                        onstack_list[succ] = True
+                        work.append((succ, iter(self.IG.succ_list[succ])))
+                        advanced = True
+                        break
+                    elif onstack_list[succ]:
+                        lowlink_list[node] = min(lowlink_list[node], index_list[succ])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink_list[parent] = min(lowlink_list[parent], lowlink_list[node])
+                if lowlink_list[node] == index_list[node]: #node is the root of an SCC
+                    sccIndex = len(sccNodes_list)
+                    members_list = []
+                    while True:
+                        member = stack.pop()
+                        onstack_list[member] = False
+                        nodeSCC_list[member] = sccIndex
+                        members_list.append(member)
+                        if member == node:
+                            break
+                    sccNodes_list.append(members_list)
+        return nodeSCC_list, sccNodes_list
+
+    def get_transitive_closure(self):
+        "For each SCC, the bitset of all nodes reachable by a path of at least one edge"
+        sccReach_list = [0] * len(self.sccNodes_list)
+        for sccIndex, members_list in enumerate(self.sccNodes_list): #sinks first, so successor SCCs are always complete
+            reach = 0
+            for node in members_list:
+                reach |= self.succMask_list[node]
+                for succ in self.IG.succ_list[node]:
+                    succSCC = self.nodeSCC_list[succ]
+                    if succSCC != sccIndex:
+                        reach |= sccReach_list[succSCC]
+            sccReach_list[sccIndex] = reach
+        return sccReach_list
+
+    def get_reach_mask(self, nodeIndex, depth=None):
+        "Bitset of the nodes reachable from the node within depth hops (depth None means unbounded)"
+        if depth is None or depth >= self.IG.number_of_nodes() - 1:
+            return self.sccReach_list[self.nodeSCC_list[nodeIndex]]
+        if depth < 1:
+            return 0
+        return self.get_depth_reach_list(depth)[nodeIndex]
+
+    def get_depth_reach_list(self, depth):
+        "Depth-bounded reachability bitsets of the nodes by relaxation up to depth"
+        if depth in self.depthReach_dict:
+            return self.depthReach_dict[depth]
+        reach_list = list(self.succMask_list)
+        for hop in range(1, depth):
+            nextreach_list = []
+            for nodeIndex, succ_dict in enumerate(self.IG.succ_list):
+                reach = self.succMask_list[nodeIndex]
+                for succ in succ_dict:
+                    reach |= reach_list[succ]
+                nextreach_list.append(reach)
+            if nextreach_list == reach_list: #fixpoint, longer cutoffs reach nothing new
+                reach_list = nextreach_list
+                break
+            reach_list = nextreach_list
+        self.depthReach_dict[depth] = reach_list
+        return reach_list
+
+    def get_reach_matrix(self, depth=None):
+        "Boolean matrix (numpy) of the node pairs connected with 1..depth hops (None means unbounded)"
+        node_count = self.IG.number_of_nodes()
+        byte_count = (node_count + 7) // 8
+        reach_matrix = np.zeros((node_count, node_count), dtype=bool)
+        for nodeIndex in range(node_count):
+            mask_array = np.frombuffer(self.get_reach_mask(nodeIndex, depth).to_bytes(byte_count, 'little'), dtype=np.uint8)
+            reach_matrix[nodeIndex] = np.unpackbits(mask_array, bitorder='little')[:node_count].astype(bool)
+        return reach_matrix
+
+    def can_reach(self, src, dst, depth=None):
+        "Check whether a simple path from src to dst with at most depth edges exists"
+        srcIndex = self.IG.nodeID_index_dict.get(src)
+        dstIndex = self.IG.nodeID_index_dict.get(dst)
+        if srcIndex is None or dstIndex is None:
+            return False
+        if srcIndex == dstIndex: #left to the path search, which yields the empty path
+            return True
+        return (self.get_reach_mask(srcIndex, depth) >> dstIndex) & 1 == 1
+
+    def prune_queries(self, query_list, depth=None):
+        "Split the (src, dst) queries into those that can and those that cannot be connected within the cutoff"
+        reachableQuery_list = []
+        prunedQuery_list = []
+        for query in query_list:
+            if self.can_reach(query[0], query[1], depth):
+                reachableQuery_list.append(query)
+            else:
+                prunedQuery_list.append(query)
+        return reachableQuery_list, prunedQuery_list
+
+def get_incidence_matrix(interaction_graph, groupID_list, groupID_nodeIDs_dict):
+    "Boolean incidence matrix (numpy) of groups of nodes, e.g. features and their components, and the nodes of the graph"
+    incidence_matrix = np.zeros((len(groupID_list), interaction_graph.number_of_nodes()), dtype=bool)
+    for groupIndex, groupID in enumerate(groupID_list):
+        for nodeID in groupID_nodeIDs_dict.get(groupID, ()):
+            nodeIndex = interaction_graph.nodeID_index_dict.get(nodeID)
+            if nodeIndex is not None:
+                incidence_matrix[groupIndex, nodeIndex] = True
+    return incidence_matrix
+
+def get_group_reach_matrix(reachability, incidence_matrix, depth=None):
+    "Group x group reachability (e.g. feature x feature) within depth hops, from the incidence and reachability matrices"
+    reach_matrix = reachability.get_reach_matrix(depth)
+    np.fill_diagonal(reach_matrix, False)
+    incidence_count_matrix = incidence_matrix.astype(np.int64)
+    return (incidence_count_matrix @ reach_matrix.astype(np.int64) @ incidence_count_matrix.T) > 0
+
+class PathCounter():
+    "Count-only mode: number of depth-bounded simple message paths of a query, without enumerating the paths"
+    def __init__(self, interaction_graph, reachability=None):
+        self.IG = interaction_graph
+        if reachability is None:
+            reachability = ReachabilityIndex(interaction_graph)
+        self.reachability = reachability
+        self.nodeSCC_list = reachability.nodeSCC_list
+
+    def count_paths_by_length(self, src, dst, depth=None, avoid_set=None, require_set=None):
+        "Number of message paths from src to dst per path length, as {path length: count}"
+        pathlength_count_dict = {}
+        srcIndex = self.IG.nodeID_index_dict.get(src)
+        dstIndex = self.IG.nodeID_index_dict.get(dst)
+        if srcIndex is None or dstIndex is None:
+            return pathlength_count_dict
+        if srcIndex == dstIndex: #like networkx, the empty path
+            if require_set is None:
+                pathlength_count_dict[0] = 1
+            return pathlength_count_dict
+        if depth is None or depth > self.IG.number_of_nodes() - 1:
+            depth = self.IG.number_of_nodes() - 1
+        if not self.reachability.can_reach(src, dst, depth):
+            return pathlength_count_dict
+        avoidIndex_set = self.IG.get_index_set(avoid_set, (srcIndex, dstIndex))
+        requireIndex_set = self.IG.get_index_set(require_set, (srcIndex, dstIndex))
+        if require_set is not None and len(requireIndex_set) == 0:
+            return pathlength_count_dict
+        query_dict = {"dst": dstIndex, "avoid": avoidIndex_set, "require": requireIndex_set, "distance": self.IG.get_distances_to_target(dstIndex, avoidIndex_set, requireIndex_set), "memo": {}}
+        seen = 0 if require_set is not None else 1
+        for pathlength in range(query_dict["distance"][seen][srcIndex], depth + 1):
+            count = self.count_from_node(srcIndex, pathlength, seen, query_dict)
+            if count != 0:
+                pathlength_count_dict[pathlength] = count
+        return pathlength_count_dict
+
+    def count_paths(self, src, dst, depth=None, avoid_set=None, require_set=None):
+        "Total number of message paths from src to dst (see count_paths_by_length)"
+        return sum(self.count_paths_by_length(src, dst, depth, avoid_set, require_set).values())
+
+    def count_from_node(self, nodeIndex, length, seen, query_dict):
+        "Number of message paths with exactly length edges from nodeIndex to dst"
+        memo_dict = query_dict["memo"]
+        key = (nodeIndex, length, seen)
+        if key in memo_dict:
+            return memo_dict[key]
+        stack = [[nodeIndex, length, seen, key, {nodeIndex}, iter(self.IG.succ_list[nodeIndex].items()), 0, None]] #node, length, seen, memo key (None inside an SCC), visited nodes of the SCC, successors, count, pending successor
+        count = 0
+        while stack:
+            frame = stack[-1]
+            nodeIndex, length, seen, key, visited_set, succ_iterator, total, pending = frame
+            if pending is not None: #count of the pending successor
+                total = total + pending[0] * count
+                if pending[2]:
+                    visited_set.discard(pending[1])
+                frame[6], frame[7] = total, None
+            item = next(succ_iterator, None)
+            if item is None:
+                stack.pop()
+                if key is not None:
+                    memo_dict[key] = total
+                count = total
+                continue
+            succ, msgIDs_list = item
+            if succ == query_dict["dst"]:
+                if length == 1 and seen == 1:
+                    frame[6] = total + len(msgIDs_list)
+                continue
+            if length == 1 or succ in visited_set or succ in query_dict["avoid"]:
+                continue
+            succseen = 1 if (seen == 1 or succ in query_dict["require"]) else 0
+            if query_dict["distance"][succseen][succ] > length - 1: #dst cannot be reached with the remaining edges
+                continue
+            if self.nodeSCC_list[succ] == self.nodeSCC_list[nodeIndex]:
+                visited_set.add(succ)
+                frame[7] = (len(msgIDs_list), succ, True)
+                stack.append([succ, length - 1, succseen, None, visited_set, iter(self.IG.succ_list[succ].items()), 0, None])
+                continue
+            succkey = (succ, length - 1, succseen) #the path leaves the SCC and cannot come back
+            if succkey in memo_dict:
+                frame[6] = total + len(msgIDs_list) * memo_dict[succkey]
+                continue
+            frame[7] = (len(msgIDs_list), succ, False)
+            stack.append([succ, length - 1, succseen, succkey, {succ}, iter(self.IG.succ_list[succ].items()), 0, None])
+        return count
+
+class EnumerationBudget():
+    "Budgets of the path enumeration per query and per run: found paths, expanded nodes and seconds (None means no limit)"
+    def __init__(self, max_paths=None, max_expanded_nodes=None, max_seconds=None, run_max_paths=None, run_max_expanded_nodes=None, run_max_seconds=None):
+        self.max_paths = max_paths
+        self.max_expanded_nodes = max_expanded_nodes
+        self.max_seconds = max_seconds
+        self.run_max_paths = run_max_paths
+        self.run_max_expanded_nodes = run_max_expanded_nodes
+        self.run_max_seconds = run_max_seconds
+        self.run_start_time = time.perf_counter()
+        self.run_path_count = 0
+        self.run_expanded_count = 0
+        self.query_count = 0
+        self.truncated_query_list = [] #[{"query", "reason", "paths", "expanded_nodes", "seconds"}]
+        self.query = None
+        self.query_start_time = self.run_start_time
+        self.query_path_count = 0
+        self.query_expanded_count = 0
+        self.truncated_reason = None #budget that truncated the current query
+
+    def get_limit_dict(self):
+        "The budgets as keyword arguments of EnumerationBudget, e.g. to create the budget of a spool worker"
+        return {"max_paths": self.max_paths, "max_expanded_nodes": self.max_expanded_nodes, "max_seconds": self.max_seconds, "run_max_paths": self.run_max_paths, "run_max_expanded_nodes": self.run_max_expanded_nodes, "run_max_seconds": self.run_max_seconds}
+
+    def has_run_budget(self):
+        "True if a budget of the run is set; the run budgets are counted per process, so a parallel run cannot keep them"
+        return self.run_max_paths is not None or self.run_max_expanded_nodes is not None or self.run_max_seconds is not None
+
+    def start_query(self, query):
+        "Start the budgets of a query (e.g. [src, dst]); the run budgets keep counting"
+        self.query = query
+        self.query_start_time = time.perf_counter()
+        self.query_path_count = 0
+        self.query_expanded_count = 0
+        self.truncated_reason = None
+        self.query_count = self.query_count + 1
+
+    def end_query(self):
+        "End the current query; returns the budget that truncated it, None if it was enumerated completely"
+        if self.truncated_reason is not None:
+            self.truncated_query_list.append({"query": self.query, "reason": self.truncated_reason, "paths": self.query_path_count, "expanded_nodes": self.query_expanded_count, "seconds": round(time.perf_counter() - self.query_start_time, 3)})
+        return self.truncated_reason
+
+    def truncate(self, reason):
+        self.truncated_reason = reason
+        return False
+
+    def check_time(self):
+        "False (and the query is truncated) once the time budget of the query or run is over"
+        now = time.perf_counter()
+        if self.max_seconds is not None and now - self.query_start_time > self.max_seconds:
+            return self.truncate("max_seconds")
+        if self.run_max_seconds is not None and now - self.run_start_time > self.run_max_seconds:
+            return self.truncate("run_max_seconds")
+        return True
+
+    def add_path(self):
+        "Count a found path; returns False if the search has to stop"
+        if self.truncated_reason is not None:
+            return False
+        if self.max_paths is not None and self.query_path_count >= self.max_paths:
+            return self.truncate("max_paths")
+        if self.run_max_paths is not None and self.run_path_count >= self.run_max_paths:
+            return self.truncate("run_max_paths")
+        if not self.check_time():
+            return False
+        self.query_path_count = self.query_path_count + 1
+        self.run_path_count = self.run_path_count + 1
+        return True
+
+    def expand(self):
+        "Count an expanded node; returns False if the search has to stop"
+        if self.truncated_reason is not None:
+            return False
+        if self.max_expanded_nodes is not None and self.query_expanded_count >= self.max_expanded_nodes:
+            return self.truncate("max_expanded_nodes")
+        if self.run_max_expanded_nodes is not None and self.run_expanded_count >= self.run_max_expanded_nodes:
+            return self.truncate("run_max_expanded_nodes")
+        if self.query_expanded_count & 255 == 0 and not self.check_time():
+            return False
+        self.query_expanded_count = self.query_expanded_count + 1
+        self.run_expanded_count = self.run_expanded_count + 1
+        return True
+
+    def get_truncated_query_list(self):
+        return list(self.truncated_query_list)
+
+    def get_state(self):
+        "State of the run counts, to compute the update of a worker process of a parallel run with get_update"
+        return (self.query_count, self.run_path_count, self.run_expanded_count, len(self.truncated_query_list))
+
+    def get_update(self, state):
+        "Counts and truncated queries since state, to be merged by merge_update"
+        query_count, run_path_count, run_expanded_count, truncated_count = state
+        return {"queries": self.query_count - query_count, "paths": self.run_path_count - run_path_count, "expanded_nodes": self.run_expanded_count - run_expanded_count, "truncated_queries": self.truncated_query_list[truncated_count:]}
+
+    def merge_update(self, update_dict):
+        "Add the counts and truncated queries of a worker process (see get_update) to the run"
+        self.query_count = self.query_count + update_dict["queries"]
+        self.run_path_count = self.run_path_count + update_dict["paths"]
+        self.run_expanded_count = self.run_expanded_count + update_dict["expanded_nodes"]
+        self.truncated_query_list.extend(update_dict["truncated_queries"])
+
+    def print_report(self, strng="Enumeration budget"):
+        "Print the number of truncated queries and one line per truncated query"
+        print("Debug! " + strng + ": ", len(self.truncated_query_list), " out of ", self.query_count, " queries truncated, paths: ", self.run_path_count, " expanded nodes: ", self.run_expanded_count, " seconds: ", round(time.perf_counter() - self.run_start_time, 3))
+        for truncated_dict in self.truncated_query_list:
+            print("Warning! Truncated query: ", truncated_dict["query"], " budget: ", truncated_dict["reason"], " paths: ", truncated_dict["paths"], " expanded nodes: ", truncated_dict["expanded_nodes"], " seconds: ", truncated_dict["seconds"])
+
+def get_graph_fingerprint(graph):
+    "Content fingerprint (sha1 hex digest) of the nodes and out-edges of a networkx (Multi)DiGraph"
+    sha = hashlib.sha1()
+    for nodeID in sorted(graph.nodes(), key=repr):
+        if graph.is_multigraph():
+            outedge_list = [(dst, msgID) for src, dst, msgID in graph.edges(nodeID, keys=True)]
+        else:
+            outedge_list = list(graph.successors(nodeID))
+        sha.update(repr((nodeID, outedge_list)).encode())
+        sha.update(b"\n")
+    return sha.hexdigest()
+
+def get_ids_fingerprint(IDs):
+    "Fingerprint (sha1 hex digest) of a set of IDs, e.g. the relevant components that a cached query result depends on"
+    return hashlib.sha1(repr(sorted(IDs, key=repr)).encode()).hexdigest()
+
+def get_result_path_count(result):
+    "Number of paths of a cached query result: the length of a list result (e.g. message paths), 0 for a count"
+    return len(result) if isinstance(result, list) else 0
+
+class PathQueryCache():
+    "LRU cache of path query results keyed by (graph fingerprint, src, dst, cutoff, mode), optionally persisted in cache_file"
+    def __init__(self, maxsize=4096, cache_file=None, max_paths=100000):
+        self.maxsize = maxsize #maximum number of cached query results, None for no bound
+        self.max_paths = max_paths #maximum total number of paths in the cached list results, None for no bound; a larger result is not cached
+        self.cache_file = cache_file
+        self.entry_dict = OrderedDict() #key -> result, least recently used first
+        self.path_count = 0 #total number of paths in the cached list results
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if cache_file is not None and os.path.isfile(cache_file):
+            self.load()
+
+    def __len__(self):
+        return len(self.entry_dict)
+
+    def get_or_compute(self, fingerprint, src, dst, cutoff, mode, compute_function):
+        "Return the cached result of the query, or compute it with compute_function (a list, not a generator) and cache it"
+        key = (fingerprint, src, dst, cutoff, mode)
+        if key in self.entry_dict:
+            self.hits = self.hits + 1
+            self.entry_dict.move_to_end(key)
+            return self.entry_dict[key]
+        self.misses = self.misses + 1
+        result = compute_function()
+        self.put(key, result)
+        return result
+
+    def discard(self, fingerprint, src, dst, cutoff, mode):
+        "Remove the entry of a query if it is cached, e.g. a result truncated by an enumeration budget"
+        self.remove((fingerprint, src, dst, cutoff, mode))
+
+    def remove(self, key):
+        if key in self.entry_dict:
+            self.path_count = self.path_count - get_result_path_count(self.entry_dict.pop(key))
+
+    def put(self, key, result):
+        if self.maxsize is not None and self.maxsize <= 0:
+            return
+        self.remove(key)
+        if self.max_paths is not None and get_result_path_count(result) > self.max_paths:
+            return
+        self.entry_dict[key] = result
+        self.path_count = self.path_count + get_result_path_count(result)
+        self.evict()
+
+    def evict(self):
+        "Drop the least recently used entries beyond maxsize or max_paths"
+        while (self.maxsize is not None and len(self.entry_dict) > self.maxsize) or (self.max_paths is not None and self.path_count > self.max_paths):
+            key, result = self.entry_dict.popitem(last=False)
+            self.path_count = self.path_count - get_result_path_count(result)
+            self.evictions = self.evictions + 1
+
+    def get_stats(self):
+        return {"entries": len(self.entry_dict), "paths": self.path_count, "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+    def get_state(self):
+        "State of the cache (counts and keys), to compute the update of a worker process of a parallel run with get_update"
+        return (self.hits, self.misses, set(self.entry_dict))
+
+    def get_update(self, state):
+        "Hits, misses and entries added since state, to be merged by merge_update"
+        hits, misses, key_set = state
+        return {"hits": self.hits - hits, "misses": self.misses - misses, "entries": [(key, result) for key, result in self.entry_dict.items() if key not in key_set]}
+
+    def merge_update(self, update_dict):
+        "Add the entries and counts of a worker process (see get_update) to the cache; the evictions are counted by this cache"
+        for key, result in update_dict["entries"]:
+            self.put(key, result)
+        self.hits = self.hits + update_dict["hits"]
+        self.misses = self.misses + update_dict["misses"]
+
+    def print_stats(self, strng="Path cache"):
+        stats_dict = self.get_stats()
+        print("Debug! " + strng + ": hits: ", stats_dict["hits"], " misses: ", stats_dict["misses"], " evictions: ", stats_dict["evictions"], " entries: ", stats_dict["entries"], " paths: ", stats_dict["paths"])
+
+    def load(self):
+        "Load the entries saved by an earlier run; an unreadable cache file is ignored"
+        try:
+            with open(self.cache_file, 'rb') as f:
+                entry_dict = OrderedDict(pickle.load(f))
+        except Exception as error: #unpickling a damaged or incompatible file can raise almost any exception
+            print("Warning! Path cache file: ", self.cache_file, " could not be read (", error, "), starting with an empty cache")
+            return
+        self.entry_dict = OrderedDict()
+        self.path_count = 0
+        for key, result in entry_dict.items():
+            self.put(key, result)
+        self.evictions = 0
+
+    def save(self):
+        "Save the entries to the cache file (written to a temporary file first, then renamed); missing directories are created"
+        if self.cache_file is None:
+            return
+        cache_dir = os.path.dirname(os.path.abspath(self.cache_file))
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir)
+        tmp_file = self.cache_file + ".tmp"
+        with open(tmp_file, 'wb') as f:
+            pickle.dump(self.entry_dict, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, self.cache_file)
+        print("Path cache written to: ", self.cache_file)
+
+class IncrementalPathIndex():
+    "Results of the path queries of a graph under edits, with the edges used by the paths of each query"
+    def __init__(self, depth=None):
+        self.depth = depth #cutoff of the indexed queries
+        self.query_result_dict = {} #tuple(query) -> result
+        self.query_edge_dict = {} #tuple(query) -> set of edges (src, dst) used by its paths
+        self.edge_query_dict = {} #edge (src, dst) -> set of tuple(query)
+
+    def __len__(self):
+        return len(self.query_result_dict)
+
+    def has_query(self, query):
+        return tuple(query) in self.query_result_dict
+
+    def get_result(self, query):
+        return self.query_result_dict[tuple(query)]
+
+    def get_query_list(self):
+        return list(self.query_result_dict)
+
+    def put(self, query, result, edge_set):
+        "Store the result of a query together with the edges (src, dst) of all paths enumerated for it, replacing an earlier result"
+        self.discard(query)
+        query = tuple(query)
+        self.query_result_dict[query] = result
+        self.query_edge_dict[query] = set(edge_set)
+        for edge in self.query_edge_dict[query]:
+            self.edge_query_dict.setdefault(edge, set()).add(query)
+
+    def discard(self, query):
+        "Remove a query and its edges from the index"
+        query = tuple(query)
+        self.query_result_dict.pop(query, None)
+        for edge in self.query_edge_dict.pop(query, ()):
+            query_set = self.edge_query_dict[edge]
+            query_set.discard(query)
+            if len(query_set) == 0:
+                del self.edge_query_dict[edge]
+
+    def get_deleted_edge_queries(self, deleted_edge_list):
+        "Queries with a path through one of the deleted edges (src, dst, ...); only these lose paths"
+        affected_set = set()
+        for edge in deleted_edge_list:
+            affected_set.update(self.edge_query_dict.get((edge[0], edge[1]), ()))
+        return affected_set
+
+    def get_inserted_edge_queries(self, interaction_graph, inserted_edge_list, query_list):
+        "Queries of query_list that can gain a path through one of the inserted edges within depth"
+        affected_set = set()
+        for edge in set((edge[0], edge[1]) for edge in inserted_edge_list):
+            srcIndex = interaction_graph.nodeID_index_dict.get(edge[0])
+            dstIndex = interaction_graph.nodeID_index_dict.get(edge[1])
+            if srcIndex is None or dstIndex is None:
+                continue
+            unreached = interaction_graph.number_of_nodes() + 1
+            tosrc_distance_list = interaction_graph.get_distances_to_target(srcIndex)[1]
+            fromdst_distance_list = interaction_graph.get_distances_from_source(dstIndex)
+            for query in query_list:
+                queryIndex_list = [interaction_graph.nodeID_index_dict.get(nodeID) for nodeID in query]
+                if None in queryIndex_list:
+                    continue
+                tosrc_distance = tosrc_distance_list[queryIndex_list[0]]
+                fromdst_distance = fromdst_distance_list[queryIndex_list[-1]]
+                if tosrc_distance == unreached or fromdst_distance == unreached:
+                    continue
+                if self.depth is None or tosrc_distance + 1 + fromdst_distance <= self.depth:
+                    affected_set.add(tuple(query))
+        return affected_set
+
+    def get_affected_queries(self, interaction_graph, inserted_edge_list, deleted_edge_list, query_list):
+        "Queries of query_list whose paths may have changed by the edits of interaction_graph, or that are not indexed yet"
+        affected_set = self.get_deleted_edge_queries(deleted_edge_list)
+        affected_set.update(self.get_inserted_edge_queries(interaction_graph, inserted_edge_list, query_list))
+        return [query for query in query_list if tuple(query) in affected_set or not self.has_query(query)]
+
+def split_task_list(task_list, workers, chunks_per_worker=4):
+    "Split task_list into contiguous chunks, about chunks_per_worker per worker"
+    chunk_size = max(1, -(-len(task_list) // (max(1, workers) * chunks_per_worker)))
+    return [task_list[index:index + chunk_size] for index in range(0, len(task_list), chunk_size)]
+
+def init_parallel_worker(worker_function_tuple):
+    "Initializer of the worker processes of iter_parallel_results: keep the task function and the shared arguments"
+    global parallel_worker_function_tuple
+    parallel_worker_function_tuple = worker_function_tuple
+
+def run_parallel_task(task):
+    "Run a task in a worker process of iter_parallel_results; returns its captured console output and its result"
+    task_function, shared_args_tuple = parallel_worker_function_tuple
+    console_output = io.StringIO()
+    with contextlib.redirect_stdout(console_output):
+        result = task_function(*shared_args_tuple, task)
+    return console_output.getvalue(), result
+
+def iter_parallel_results(task_function, task_list, workers, shared_args_tuple=()):
+    "Yield task_function(*shared_args_tuple, task) for each task of task_list in order, computed by a pool of worker processes"
+    start_method = "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+    if start_method == "fork":
+        gc.freeze()
+    try:
+        with multiprocessing.get_context(start_method).Pool(max(1, min(workers, len(task_list))), init_parallel_worker, ((task_function, shared_args_tuple),)) as pool:
+            for console_text, result in pool.imap(run_parallel_task, task_list):
+                sys.stdout.write(console_text)
+                yield result
+    finally:
+        if start_method == "fork":
+            gc.unfreeze()
+
+def encode_id_table(ID_list):
+    "Interned ID table as flat arrays: the UTF-8 bytes of the IDs (uint8) and their offsets (int64)"
+    encodedID_list = [ID.encode() for ID in ID_list]
+    offsets = np.zeros(len(encodedID_list) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(encodedID) for encodedID in encodedID_list])
+    return np.frombuffer(b"".join(encodedID_list), dtype=np.uint8), offsets
+
+def decode_id_table(data, offsets):
+    "ID list of the flat arrays of encode_id_table"
+    data_bytes = data.tobytes()
+    offset_list = offsets.tolist()
+    return [data_bytes[offset_list[index]:offset_list[index + 1]].decode() for index in range(len(offset_list) - 1)]
+
+class SharedArrayStore():
+    "Numpy arrays published in multiprocessing.shared_memory blocks, one block per array"
+    def __init__(self, array_dict):
+        self.shm_list = []
+        self.handle_dict = {}
+        for name, array in array_dict.items():
+            array = np.ascontiguousarray(array)
+            shm = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+            self.shm_list.append(shm)
+            np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)[...] = array
+            self.handle_dict[name] = (shm.name, array.dtype.str, array.shape)
+
+    def get_handle(self):
+        return dict(self.handle_dict)
+
+    def release(self):
+        for shm in self.shm_list:
+            shm.close()
+            shm.unlink()
+        self.shm_list = []
+
+def attach_shared_arrays(handle_dict):
+    "Attach to the arrays of a SharedArrayStore handle; the returned blocks must be kept while the arrays are used"
+    array_dict = {}
+    shm_list = []
+    for name, (shm_name, dtype_str, shape) in handle_dict.items():
+        shm = shared_memory.SharedMemory(name=shm_name)
+        shm_list.append(shm)
+        array_dict[name] = np.ndarray(shape, dtype=np.dtype(dtype_str), buffer=shm.buf)
+    return array_dict, shm_list
+
+attached_shared_graph_dict = {} #handle key -> (SharedCSRGraph, array dict, attached blocks) of the worker process
+
+def get_attached_shared_graph(handle_dict):
+    "SharedCSRGraph and arrays of a handle of iter_shared_graph_results, attached once per worker process"
+    handle_key = handle_dict["indptr"][0]
+    if handle_key not in attached_shared_graph_dict:
+        array_dict, shm_list = attach_shared_arrays(handle_dict)
+        attached_shared_graph_dict.clear() #only the graph of the current pool is used
+        attached_shared_graph_dict[handle_key] = (SharedCSRGraph(array_dict), array_dict, shm_list)
+    return attached_shared_graph_dict[handle_key]
+
+def run_shared_graph_task(task_function, handle_dict, query_type, shared_args_tuple, query_range):
+    "Run a query range of iter_shared_graph_results on the shared graph of the worker process"
+    shared_graph, array_dict, shm_list = get_attached_shared_graph(handle_dict)
+    nodeID_list = shared_graph.nodeID_list
+    queryID_chunk_list = [query_type((nodeID_list[srcIndex], nodeID_list[dstIndex])) for srcIndex, dstIndex in array_dict["queries"][query_range[0]:query_range[1]].tolist()]
+    return task_function(shared_graph, *shared_args_tuple, queryID_chunk_list)
+
+def iter_shared_graph_results(task_function, csr_graph, queryID_list, workers, shared_args_tuple=()):
+    "Like iter_parallel_results over the query chunks, with the graph and the queries published once in shared memory"
+    array_dict = csr_graph.get_shared_arrays()
+    array_dict["queries"] = np.array([[csr_graph.nodeID_index_dict[srcID], csr_graph.nodeID_index_dict[dstID]] for srcID, dstID in queryID_list], dtype=np.int64).reshape(-1, 2)
+    store = SharedArrayStore(array_dict)
+    try:
+        query_range_list = [(index_range.start, index_range.stop) for index_range in split_task_list(range(len(queryID_list)), workers)]
+        for result in iter_parallel_results(run_shared_graph_task, query_range_list, workers, (task_function, store.get_handle(), type(queryID_list[0]) if queryID_list else list, shared_args_tuple)):
+            yield result
+    finally:
+        store.release()
+
+spool_task_dict = {} #task name -> create_task_function(job_config_dict) of the spool jobs, see register_spool_task
+
+def register_spool_task(task_name, create_task_function):
+    "Register the function that creates the task function of a spool job from its plain-data config"
+    spool_task_dict[task_name] = create_task_function
+
+class SpoolUnpickler(pickle.Unpickler):
+    "Unpickler of the spool files that refuses any class or function"
+    def find_class(self, module, name):
+        raise pickle.UnpicklingError("Spool files hold plain data only, refused: {}.{}".format(module, name))
+
+class SpoolWorkQueue():
+    "Work queue of jobs split into units in a spool directory, served by the workers of run_spool_worker"
+    def __init__(self, spool_dir, shard_size=16, local_workers=0, max_attempts=3, claim_timeout=60.0, poll_seconds=0.1):
+        self.spool_dir = spool_dir
+        self.shard_size = max(1, shard_size)
+        self.local_workers = local_workers
+        self.max_attempts = max_attempts
+        self.claim_timeout = claim_timeout
+        self.poll_seconds = poll_seconds
+
+    def get_shard_list(self, task_list):
+        "Contiguous shards of shard_size tasks of task_list; the results of the shards concatenated in order are those of task_list"
+        return [task_list[index:index + self.shard_size] for index in range(0, len(task_list), self.shard_size)]
+
+    def put_unit(self, job_dir, index, task):
+        write_spool_file(os.path.join(job_dir, "units", get_unit_file_name(index)), task)
+
+    def start_local_worker(self, context, job_dir):
+        process = context.Process(target=run_spool_worker, args=(self.spool_dir, None, self.poll_seconds, os.path.basename(job_dir)), daemon=True)
+        process.start()
+        return process
+
+    def iter_results(self, task_name, job_config_dict, task_list):
+        "Yield the result of each task of task_list in order, computed by the workers of the spool"
+        job_dir = os.path.join(self.spool_dir, "job_{}_{}_{}".format(socket.gethostname(), os.getpid(), time.time_ns()))
+        for sub_dir in ["units", "claimed", "results", "errors"]:
+            os.makedirs(os.path.join(job_dir, sub_dir))
+        local_process_list = []
+        try:
+            for index, task in enumerate(task_list):
+                self.put_unit(job_dir, index, task)
+            write_spool_file(os.path.join(job_dir, "job.pkl"), {"task_name": task_name, "config": job_config_dict, "heartbeat_seconds": self.claim_timeout / 4.0}) #last, so that workers only see complete jobs
+            print("Debug! Published ", len(task_list), " work units in the spool: ", job_dir)
+            context = multiprocessing.get_context("fork" if "fork" in multiprocessing.get_all_start_methods() else None)
+            for worker_index in range(self.local_workers):
+                local_process_list.append(self.start_local_worker(context, job_dir))
+            attempt_dict = {} #unit index -> failed attempts
+            lost_since_dict = {} #unit index -> time since which the unit is neither queued, claimed nor done
+            next_index = 0
+            while next_index < len(task_list):
+                result_file = os.path.join(job_dir, "results", get_unit_file_name(next_index))
+                if os.path.exists(result_file):
+                    console_text, result = read_spool_file(result_file)
+                    os.remove(result_file)
+                    sys.stdout.write(console_text)
+                    yield result
+                    next_index = next_index + 1
+                    continue
+                self.check_units(job_dir, next_index, len(task_list), task_list, attempt_dict, lost_since_dict)
+                for worker_index, process in enumerate(local_process_list):
+                    if not process.is_alive(): #its unit is taken over when the claim expires
+                        print("Warning! Local spool worker exited with code ", process.exitcode, ", it is restarted")
+                        process.join()
+                        local_process_list[worker_index] = self.start_local_worker(context, job_dir)
+                time.sleep(self.poll_seconds)
+        finally:
+            shutil.rmtree(job_dir, ignore_errors=True) #local workers exit when their job is removed
+            for process in local_process_list:
+                process.join(self.poll_seconds * 10 + 1)
+                if process.is_alive():
+                    process.terminate()
+                    process.join()
+
+    def check_units(self, job_dir, start_index, unit_count, task_list, attempt_dict, lost_since_dict):
+        "Retry the failed units and put back the units of dead workers (from start_index on, the units before are collected)"
+        now = time.time()
+        queued_set = set(os.listdir(os.path.join(job_dir, "units")))
+        claimed_set = set(os.listdir(os.path.join(job_dir, "claimed")))
+        done_set = set(os.listdir(os.path.join(job_dir, "results")))
+        error_set = set(os.listdir(os.path.join(job_dir, "errors")))
+        for index in range(start_index, unit_count):
+            unit_file_name = get_unit_file_name(index)
+            if unit_file_name in done_set:
+                continue
+            if unit_file_name in error_set:
+                error_file = os.path.join(job_dir, "errors", unit_file_name)
+                error_text = read_spool_file(error_file)
+                attempt_dict[index] = attempt_dict.get(index, 0) + 1
+                if attempt_dict[index] >= self.max_attempts:
+                    raise RuntimeError("Work unit {} failed {} times, last error:\n{}".format(index, attempt_dict[index], error_text))
+                print("Warning! Work unit ", index, " failed (attempt ", attempt_dict[index], " of ", self.max_attempts, "), it is retried")
+                os.remove(error_file)
+                self.put_unit(job_dir, index, task_list[index])
+            elif unit_file_name in claimed_set:
+                try:
+                    claim_age = now - os.path.getmtime(os.path.join(job_dir, "claimed", unit_file_name))
+                except OSError: #finished meanwhile
+                    continue
+                if claim_age > self.claim_timeout:
+                    print("Warning! Claim of work unit ", index, " expired (no heartbeat for ", round(claim_age, 1), " seconds), it is put back into the queue")
+                    try:
+                        os.rename(os.path.join(job_dir, "claimed", unit_file_name), os.path.join(job_dir, "units", unit_file_name))
+                    except OSError:
+                        pass
+            elif unit_file_name in queued_set:
+                lost_since_dict.pop(index, None)
+            elif now - lost_since_dict.setdefault(index, now) > self.claim_timeout: #e.g. released by a worker whose expired claim was taken over
+                lost_since_dict.pop(index)
+                self.put_unit(job_dir, index, task_list[index])
+
+def get_unit_file_name(index):
+    return "{:08d}.pkl".format(index)
+
+def write_spool_file(file_path, data):
+    "Pickle plain data into a file of the spool, written under a temporary name and renamed"
+    data_bytes = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+    SpoolUnpickler(io.BytesIO(data_bytes)).load()
+    temp_file = "{}.{}_{}.tmp".format(file_path, socket.gethostname(), os.getpid())
+    with open(temp_file, "wb") as f:
+        f.write(data_bytes)
+    os.replace(temp_file, file_path)
+
+def read_spool_file(file_path):
+    "Plain data of a file of the spool (see SpoolUnpickler)"
+    with open(file_path, "rb") as f:
+        return SpoolUnpickler(f).load()
+
+def create_spool_task_function(task_name, job_config_dict):
+    if task_name not in spool_task_dict:
+        raise ValueError("Unknown spool task: {}; the worker must import the module that registers it".format(task_name))
+    return spool_task_dict[task_name](job_config_dict)
+
+def keep_claim_alive(claim_file, heartbeat_seconds, stop_event):
+    "Heartbeat of a worker: touch its claim file until stop_event is set, so that the coordinator does not put the unit back"
+    while not stop_event.wait(heartbeat_seconds):
+        try:
+            os.utime(claim_file)
+        except OSError: #the unit was put back or the job removed
+            return
+
+def claim_spool_unit(job_dir):
+    "Claim the first queued unit of a job; returns the unit file name and its claim file, or None if no unit is queued"
+    try:
+        unit_file_name_list = sorted(unit_file_name for unit_file_name in os.listdir(os.path.join(job_dir, "units")) if unit_file_name.endswith(".pkl"))
+    except OSError:
+        return None
+    for unit_file_name in unit_file_name_list:
+        claim_file = os.path.join(job_dir, "claimed", unit_file_name)
+        try:
+            os.rename(os.path.join(job_dir, "units", unit_file_name), claim_file)
+        except OSError: #claimed by another worker
+            continue
+        try:
+            os.utime(claim_file)
+        except OSError:
+            continue
+        return unit_file_name, claim_file
+    return None
+
+def run_spool_unit(job_dir, job_dict, unit_file_name, claim_file):
+    "Run a claimed unit with its console output captured and write its result or traceback"
+    stop_event = threading.Event()
+    heartbeat = threading.Thread(target=keep_claim_alive, args=(claim_file, job_dict["heartbeat_seconds"], stop_event), daemon=True)
+    heartbeat.start()
+    try:
+        if job_dict.get("task_function") is None: #its output is not part of the output of the unit
+            job_dict["task_function"] = create_spool_task_function(job_dict["task_name"], job_dict["config"])
+        task = read_spool_file(claim_file)
+        console_output = io.StringIO()
+        with contextlib.redirect_stdout(console_output):
+            result = job_dict["task_function"](task)
+        write_spool_file(os.path.join(job_dir, "results", unit_file_name), (console_output.getvalue(), result))
+    except Exception:
+        try:
+            write_spool_file(os.path.join(job_dir, "errors", unit_file_name), "{}: {}".format(socket.gethostname(), traceback.format_exc()))
+        except OSError: #the job was removed
+            pass
+    finally:
+        stop_event.set()
+        heartbeat.join()
+        try:
+            os.remove(claim_file)
+        except OSError:
+            pass
+
+def run_spool_worker(spool_dir, idle_seconds=None, poll_seconds=0.5, job_name=None):
+    "Worker of the SpoolWorkQueue jobs in spool_dir; returns after idle_seconds without a unit (None waits forever)"
+    job_dict_cache = {} #job directory -> loaded job file and the task function created from it, once per job
+    skipped_job_set = set() #job directories whose job file could not be read
+    idle_since = time.time()
+    while True:
+        if job_name is not None:
+            if not os.path.exists(os.path.join(spool_dir, job_name)):
+                return
+            job_dir_list = [os.path.join(spool_dir, job_name)]
+        else:
+            job_dir_list = [os.path.join(spool_dir, name) for name in sorted(os.listdir(spool_dir)) if name.startswith("job_")] if os.path.isdir(spool_dir) else []
+        claimed = False
+        for job_dir in job_dir_list:
+            if job_dir in skipped_job_set or not os.path.exists(os.path.join(job_dir, "job.pkl")):
+                continue
+            if job_dir not in job_dict_cache:
+                try:
+                    job_dict = read_spool_file(os.path.join(job_dir, "job.pkl"))
+                except OSError: #the job was removed
+                    continue
+                except Exception as error: #not a job file of a SpoolWorkQueue
+                    print("Warning! Job file of: ", job_dir, " could not be read (", error, "), the job is skipped")
+                    skipped_job_set.add(job_dir)
+                    continue
+                job_dict_cache.clear() #the task functions of earlier jobs are not kept
+                job_dict_cache[job_dir] = job_dict
+            claim = claim_spool_unit(job_dir)
+            if claim is None:
+                continue
+            run_spool_unit(job_dir, job_dict_cache[job_dir], claim[0], claim[1])
+            claimed = True
+            break
+        if claimed:
+            idle_since = time.time()
+        elif idle_seconds is not None and time.time() - idle_since > idle_seconds:
+            return
+        else:
+            time.sleep(poll_seconds)
+
+def write_result_bundle(result_bundle, bundle_file):
+    "Write a result bundle (a JSON-serializable dict) to a file"
+    bundle_dir = os.path.dirname(os.path.abspath(bundle_file))
+    if not os.path.exists(bundle_dir):
+        os.makedirs(bundle_dir)
+    with open(bundle_file, 'w') as f:
+        json.dump(result_bundle, f, indent=2)
+    print("Result bundle written to: ", bundle_file)
+
+def read_result_bundle(bundle_file):
+    "Read a result bundle written by write_result_bundle"
+    with open(bundle_file, 'r') as f:
+        return json.load(f)
+
+def write_interaction_stream(event_iterator, stream_file, header_dict = None):
+    "Write the events of an interaction stream to a file as JSON lines, after the optional header; returns the number of events"
+    stream_dir = os.path.dirname(os.path.abspath(stream_file))
+    if not os.path.exists(stream_dir):
+        os.makedirs(stream_dir)
+    event_count = 0
+    with open(stream_file, 'w') as f:
+        if header_dict is not None:
+            f.write(json.dumps(dict(header_dict, event = "header")) + "\n")
+        for event_dict in event_iterator:
+            f.write(json.dumps(event_dict) + "\n")
+            event_count = event_count + 1
+    print("Interaction stream of ", event_count, " events written to: ", stream_file)
+    return event_count
+
+def read_interaction_stream(stream_file):
+    "Read an interaction stream written by write_interaction_stream one event (dict) at a time"
+    with open(stream_file, 'r') as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
@@ -0,0 +1,206 @@
+# Copyright (c) 2024 Robert Bosch GmbH
+# SPDX-License-Identifier: MIT
+
+import os
+import sys
+import random
+import networkx as nx
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'code'))
+from path_engine import InteractionGraph, ReachabilityIndex, PathCounter, EnumerationBudget, SharedCSRGraph, CSRGraphView, PathQueryCache, IncrementalPathIndex, create_interaction_graph_from_nx, create_csr_graph_from_nx, get_nx_simple_edge_paths, get_first_message_dict
+
+seed_list = range(25) #random message graphs compared with networkx (reference implementation)
+cutoff_list = [None, 1, 2, 3]
+
+def create_random_graph(seed, node_count=7, edge_count=18):
+    "Random MultiDiGraph of components with parallel messages and self messages, like the graph of the sequence diagrams of the features"
+    rnd = random.Random(seed)
+    nodeID_list = ['C{}'.format(index) for index in range(node_count)]
+    graph = nx.MultiDiGraph()
+    graph.add_nodes_from(rnd.sample(nodeID_list, node_count))
+    for index in range(edge_count):
+        graph.add_edges_from([(rnd.choice(nodeID_list), rnd.choice(nodeID_list), 'M{}'.format(index % 5))])
+    return graph
+
+def get_query_list(graph):
+    return [(src, dst) for src in graph.nodes() for dst in graph.nodes() if src != dst]
+
+def get_nx_paths(graph, src, dst, cutoff):
+    return [list(edgepath) for edgepath in nx.all_simple_edge_paths(graph, src, dst, cutoff = cutoff)]
+
+def get_intermediate_set(edgepath):
+    return set(edge[0] for edge in edgepath[1:])
+
+def test_csr_paths_are_networkx_paths():
+    for seed in seed_list:
+        graph = create_random_graph(seed)
+        csr_graph = create_csr_graph_from_nx(graph)
+        shared_csr_graph = SharedCSRGraph(csr_graph.get_shared_arrays())
+        for src, dst in get_query_list(graph):
+            for cutoff in cutoff_list:
+                nx_path_list = get_nx_paths(graph, src, dst, cutoff)
+                assert list(csr_graph.all_simple_edge_paths(src, dst, cutoff)) == nx_path_list
+                assert list(shared_csr_graph.all_simple_edge_paths(src, dst, cutoff)) == nx_path_list
+
+def test_csr_view_paths_are_filtered_networkx_paths():
+    for seed in seed_list:
+        graph = create_random_graph(seed)
+        rnd = random.Random(seed)
+        edge_set = set(edge for edge in graph.edges(keys=True) if rnd.random() < 0.6)
+        graph_view = nx.subgraph_view(graph, filter_edge = lambda src, dst, msgID: (src, dst, msgID) in edge_set)
+        csr_graph = create_csr_graph_from_nx(graph)
+        csr_view = CSRGraphView(csr_graph, csr_graph.get_edge_mask(edge_set))
+        for src, dst in get_query_list(graph):
+            for cutoff in cutoff_list:
+                assert list(csr_view.all_simple_edge_paths(src, dst, cutoff)) == get_nx_paths(graph_view, src, dst, cutoff)
+
+def test_budgeted_networkx_search_without_limit_is_networkx():
+    for seed in seed_list:
+        graph = create_random_graph(seed)
+        budget = EnumerationBudget()
+        for src, dst in get_query_list(graph):
+            for cutoff in cutoff_list:
+                assert [list(edgepath) for edgepath in get_nx_simple_edge_paths(graph, src, dst, cutoff, budget)] == get_nx_paths(graph, src, dst, cutoff)
+
+def test_collapsed_paths_expand_to_networkx_paths():
+    for seed in seed_list:
+        graph = create_random_graph(seed)
+        interaction_graph = create_interaction_graph_from_nx(graph)
+        for src, dst in get_query_list(graph):
+            for cutoff in cutoff_list:
+                nodepath_list = list(interaction_graph.get_simple_node_paths(src, dst, cutoff))
+                assert [edgepath for nodepathIndex, edgepath in interaction_graph.expand_node_paths(nodepath_list)] == get_nx_paths(graph, src, dst, cutoff)
+                assert sum(interaction_graph.count_edge_paths(nodepath) for nodepath in nodepath_list) == len(get_nx_paths(graph, src, dst, cutoff))
+
+def test_bidirectional_node_paths_are_depth_first_node_paths():
+    for seed in seed_list:
+        graph = create_random_graph(seed)
+        interaction_graph = create_interaction_graph_from_nx(graph)
+        relevant_set = set(list(graph.nodes())[:3])
+        for src, dst in get_query_list(graph):
+            for cutoff in cutoff_list:
+                assert list(interaction_graph.get_bidirectional_node_paths(src, dst, cutoff)) == list(interaction_graph.get_simple_node_paths(src, dst, cutoff))
+                assert list(interaction_graph.get_bidirectional_node_paths(src, dst, cutoff, avoid_set = relevant_set)) == list(interaction_graph.get_simple_node_paths(src, dst, cutoff, avoid_set = relevant_set))
+                assert list(interaction_graph.get_bidirectional_node_paths(src, dst, cutoff, require_set = relevant_set)) == list(interaction_graph.get_simple_node_paths(src, dst, cutoff, require_set = relevant_set))
+
+def test_relevance_pruned_paths_are_filtered_networkx_paths():
+    for seed in seed_list:
+        graph = create_random_graph(seed)
+        interaction_graph = create_interaction_graph_from_nx(graph)
+        relevant_set = set(list(graph.nodes())[:3])
+        for src, dst in get_query_list(graph):
+            for cutoff in cutoff_list:
+                nx_path_list = get_nx_paths(graph, src, dst, cutoff)
+                avoid_nodepath_list = list(interaction_graph.get_simple_node_paths(src, dst, cutoff, avoid_set = relevant_set))
+                require_nodepath_list = list(interaction_graph.get_simple_node_paths(src, dst, cutoff, require_set = relevant_set))
+                assert [edgepath for index, edgepath in interaction_graph.expand_node_paths(avoid_nodepath_list)] == [edgepath for edgepath in nx_path_list if len(get_intermediate_set(edgepath) & relevant_set) == 0]
+                assert [edgepath for index, edgepath in interaction_graph.expand_node_paths(require_nodepath_list)] == [edgepath for edgepath in nx_path_list if len(get_intermediate_set(edgepath) & relevant_set) != 0]
+
+def test_path_counts_are_networkx_path_counts():
+    for seed in seed_list:
+        graph = create_random_graph(seed)
+        path_counter = PathCounter(create_interaction_graph_from_nx(graph))
+        relevant_set = set(list(graph.nodes())[:3])
+        for src, dst in get_query_list(graph):
+            for cutoff in cutoff_list:
+                nx_path_list = get_nx_paths(graph, src, dst, cutoff)
+                assert path_counter.count_paths(src, dst, cutoff) == len(nx_path_list)
+                assert path_counter.count_paths(src, dst, cutoff, avoid_set = relevant_set) == len([edgepath for edgepath in nx_path_list if len(get_intermediate_set(edgepath) & relevant_set) == 0])
+                assert path_counter.count_paths(src, dst, cutoff, require_set = relevant_set) == len([edgepath for edgepath in nx_path_list if len(get_intermediate_set(edgepath) & relevant_set) != 0])
+                pathlength_count_dict = {}
+                for edgepath in nx_path_list:
+                    pathlength_count_dict[len(edgepath)] = pathlength_count_dict.get(len(edgepath), 0) + 1
+                assert path_counter.count_paths_by_length(src, dst, cutoff) == pathlength_count_dict
+
+def test_reachability_is_networkx_reachability():
+    for seed in seed_list:
+        graph = create_random_graph(seed)
+        reachability = ReachabilityIndex(create_interaction_graph_from_nx(graph))
+        distance_dict = dict(nx.all_pairs_shortest_path_length(graph))
+        for src, dst in get_query_list(graph):
+            assert reachability.can_reach(src, dst) == nx.has_path(graph, src, dst)
+            for cutoff in cutoff_list[1:]:
+                assert reachability.can_reach(src, dst, cutoff) == (dst in distance_dict[src] and distance_dict[src][dst] <= cutoff)
+        reachable_query_list, pruned_query_list = reachability.prune_queries(get_query_list(graph), 2)
+        assert reachable_query_list == [query for query in get_query_list(graph) if len(get_nx_paths(graph, query[0], query[1], 2)) != 0]
+
+def test_hop_distances_are_networkx_shortest_path_lengths():
+    for seed in seed_list:
+        graph = create_random_graph(seed)
+        csr_graph = create_csr_graph_from_nx(graph)
+        distance_matrix = csr_graph.get_hop_distance_matrix(batch_size = 3)
+        distance_dict = dict(nx.all_pairs_shortest_path_length(graph))
+        for src in graph.nodes():
+            for dst in graph.nodes():
+                assert distance_matrix[csr_graph.nodeID_index_dict[src], csr_graph.nodeID_index_dict[dst]] == distance_dict[src].get(dst, -1)
+
+def test_interaction_graph_keeps_networkx_order():
+    graph = create_random_graph(0)
+    interaction_graph = InteractionGraph(graph.nodes(), graph.edges(keys=True))
+    assert interaction_graph.nodeID_list == list(graph.nodes())
+    assert list(interaction_graph.edges()) == list(graph.edges(keys=True))
+
+def test_path_cache_is_bounded_by_path_count(tmp_path):
+    path_cache = PathQueryCache(maxsize = 10, max_paths = 5)
+    path_cache.put(("fp", "A", "B", None, "edge_paths"), [[1], [2], [3]])
+    path_cache.put(("fp", "A", "C", None, "count"), 7)
+    path_cache.put(("fp", "B", "C", None, "edge_paths"), [[4], [5], [6]])
+    assert list(path_cache.entry_dict) == [("fp", "A", "C", None, "count"), ("fp", "B", "C", None, "edge_paths")]
+    assert path_cache.path_count == 3 and path_cache.evictions == 1
+    path_cache.put(("fp", "C", "A", None, "edge_paths"), [[7]] * 6)
+    assert ("fp", "C", "A", None, "edge_paths") not in path_cache.entry_dict
+    path_cache.discard("fp", "B", "C", None, "edge_paths")
+    assert path_cache.path_count == 0
+    cache_file = tmp_path / "path_cache.pkl"
+    cache_file.write_bytes(b"not a pickle")
+    assert len(PathQueryCache(cache_file = str(cache_file))) == 0
+
+def test_path_counts_of_long_chain_without_cutoff():
+    graph = nx.MultiDiGraph()
+    nodeID_list = ['C{}'.format(index) for index in range(1500)] #longer than the recursion limit
+    graph.add_edges_from([(src, dst, 'M0') for src, dst in zip(nodeID_list, nodeID_list[1:])] + [(nodeID_list[0], nodeID_list[1], 'M1')])
+    path_counter = PathCounter(create_interaction_graph_from_nx(graph))
+    assert path_counter.count_paths_by_length(nodeID_list[0], nodeID_list[-1]) == {len(nodeID_list) - 1: 2}
+
+def test_budgeted_bidirectional_paths_are_budgeted_depth_first_paths():
+    for seed in seed_list:
+        graph = create_random_graph(seed)
+        interaction_graph = create_interaction_graph_from_nx(graph)
+        for src, dst in get_query_list(graph):
+            for max_paths in [1, 3]:
+                nodepath_list_list = []
+                for path_function in [interaction_graph.get_simple_node_paths, interaction_graph.get_bidirectional_node_paths]:
+                    budget = EnumerationBudget(max_paths = max_paths)
+                    budget.start_query((src, dst))
+                    nodepath_list_list.append((list(path_function(src, dst, budget = budget)), budget.end_query()))
+                assert nodepath_list_list[0] == nodepath_list_list[1]
+
+def test_incremental_path_index_keeps_unaffected_queries():
+    for seed in seed_list:
+        graph = create_random_graph(seed)
+        path_index = IncrementalPathIndex(3)
+        for src, dst in get_query_list(graph):
+            nx_path_list = get_nx_paths(graph, src, dst, 3)
+            path_index.put((src, dst), nx_path_list, set((edge[0], edge[1]) for edgepath in nx_path_list for edge in edgepath))
+        rnd = random.Random(seed)
+        deleted_edge_list = rnd.sample(list(graph.edges(keys=True)), 2)
+        graph.remove_edges_from(deleted_edge_list)
+        inserted_edge_list = [(rnd.choice(list(graph.nodes())), rnd.choice(list(graph.nodes())), 'N{}'.format(index)) for index in range(2)]
+        graph.add_edges_from(inserted_edge_list)
+        affected_query_list = path_index.get_affected_queries(create_interaction_graph_from_nx(graph), inserted_edge_list, deleted_edge_list, get_query_list(graph))
+        for src, dst in get_query_list(graph):
+            if (src, dst) not in affected_query_list:
+                assert path_index.get_result((src, dst)) == get_nx_paths(graph, src, dst, 3)
+        path_index.discard(affected_query_list[0])
+        assert not path_index.has_query(affected_query_list[0]) and all(affected_query_list[0] not in query_set for query_set in path_index.edge_query_dict.values())
+
+def test_first_messages_are_networkx_first_paths():
+    for seed in seed_list:
+        graph = create_random_graph(seed)
+        for test_graph in [graph, nx.DiGraph(graph)]:
+            firstmsg_dict = get_first_message_dict(test_graph)
+            nx_firstmsg_dict = {}
+            for src, dst in get_query_list(test_graph):
+                nx_path_list = get_nx_paths(test_graph, src, dst, 1)
+                if len(nx_path_list) != 0:
+                    nx_firstmsg_dict[(src, dst)] = nx_path_list[0][0][2] if test_graph.is_multigraph() else None
+            assert firstmsg_dict == nx_firstmsg_dict
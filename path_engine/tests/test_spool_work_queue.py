@@ -0,0 +1,57 @@
+# Copyright (c) 2024 Robert Bosch GmbH
+# SPDX-License-Identifier: MIT
+
+import os
+import sys
+import pickle
+import collections
+import pytest
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'code'))
+from path_engine import SpoolWorkQueue, register_spool_task, read_spool_file, write_spool_file
+
+task_list = list(range(10)) #shards of 2 tasks, 5 work units
+
+def create_square_task(job_config_dict):
+    "Squares plus the offset of the job; the tasks of fail_list and exit_list fail or kill their worker once"
+    def square_task(shard):
+        for task in shard:
+            flag_file = os.path.join(job_config_dict["flag_dir"], "{}.flag".format(task))
+            if task in job_config_dict["fail_list"] and not os.path.exists(flag_file):
+                open(flag_file, "w").close()
+                raise ValueError("Failed task: {}".format(task))
+            if task in job_config_dict["exit_list"] and not os.path.exists(flag_file):
+                open(flag_file, "w").close()
+                os._exit(1)
+            print("task", task)
+        return [task * task + job_config_dict["offset"] for task in shard]
+    return square_task
+
+register_spool_task("test.square", create_square_task)
+
+def get_results(spool_dir, flag_dir, fail_list = (), exit_list = ()):
+    work_queue = SpoolWorkQueue(str(spool_dir), shard_size = 2, local_workers = 3, claim_timeout = 1.0, poll_seconds = 0.05)
+    job_config_dict = {"offset": 1, "flag_dir": str(flag_dir), "fail_list": list(fail_list), "exit_list": list(exit_list)}
+    return list(work_queue.iter_results("test.square", job_config_dict, work_queue.get_shard_list(task_list)))
+
+def test_spool_results_are_in_order(tmp_path, capsys):
+    assert get_results(tmp_path / "spool", tmp_path) == [[task * task + 1 for task in task_list[index:index + 2]] for index in range(0, len(task_list), 2)]
+    assert capsys.readouterr().out.count("task") == len(task_list) #console output of the units, printed in order
+    assert os.listdir(tmp_path / "spool") == [] #the job is removed
+
+def test_spool_retries_failed_unit(tmp_path, capsys):
+    assert sum(get_results(tmp_path / "spool", tmp_path, fail_list = [3]), []) == [task * task + 1 for task in task_list]
+    assert "Work unit  1  failed (attempt  1  of  3 ), it is retried" in capsys.readouterr().out
+
+def test_spool_requeues_expired_claim(tmp_path, capsys):
+    assert sum(get_results(tmp_path / "spool", tmp_path, exit_list = [6]), []) == [task * task + 1 for task in task_list]
+    console_text = capsys.readouterr().out
+    assert "Claim of work unit  3  expired" in console_text
+    assert "Local spool worker exited with code  1" in console_text
+
+def test_spool_files_hold_plain_data_only(tmp_path):
+    with pytest.raises(pickle.UnpicklingError):
+        write_spool_file(str(tmp_path / "job.pkl"), {"config": collections.OrderedDict()})
+    with open(tmp_path / "job.pkl", "wb") as f:
+        pickle.dump({"task_function": os.system}, f)
+    with pytest.raises(pickle.UnpicklingError):
+        read_spool_file(str(tmp_path / "job.pkl"))
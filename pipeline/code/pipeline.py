@@ -0,0 +1,143 @@
+# Copyright (c) 2024 Robert Bosch GmbH
+# SPDX-License-Identifier: MIT
+
+import os
+import sys
+import time
+import runpy
+from lxml import etree
+from tabulate import tabulate
+dirname = os.path.dirname(__file__)
+sys.path.append(os.path.join(dirname, '..', '..', 'path_engine', 'code'))
+from path_engine import write_result_bundle
+sys.path.append(os.path.join(dirname, '..', '..', 'batch_runner', 'code'))
+from batch_runner import method_module_path_dict, load_method_module, get_model_iterator_function, input_file_count
+
+######################################Configurable inputs#####################################
+model_dir = os.path.join(dirname, '..', 'data') #Specify the directory with the xmi files of the model, named like the 'data' directory of the methods (inputfile1.xml, inputfile2.xml, ...); the files are parsed once for all methods
+model_config_dict = {} #Specify the configurable inputs of the methods for the model, as the "config" of a model in the batch manifest e.g. {"secFeaturePkgID_list": [...], "security_feature_pkg_list": [...], "path_backend": "csr"}; each method module gets the inputs it has
+xifasst_depth_list = [1, 2, 4] #interaction path lengths of the X-I-FASST sweep; the comparison uses 1, 2 and 4
+fiiss_depth_list = [1, None] #interaction path lengths of the FIISS sweep (None stands for no cutoff); the comparison uses 1 and None
+ifasst_depth = 2 #cutoff of the I-FASST analysis
+parallel_workers = None #number of worker processes of each method e.g. os.cpu_count(); None or 1 runs the methods serially
+pipeline_output_dir = os.path.join(dirname, '..', 'build', "pipeline_" + time.strftime("%Y%m%d-%H%M%S")) #directory of the pipeline bundle and the sweep bundles of the methods
+comparison_file = os.path.join(dirname, '..', '..', 'methods_comparison', 'code', 'compareFIISS_XIFASST_Vogelsang.py') #methods comparison run on the pipeline bundle (its compare_methods is called with the bundle); None skips the comparison
+iterator_type = 2 #input file of the model searched for the features (for our case study, it was input xmi file 2)
+##############################################################################################
+
+pipeline_module_path_dict = dict(method_module_path_dict) #the methods of the batch runner and Vogelsang, which is run by the pipeline only
+pipeline_module_path_dict["Vogelsang"] = os.path.join(dirname, '..', '..', 'Vogelsang', 'code', 'Vogelsang.py')
+
+def parse_model(model_dir):
+    "Parse the input files of the model once for all methods"
+    file_path_list = [os.path.join(model_dir, "inputfile{}.xml".format(index + 1)) for index in range(input_file_count)]
+    for file_path in file_path_list:
+        if not os.path.exists(file_path):
+            raise FileNotFoundError("Input file of the model not found: {}".format(file_path))
+    return [etree.parse(file_path).getroot() for file_path in file_path_list]
+
+def load_pipeline_modules(root_list):
+    "Import the method modules, set their configurable inputs of the model and let them search the parsed input files"
+    module_dict = {}
+    sys.path.append(os.path.dirname(pipeline_module_path_dict["Vogelsang"])) #Vogelsang imports its library from its own directory
+    for method in ["X-I-FASST", "I-FASST", "FIISS", "Vogelsang"]:
+        module_dict[method] = load_method_module(method, pipeline_module_path_dict[method])
+    for key, value in model_config_dict.items():
+        if not any(hasattr(module, key) for module in module_dict.values()):
+            raise ValueError("Unknown configurable input of the methods: {}".format(key))
+        for module in module_dict.values():
+            if hasattr(module, key):
+                setattr(module, key, value)
+    if model_config_dict.get("path_cache_file") is not None:
+        file_root, file_ext = os.path.splitext(model_config_dict["path_cache_file"])
+        for module in module_dict.values():
+            if hasattr(module, "path_cache_file"):
+                module.path_cache_file = file_root + "_" + module.__name__ + file_ext
+    for index, root in enumerate(root_list): #FIISS searches its own module globals of the input files
+        setattr(module_dict["FIISS"], "root_inputfile{}".format(index + 1), root)
+    model_iterator_function = get_model_iterator_function(root_list)
+    module_dict["X-I-FASST"].get_iterator = model_iterator_function
+    module_dict["I-FASST"].get_iterator = model_iterator_function
+    return module_dict
+
+def create_shared_graph(module, model_dict):
+    "Multi directed graph of all safety and security features, created once for X-I-FASST, I-FASST and Vogelsang"
+    GINA = module.InteractionAnalysis(**model_dict)
+    nodeIDs_set, nodeID_name_dict, edgeIDs_list, edgeID_name_dict = GINA.get_nodes_edges_of_all_saf_and_sec_features()
+    print("\nDebug! Shared graph! len(nodes): ", len(nodeIDs_set), " and len(edges): ", len(edgeIDs_list), " for all saf & sec features!")
+    return module.create_multidi_graph(nodeIDs_set, edgeIDs_list)
+
+def run_xifasst(module, model_dict, shared_graph, output_dir):
+    "X-I-FASST sweep over xifasst_depth_list on the shared graph"
+    GINA = module.InteractionAnalysis(**model_dict)
+    GINA.shared_graph = shared_graph
+    return GINA.get_interaction_sweep(xifasst_depth_list, os.path.join(output_dir, "XIFASST_sweep.json"), module.collapsed_path_search, module.bidirectional_path_search, module.path_backend, workers = parallel_workers)
+
+def run_ifasst(module, model_dict, shared_graph):
+    "I-FASST analysis with the cutoff ifasst_depth on the shared graph"
+    GINA = module.InteractionAnalysis(**model_dict)
+    GINA.shared_graph = shared_graph
+    primaryFI_list = GINA.get_interaction_list(ifasst_depth, module.collapsed_path_search, module.path_backend, module.PathQueryCache(module.path_cache_size, module.path_cache_file, module.path_cache_max_paths), parallel_workers)
+    return {"method": "I-FASST", "depth": ifasst_depth, "primary_FIs": primaryFI_list}
+
+def run_vogelsang(module, model_dict, shared_graph):
+    "Vogelsang (case 1): feature combinations whose components exchange a message on the shared graph"
+    componentID_name_dict = {}
+    componentID_name_dict.update(model_dict["secComponentID_name_dict"])
+    componentID_name_dict.update(model_dict["safComponentID_name_dict"])
+    module.featurePkgID_name_dict = model_dict["featurePkgID_name_dict"] #names of the feature combinations in the report of Vogelsang
+    EFeD = module.ExtractFeatureDependencies(model_dict["secFeaturePkgID_list"], model_dict["safFeature_pkg_list"], shared_graph, model_dict["secFeID_compID_dict"], model_dict["safFeID_compID_dict"], model_dict["featurePkgID_name_dict"], componentID_name_dict, model_dict["msgID_name_dict"])
+    FIids_list, QueryIDs_list, queryPathsFound_list, feCombIDs_pathsfound_list = EFeD.extractFeatureDependencies()
+    return {"method": "Vogelsang", "FIs": [module.get_listnames_from_listIDs(FI, model_dict["featurePkgID_name_dict"]) for FI in FIids_list]}
+
+def run_fiiss(module, output_dir):
+    "FIISS sweep over fiiss_depth_list; FIISS extracts its own message sequences of each feature"
+    if module.count_only_mode or module.interaction_stream_file is not None:
+        raise ValueError("The pipeline runs the FIISS sweep, count_only_mode and interaction_stream_file of FIISS must not be set")
+    sdA = module.create_sd_analysis(iterator_type)
+    return sdA.sd_analysis_sasefeatures(iterator_type, fiiss_depth_list, os.path.join(output_dir, "FIISS_sweep.json"), path_cache = module.PathQueryCache(module.path_cache_size, module.path_cache_file, module.path_cache_max_paths), budget = module.get_enumeration_budget(), workers = parallel_workers)
+
+def print_pipeline_report(pipeline_bundle):
+    table_list = []
+    for depth_result in pipeline_bundle["X-I-FASST"]["depths"]:
+        table_list.append(["X-I-FASST", depth_result["depth"], len(depth_result["total_FIs"])])
+    table_list.append(["I-FASST (primary)", pipeline_bundle["I-FASST"]["depth"], len(pipeline_bundle["I-FASST"]["primary_FIs"])])
+    for depth_result in pipeline_bundle["FIISS"]["depths"]:
+        table_list.append(["FIISS", "-" if depth_result["depth"] is None else depth_result["depth"], len(depth_result["total_FIs"])])
+    table_list.append(["Vogelsang (case 1)", "-", len(pipeline_bundle["Vogelsang"]["FIs"])])
+    print(tabulate(table_list, headers = ["Method", "Depth", "FIs"]))
+
+def main():
+    start = time.time()
+    if not os.path.exists(pipeline_output_dir):
+        os.makedirs(pipeline_output_dir)
+    print("\nDebug! Parsing the model once for all methods: ", model_dir)
+    module_dict = load_pipeline_modules(parse_model(model_dir))
+
+    print("\nDebug! Extracting the features, lifelines and messages of the model once for X-I-FASST, I-FASST and Vogelsang")
+    model_dict = module_dict["X-I-FASST"].ingest_model(iterator_type, parallel_workers)
+    shared_graph = create_shared_graph(module_dict["X-I-FASST"], model_dict)
+
+    pipeline_bundle = {"model_dir": os.path.abspath(model_dir)}
+    print("\n\n######## X-I-FASST ########")
+    pipeline_bundle["X-I-FASST"] = run_xifasst(module_dict["X-I-FASST"], model_dict, shared_graph, pipeline_output_dir)
+    print("\n\n######## I-FASST ########")
+    pipeline_bundle["I-FASST"] = run_ifasst(module_dict["I-FASST"], model_dict, shared_graph)
+    print("\n\n######## Vogelsang ########")
+    pipeline_bundle["Vogelsang"] = run_vogelsang(module_dict["Vogelsang"], model_dict, shared_graph)
+    print("\n\n######## FIISS ########")
+    pipeline_bundle["FIISS"] = run_fiiss(module_dict["FIISS"], pipeline_output_dir)
+
+    pipeline_bundle_file = os.path.join(pipeline_output_dir, "pipeline_bundle.json")
+    write_result_bundle(pipeline_bundle, pipeline_bundle_file)
+    print("\n")
+    print_pipeline_report(pipeline_bundle)
+    print("\nDebug! Pipeline bundle: ", pipeline_bundle_file)
+
+    if comparison_file is not None:
+        print("\n\n######## Methods comparison ########")
+        runpy.run_path(comparison_file)["compare_methods"](pipeline_bundle_file)
+    print('Time: ', time.time() - start)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+# Copyright (c) 2024 Robert Bosch GmbH
+# SPDX-License-Identifier: MIT
+
+import os
+import sys
+import types
+import pytest
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'code'))
+pipeline = pytest.importorskip("pipeline") #needs lxml
+import batch_runner
+
+fake_method_code = '''
+path_cache_file = None #configurable inputs of the fake method
+path_backend = "networkx"
+get_iterator = None
+'''
+
+@pytest.fixture
+def fake_methods(tmp_path, monkeypatch):
+    "Methods of the pipeline imported from fake modules written into tmp_path; the fake FIISS has its own input"
+    module_path_dict = {}
+    for method in ["X-I-FASST", "I-FASST", "FIISS", "Vogelsang"]:
+        module_file = tmp_path / "fake_{}.py".format(method.replace("-", "_"))
+        module_file.write_text(fake_method_code + ("security_feature_pkg_list = []\n" if method == "FIISS" else ""))
+        module_path_dict[method] = str(module_file)
+    monkeypatch.setattr(pipeline, "pipeline_module_path_dict", module_path_dict)
+    monkeypatch.setattr(batch_runner, "method_module_dict", {})
+    return tmp_path
+
+def test_parse_model_needs_all_input_files(tmp_path):
+    (tmp_path / "inputfile1.xml").write_text("<xmi/>")
+    with pytest.raises(FileNotFoundError):
+        pipeline.parse_model(str(tmp_path))
+
+def test_pipeline_modules_get_the_model_config(fake_methods, monkeypatch):
+    monkeypatch.setattr(pipeline, "model_config_dict", {"path_backend": "csr", "security_feature_pkg_list": ["EAPK_1"], "path_cache_file": str(fake_methods / "cache.pkl")})
+    root_list = ["root{}".format(index + 1) for index in range(batch_runner.input_file_count)]
+    module_dict = pipeline.load_pipeline_modules(root_list)
+    assert [module_dict[method].path_backend for method in ["X-I-FASST", "I-FASST", "FIISS", "Vogelsang"]] == ["csr"] * 4
+    assert module_dict["FIISS"].security_feature_pkg_list == ["EAPK_1"]
+    assert len(set(module.path_cache_file for module in module_dict.values())) == 4 #one cache file per method
+    assert module_dict["FIISS"].root_inputfile7 == "root7"
+    assert module_dict["X-I-FASST"].get_iterator is not None and module_dict["Vogelsang"].get_iterator is None
+    monkeypatch.setattr(pipeline, "model_config_dict", {"unknown_input": 1})
+    with pytest.raises(ValueError):
+        pipeline.load_pipeline_modules(root_list)
+
+class FakeSDAnalysis:
+    def sd_analysis_sasefeatures(self, iterator_type, depth_list = None, bundle_file = None, count_only = False, path_cache = None, budget = None, workers = None):
+        return {"method": "FIISS", "depths": [{"depth": depth, "total_FIs": []} for depth in depth_list], "bundle_file": bundle_file, "count_only": count_only}
+
+def create_fake_fiiss(count_only_mode = False, interaction_stream_file = None):
+    return types.SimpleNamespace(count_only_mode = count_only_mode, interaction_stream_file = interaction_stream_file, path_cache_size = 0, path_cache_file = None, path_cache_max_paths = None, PathQueryCache = lambda *args: None, get_enumeration_budget = lambda: None, create_sd_analysis = lambda iterator_type: FakeSDAnalysis())
+
+def test_fiiss_sweep_of_the_pipeline(tmp_path):
+    result_bundle = pipeline.run_fiiss(create_fake_fiiss(), str(tmp_path))
+    assert [depth_result["depth"] for depth_result in result_bundle["depths"]] == pipeline.fiiss_depth_list
+    assert result_bundle["bundle_file"] == os.path.join(str(tmp_path), "FIISS_sweep.json") and not result_bundle["count_only"]
+    with pytest.raises(ValueError):
+        pipeline.run_fiiss(create_fake_fiiss(count_only_mode = True), str(tmp_path))
+    with pytest.raises(ValueError):
+        pipeline.run_fiiss(create_fake_fiiss(interaction_stream_file = str(tmp_path / "stream.jsonl")), str(tmp_path))